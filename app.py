@@ -4,9 +4,12 @@ Dash App
 
 import dash
 from dash import Dash, html
+from flask import Response
+from prometheus_client import CONTENT_TYPE_LATEST
 
 import config
 from pages.templates.base import build_banner
+from tracker.utils.metrics import render
 
 
 # Create Dash App
@@ -16,6 +19,17 @@ app = Dash(name='Insider Trades Tracker',
 # Define Server
 server = app.server
 
+
+# Define Metrics Scrape Endpoint (Prometheus text format)
+@server.route('/metrics')
+def get_metrics() -> Response:
+    """
+    :return: Metrics of all workers in the Prometheus text exposition format
+    """
+
+    return Response(render(), content_type=CONTENT_TYPE_LATEST)
+
+
 # Define App Title
 app.title = 'Tracker'
 
@@ -1,15 +1,29 @@
 """
 Base URLs File
+
+Set the SEC_BASE_URL and SEC_EFTS_BASE_URL environment variables to point
+the parsers at another server (e.g. scripts/sec_standin.py).
 """
 
+import os
+
+# SEC Website Base URL
+SEC_BASE_URL = os.environ.get('SEC_BASE_URL', r"https://www.sec.gov").rstrip('/')
+
+# Edgar Full Text Search Base URL
+SEC_EFTS_BASE_URL = os.environ.get('SEC_EFTS_BASE_URL', r"https://efts.sec.gov").rstrip('/')
+
 # SEC Latest Filings Page
-SEC_LATEST_FILINGS = r"https://www.sec.gov/cgi-bin/browse-edgar?action=getcurrent&output=atom"
+SEC_LATEST_FILINGS = SEC_BASE_URL + r"/cgi-bin/browse-edgar?action=getcurrent&output=atom"
 
 # Edgar Search Homepage
-SEC_EDGAR = r"https://www.sec.gov/edgar/search/#/"
+SEC_EDGAR = SEC_BASE_URL + r"/edgar/search/#/"
 
 # Edgar Full Text Search POST request URL
-SEC_EDGAR_FTS = r"https://efts.sec.gov/LATEST/search-index"
+SEC_EDGAR_FTS = SEC_EFTS_BASE_URL + r"/LATEST/search-index"
 
 # SEC Filings Data
-SEC_FILING_DATA = r"https://www.sec.gov/Archives/edgar/data/"
+SEC_FILING_DATA = SEC_BASE_URL + r"/Archives/edgar/data/"
+
+# SEC CIK Lookup Data
+SEC_CIK_LOOKUP = SEC_BASE_URL + r"/Archives/edgar/cik-lookup-data.txt"
@@ -2,6 +2,8 @@
 Config File
 """
 
+import os
+
 import yaml
 from defs import PROJECT_PATH
 
@@ -26,9 +28,36 @@ else:
 NAME: str | None = _config_dict['name'] if 'name' in _config_dict else None
 EMAIL: str | None = _config_dict['email'] if 'email' in _config_dict else None
 
+# Parse HTTP connection pool size (connections kept alive per host)
+POOL_SIZE: int = int(_config_dict['pool_size']) if 'pool_size' in _config_dict else 10
+
+# Parse EDGAR Archives disk cache size in MB
+CACHE_SIZE: int = int(_config_dict['cache_size']) if 'cache_size' in _config_dict else 512
+
+
+def _parse_bool(value) -> bool:
+    """
+    Parse a boolean config or environment value
+
+    :param value: YAML boolean or text ('1', 'true', 'yes' are True)
+    :return: Boolean value. Any other value is False.
+    """
+
+    return str(value).strip().lower() in ('1', 'true', 'yes')
+
+
+# Parse cross-process rate limiting (share the SEC budget between gunicorn workers).
+# The SHARED_RATELIMIT environment variable overrides config.yaml.
+SHARED_RATELIMIT: bool = _parse_bool(os.getenv('SHARED_RATELIMIT',
+                                               _config_dict.get('shared_ratelimit', '')))
+
 
 if __name__ == '__main__':
     print('Deployment: ', DEPLOYMENT)
 
     print('Name: ', NAME)
     print('Email: ', EMAIL)
+
+    print('Pool Size: ', POOL_SIZE)
+    print('Cache Size: ', CACHE_SIZE)
+    print('Shared RateLimit: ', SHARED_RATELIMIT)
@@ -0,0 +1,34 @@
+"""
+Gunicorn Config File
+
+Workers share their Prometheus metrics through files in PROMETHEUS_MULTIPROC_DIR,
+so /metrics reports all workers, whichever worker answers the scrape.
+"""
+
+import os
+import shutil
+
+from prometheus_client import multiprocess
+
+from defs import DATA_DIR_PATH
+
+# Metrics directory. Set before the workers are forked, so they inherit it.
+metrics_dir: str = os.environ.setdefault('PROMETHEUS_MULTIPROC_DIR',
+                                         str(DATA_DIR_PATH.joinpath('metrics')))
+
+
+def on_starting(_server) -> None:
+    """
+    Delete the metrics files of the previous run
+    """
+
+    shutil.rmtree(metrics_dir, ignore_errors=True)
+    os.makedirs(metrics_dir, exist_ok=True)
+
+
+def child_exit(_server, worker) -> None:
+    """
+    Drop the live gauges of a dead worker
+    """
+
+    multiprocess.mark_process_dead(worker.pid)
@@ -15,8 +15,7 @@ import pytz
 from dash import html, Input, Output, callback
 from dash.exceptions import PreventUpdate
 
-from tracker.manage import LatestInsiderTrades
-from tracker.parser import SECFilingParser, Form4Parser
+from tracker.manage import LatestInsiderTrades, parse_filing
 
 from pages.templates.tables import build_latest_filings_table
 from pages.templates.sections import build_select_filing_section
@@ -225,11 +224,10 @@ def update_select_filing_section(active_cell):
                                    'Officer Title',
                                    'Other Text']]
 
-        # Replace true/false or 1/0 with Yes/No
-        owner_2_df.replace('true', 'Yes', inplace=True)
-        owner_2_df.replace('false', 'No', inplace=True)
-        owner_2_df.replace('1', 'Yes', inplace=True)
-        owner_2_df.replace('0', 'No', inplace=True)
+        # Replace the relationship flags (bools) with Yes/No
+        flag_fields = ['Director', 'Officer', '10% Owner', 'Other']
+        owner_2_df.loc[flag_fields] = owner_2_df.loc[flag_fields].replace({True: 'Yes',
+                                                                           False: 'No'})
 
         # Reset index to also include index when converting to dict
         owner_1_df.reset_index(inplace=True)
@@ -358,19 +356,42 @@ def get_filings() -> pd.DataFrame:
     return df
 
 
+def format_transactions(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Format the typed transaction columns for the DataTable
+    :param df: Transactions DataFrame (see tracker.parser.form_4.convert_types)
+    :return: Transactions DataFrame with display values
+    """
+
+    for column, dtype in df.dtypes.items():
+        # Dates as YYYY-MM-DD
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+            df[column] = df[column].dt.strftime('%Y-%m-%d')
+        # Flags as Yes/No
+        elif pd.api.types.is_bool_dtype(dtype):
+            df[column] = df[column].map({True: 'Yes', False: 'No'})
+        # Categories as plain values
+        elif isinstance(dtype, pd.CategoricalDtype):
+            df[column] = df[column].astype(object)
+
+    return df
+
+
 def get_filing_info(filing: str, url: str) -> dict:
     """
     Get the Filing Info
     :param filing: Filing Accession Number
     :param url: Filing URL
     """
-    # Get document url from filing
-    filing_parser = SECFilingParser(filing, url)
-    form_url = filing_parser.get_document_url(prefer_xml=True)
+    # Get parsed dataframes from form (cached by accession number)
+    parsed: dict | None = parse_filing(filing, url)
+
+    # Trade data is not available
+    if parsed is None:
+        raise PreventUpdate
 
-    # Get parsed dataframes from form
-    form_parser = Form4Parser(filing, form_url)
-    dfs: dict = form_parser.parse()
+    # Copy the cached dataframes before formatting them in place
+    dfs: dict = {key: df.copy() if df is not None else None for key, df in parsed.items()}
 
     # Format Issuer df
     issuer_df = dfs['issuer']
@@ -425,6 +446,7 @@ def get_filing_info(filing: str, url: str) -> dict:
             "ownershipNature.directOrIndirectOwnership": "directOrIndirectOwnership",
             "ownershipNature.natureOfOwnership": "natureOfOwnership",
         }, inplace=True)
+        non_der_df = format_transactions(non_der_df)
     # Set to None if empty
     else:
         non_der_df = None
@@ -453,6 +475,7 @@ def get_filing_info(filing: str, url: str) -> dict:
             "ownershipNature.directOrIndirectOwnership": "directOrIndirectOwnership",
             "ownershipNature.natureOfOwnership": "natureOfOwnership",
         }, inplace=True)
+        der_df = format_transactions(der_df)
     # Set to None if empty
     else:
         der_df = None
@@ -0,0 +1,117 @@
+"""
+SECFilingsParser Benchmark Script
+
+Compares SECFilingsParser.parse() with the previous per-entry pd.concat implementation
+on 100-entry Atom pages and on the 2000-entry get_filings_until() path (20 pages).
+
+Usage: python -m scripts.benchmark_filings_parser
+"""
+
+import timeit
+from datetime import datetime
+
+import pandas as pd
+
+from tracker.parser.sec_latest_filings_parser import SECFilingsParser
+from tracker.parser.xml_parser import parse_xml
+
+
+def build_feed(start: int, count: int = 100) -> bytes:
+    """
+    Build an SEC latest filings Atom page
+
+    :param start: First filing number
+    :param count: Number of entries
+    :return: Atom feed bytes
+    """
+
+    entries = []
+    for i in range(start, start + count):
+        acc_no = f'0001234567-22-{i:06d}'
+        link = f"https://www.sec.gov/Archives/edgar/data/1234567/" \
+               f"{acc_no.replace('-', '')}/{acc_no}-index.htm"
+        entries.append(
+            f'<entry><title>4 - Filer {i} (0001234567) (Reporting)</title>'
+            f'<link rel="alternate" type="text/html" href="{link}"/>'
+            f'<summary type="html">Filed</summary>'
+            f'<updated>2022-07-01T16:{i // 60 % 60:02d}:{i % 60:02d}-04:00</updated>'
+            f'<category scheme="https://www.sec.gov/" label="form type" term="4"/>'
+            f'<id>urn:tag:sec.gov,2008:accession-number={acc_no}</id></entry>')
+
+    return ('<?xml version="1.0" encoding="ISO-8859-1" ?>'
+            '<feed xmlns="http://www.w3.org/2005/Atom"><title>Latest Filings</title>'
+            + ''.join(entries) + '</feed>').encode('iso-8859-1')
+
+
+def parse_concat(content: bytes) -> pd.DataFrame:
+    """
+    Previous SECFilingsParser.parse() implementation: pd.concat per entry
+
+    :param content: Atom feed bytes
+    :return: Filings DataFrame
+    """
+
+    filings = pd.DataFrame(columns=['acc', 'form_type', 'title', 'date_time', 'link'])
+
+    for entry in parse_xml(content).findall('{http://www.w3.org/2005/Atom}entry'):
+        namespaces = {'atom': 'http://www.w3.org/2005/Atom'}
+        title = entry.xpath('atom:title/text()', namespaces=namespaces)[0]
+        link = entry.xpath('atom:link/@href', namespaces=namespaces)[0]
+        date_time = datetime.strptime(
+            entry.xpath('atom:updated/text()', namespaces=namespaces)[0][:-6],
+            '%Y-%m-%dT%H:%M:%S')
+        form_type = entry.xpath('atom:category/@term', namespaces=namespaces)[0]
+        acc_no = entry.xpath('atom:id/text()', namespaces=namespaces)[0].split('=')[-1]
+
+        filings = pd.concat(
+            [filings, pd.DataFrame({'acc': [acc_no], 'form_type': [form_type], 'title': [title],
+                                    'date_time': [date_time], 'link': [link]})])
+
+    return filings.set_index('acc')
+
+
+def parse_columnar(content: bytes) -> pd.DataFrame:
+    """
+    Current SECFilingsParser.parse() implementation
+
+    :param content: Atom feed bytes
+    :return: Filings DataFrame
+    """
+
+    parser = SECFilingsParser('benchmark', 'http://benchmark')
+    parser.content = content
+
+    return parser.parse(force_refresh=False)
+
+
+def benchmark(name: str, pages: list[bytes], repeat: int) -> None:
+    """
+    Time both implementations on the pages and print the results
+
+    :param name: Benchmark name
+    :param pages: Atom pages parsed per run
+    :param repeat: Number of runs
+    """
+
+    results = {}
+    for func in (parse_concat, parse_columnar):
+        seconds = min(timeit.repeat(lambda f=func: [f(page) for page in pages],
+                                    number=1, repeat=repeat))
+        results[func.__name__] = seconds
+
+    print(f'{name}: concat {results["parse_concat"] * 1000:.1f}ms, '
+          f'columnar {results["parse_columnar"] * 1000:.1f}ms, '
+          f'{results["parse_concat"] / results["parse_columnar"]:.1f}x faster')
+
+
+if __name__ == '__main__':
+    page = build_feed(0)
+    pages_2000 = [build_feed(start) for start in range(0, 2000, 100)]
+
+    # Both implementations give the same filings
+    pd.testing.assert_frame_equal(parse_concat(page).astype({'date_time': 'datetime64[ns]'}),
+                                  parse_columnar(page),
+                                  check_dtype=False, check_index_type=False)
+
+    benchmark('100-entry page', [page], repeat=20)
+    benchmark('2000-entry get_filings_until (20 pages)', pages_2000, repeat=5)
@@ -0,0 +1,171 @@
+"""
+Form4Parser Benchmark Script
+
+Compares the schema-driven transaction flattener (TransactionSchema) with the previous
+per-field XPath implementation on Form 4 filings with 50+ transactions.
+
+Usage: python -m scripts.benchmark_form4_parser
+"""
+
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from tracker.parser.form_4 import derivative_fields, derivative_schema, non_derivative_fields, \
+    non_derivative_schema
+from tracker.parser.xml_parser import parse_xml
+
+
+def build_form4(non_derivative: int, derivative: int) -> bytes:
+    """
+    Build a Form 4 document. Every 5th non-derivative row is a holding.
+
+    :param non_derivative: Number of non-derivative transactions
+    :param derivative: Number of derivative transactions
+    :return: Form 4 XML bytes
+    """
+
+    def _value(tag: str, value: str, footnote: bool = False) -> str:
+        footnote_id = '<footnoteId id="F1"/>' if footnote else ''
+        return f'<{tag}><value>{value}</value>{footnote_id}</{tag}>'
+
+    def _common(i: int) -> str:
+        return (f'<transactionCoding><transactionFormType>4</transactionFormType>'
+                f'<transactionCode>{"SPMAF"[i % 5]}</transactionCode>'
+                f'<equitySwapInvolved>0</equitySwapInvolved></transactionCoding>'
+                f'<transactionTimeliness><value></value></transactionTimeliness>'
+                f'<transactionAmounts>{_value("transactionShares", str(100 + i))}'
+                f'{_value("transactionPricePerShare", f"{10 + i / 100:.2f}", i % 3 == 0)}'
+                f'{_value("transactionAcquiredDisposedCode", "AD"[i % 2])}'
+                f'</transactionAmounts>')
+
+    def _ownership(i: int) -> str:
+        return (f'<postTransactionAmounts>'
+                f'{_value("sharesOwnedFollowingTransaction", str(10000 - i))}'
+                f'</postTransactionAmounts>'
+                f'<ownershipNature>{_value("directOrIndirectOwnership", "DI"[i % 2])}'
+                + (_value('natureOfOwnership', 'By Trust') if i % 2 else '') +
+                '</ownershipNature>')
+
+    rows = []
+    for i in range(non_derivative):
+        if i % 5 == 4:
+            rows.append(f'<nonDerivativeHolding>{_value("securityTitle", "Common Stock")}'
+                        f'{_ownership(i)}</nonDerivativeHolding>')
+        else:
+            rows.append(f'<nonDerivativeTransaction>{_value("securityTitle", "Common Stock")}'
+                        f'{_value("transactionDate", "2022-03-25")}'
+                        f'<deemedExecutionDate></deemedExecutionDate>'
+                        f'{_common(i)}{_ownership(i)}</nonDerivativeTransaction>')
+
+    derivative_rows = []
+    for i in range(derivative):
+        derivative_rows.append(
+            f'<derivativeTransaction>{_value("securityTitle", "Stock Option")}'
+            f'<conversionOrExercisePrice><footnoteId id="F2"/></conversionOrExercisePrice>'
+            f'{_value("transactionDate", "2022-03-25")}{_common(i)}'
+            f'<exerciseDate><footnoteId id="F3"/></exerciseDate>'
+            f'{_value("expirationDate", "2030-03-25")}'
+            f'<underlyingSecurity>{_value("underlyingSecurityTitle", "Common Stock")}'
+            f'{_value("underlyingSecurityShares", str(100 + i))}</underlyingSecurity>'
+            f'{_ownership(i)}</derivativeTransaction>')
+
+    return ('<?xml version="1.0"?><ownershipDocument>'
+            '<issuer><issuerCik>0000019617</issuerCik><issuerName>Issuer</issuerName>'
+            '<issuerTradingSymbol>ISS</issuerTradingSymbol></issuer>'
+            f'<nonDerivativeTable>{"".join(rows)}</nonDerivativeTable>'
+            f'<derivativeTable>{"".join(derivative_rows)}</derivativeTable>'
+            '<footnotes><footnote id="F1">Weighted average price.</footnote></footnotes>'
+            '</ownershipDocument>').encode('utf-8')
+
+
+# pylint: disable=too-many-branches, too-many-nested-blocks
+# Previous implementation kept as is for comparison
+def parse_table_xpath(table, transaction_fields: tuple[str, ...]) -> pd.DataFrame:
+    """
+    Previous Form4Parser._parse_(non_)derivative_table() implementation:
+    XPath queries per field, subfield and 'value' check of every transaction
+
+    :param table: Table XML Element
+    :param transaction_fields: Transaction fields
+    :return: Transactions DataFrame
+    """
+
+    transactions_dict = {}
+    count: int = 1
+
+    for transaction in table.findall('./'):
+        transaction_data = {}
+
+        for field in transaction_fields:
+            sub_fields = [subfield.tag for subfield in transaction.findall(f'./{field}/')]
+
+            if not sub_fields:
+                try:
+                    transaction_data.update({field: transaction.find(f'./{field}').text})
+                except AttributeError:
+                    transaction_data.update({field: np.nan})
+
+            elif 'value' in sub_fields:
+                if len(transaction.findall(f'./{field}/value')) > 0:
+                    transaction_data.update({field: transaction.find(f'./{field}/value').text})
+                else:
+                    transaction_data.update({field: np.nan})
+
+            else:
+                for sub_field in sub_fields:
+                    sub_sub_fields = [ssf.tag
+                                      for ssf in transaction.findall(f'./{field}/{sub_field}/')]
+
+                    if not sub_sub_fields:
+                        try:
+                            ssf_data = transaction.find(f'./{field}/{sub_field}').text
+                            transaction_data.update({f"{field}.{sub_field}": ssf_data})
+                        except AttributeError:
+                            transaction_data.update({f"{field}.{sub_field}": np.nan})
+
+                    elif 'value' in sub_sub_fields:
+                        if len(transaction.findall(f'./{field}/{sub_field}/value')) > 0:
+                            ssf_data = transaction.find(f'./{field}/{sub_field}/value').text
+                            transaction_data.update({f"{field}.{sub_field}": ssf_data})
+                        else:
+                            transaction_data.update({f"{field}.{sub_field}": np.nan})
+
+        transactions_dict.update({count: transaction_data})
+        count += 1
+
+    return pd.DataFrame.from_dict(transactions_dict, orient='index').fillna(value=np.nan)
+
+
+def benchmark(transactions: int, repeat: int = 20) -> None:
+    """
+    Time both implementations on a filing and print the results
+
+    :param transactions: Transactions in each table
+    :param repeat: Number of runs
+    """
+
+    data = parse_xml(build_form4(transactions, transactions))
+    tables = ((data.find('./nonDerivativeTable'), non_derivative_fields, non_derivative_schema),
+              (data.find('./derivativeTable'), derivative_fields, derivative_schema))
+
+    # Both implementations give the same tables
+    for table, fields, schema in tables:
+        pd.testing.assert_frame_equal(parse_table_xpath(table, fields), schema.flatten(table))
+
+    xpath_seconds = min(timeit.repeat(
+        lambda: [parse_table_xpath(table, fields) for table, fields, _ in tables],
+        number=1, repeat=repeat))
+    schema_seconds = min(timeit.repeat(
+        lambda: [schema.flatten(table) for table, _, schema in tables],
+        number=1, repeat=repeat))
+
+    print(f'{transactions} + {transactions} transactions: '
+          f'xpath {xpath_seconds * 1000:.1f}ms, schema {schema_seconds * 1000:.1f}ms, '
+          f'{xpath_seconds / schema_seconds:.1f}x faster')
+
+
+if __name__ == '__main__':
+    for transactions_count in (5, 50, 200):
+        benchmark(transactions_count)
@@ -0,0 +1,322 @@
+"""
+SEC Stand-In Server Script
+
+Local HTTP server that replays recorded SEC responses from disk:
+Atom feed, filing index pages, Form 4 XML, EDGAR FTS JSON and the CIK lookup file.
+
+Usage
+-----
+Record responses once (passes misses through to SEC and saves them):
+    python -m scripts.sec_standin --record
+Replay offline with 50ms latency, 1MB/s bandwidth and 5% injected 429s:
+    python -m scripts.sec_standin --latency 0.05 --bandwidth 1000000 --throttle 0.05
+Point the parsers at it:
+    SEC_BASE_URL=http://127.0.0.1:8010 SEC_EFTS_BASE_URL=http://127.0.0.1:8010 python ...
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from time import sleep
+
+from defs import DATA_DIR_PATH
+
+# Real SEC servers used in record mode
+UPSTREAM_SEC: str = 'https://www.sec.gov'
+UPSTREAM_EFTS: str = 'https://efts.sec.gov'
+
+# Default fixture store directory
+FIXTURES_PATH: Path = DATA_DIR_PATH.joinpath('fixtures')
+
+# Response headers that are replayed
+REPLAY_HEADERS: tuple[str, ...] = ('Content-Type', 'ETag', 'Last-Modified', 'Cache-Control')
+
+
+class FixtureStore:
+    """
+    Recorded responses on disk keyed by request method, path and body.
+
+    Notes
+    -----
+    Each fixture is a <key>.json file (request and response metadata)
+    and a <key>.body file (raw response bytes).
+    """
+
+    def __init__(self, path: Path = FIXTURES_PATH):
+        """
+        FixtureStore Constructor
+
+        :param path: Fixture directory
+        """
+
+        self.path: Path = Path(path)
+
+    @staticmethod
+    def get_key(method: str, path: str, body: bytes = b'') -> str:
+        """
+        :param method: Request method
+        :param path: Request path and query string
+        :param body: Request body (FTS POST payload)
+        :return: Fixture key
+        """
+
+        return hashlib.sha256(f'{method} {path}\n'.encode('utf-8') + body).hexdigest()
+
+    def get(self, method: str, path: str, body: bytes = b'') -> tuple[int, dict, bytes] | None:
+        """
+        Get a recorded response
+
+        :param method: Request method
+        :param path: Request path and query string
+        :param body: Request body
+        :return: (status code, headers, body) or None if not recorded
+        """
+
+        key = self.get_key(method, path, body)
+
+        try:
+            meta = json.loads(self.path.joinpath(key + '.json').read_text(encoding='utf-8'))
+            content = self.path.joinpath(key + '.body').read_bytes()
+        except FileNotFoundError:
+            return None
+
+        return meta['status'], meta['headers'], content
+
+    # pylint: disable=too-many-arguments
+    # Many arguments are required to describe a request and response
+    def put(self,
+            method: str,
+            path: str,
+            body: bytes,
+            status: int,
+            headers: dict,
+            content: bytes) -> None:
+        """
+        Record a response
+
+        :param method: Request method
+        :param path: Request path and query string
+        :param body: Request body
+        :param status: Response status code
+        :param headers: Response headers
+        :param content: Response body
+        """
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        key = self.get_key(method, path, body)
+
+        meta = {
+            'method': method,
+            'path': path,
+            'body': body.decode('utf-8', errors='replace'),
+            'status': status,
+            'headers': {k: v for k, v in headers.items() if k in REPLAY_HEADERS},
+        }
+
+        # Write the body before the metadata so a fixture is never half recorded
+        for suffix, data in (('.body', content),
+                             ('.json', json.dumps(meta, indent=2).encode('utf-8'))):
+            with tempfile.NamedTemporaryFile(dir=self.path, delete=False) as file:
+                file.write(data)
+            os.replace(file.name, self.path.joinpath(key + suffix))
+
+
+class StandinServer(ThreadingHTTPServer):
+    """
+    SEC Stand-In HTTP Server
+    """
+
+    daemon_threads = True
+
+    # pylint: disable=too-many-arguments
+    # Many arguments are required for modularity
+    def __init__(self,
+                 address: tuple[str, int] = ('127.0.0.1', 8010),
+                 store: FixtureStore | None = None,
+                 latency: float = 0,
+                 bandwidth: float | None = None,
+                 throttle: float = 0,
+                 record: bool = False,
+                 seed: int | None = 0):
+        """
+        SEC Stand-In Server Constructor
+
+        :param address: (host, port). Port 0 picks a free port.
+        :param store: Fixture store
+        :param latency: Seconds to wait before responding
+        :param bandwidth: Bytes per second to send the body at. None is unlimited.
+        :param throttle: Fraction of requests answered with 429 Too Many Requests
+        :param record: Pass unrecorded requests through to SEC and record the responses
+        :param seed: Random seed for the throttled requests (repeatable runs)
+        """
+
+        super().__init__(address, StandinHandler)
+
+        self.store: FixtureStore = store if store is not None else FixtureStore()
+        self.latency: float = latency
+        self.bandwidth: float | None = bandwidth
+        self.throttle: float = throttle
+        self.record: bool = record
+
+        self.random: random.Random = random.Random(seed)
+        self.lock: threading.Lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        """
+        :return: Server base URL
+        """
+
+        return f'http://{self.server_address[0]}:{self.server_address[1]}'
+
+    def is_throttled(self) -> bool:
+        """
+        :return: True if the next request should be answered with 429
+        """
+
+        with self.lock:
+            return self.random.random() < self.throttle
+
+    def start(self) -> threading.Thread:
+        """
+        Serve in a background thread. Stop with shutdown() and server_close().
+
+        :return: Server thread
+        """
+
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+
+        return thread
+
+    @staticmethod
+    def fetch(method: str, path: str, body: bytes) -> tuple[int, dict, bytes]:
+        """
+        Get the response from SEC
+
+        :param method: Request method
+        :param path: Request path and query string
+        :param body: Request body
+        :return: (status code, headers, body)
+        """
+
+        # pylint: disable=import-outside-toplevel
+        # Only record mode needs the SEC session
+        from tracker.parser.session import get_sec_headers, get_session
+
+        upstream = UPSTREAM_EFTS if path.startswith('/LATEST/') else UPSTREAM_SEC
+        response = get_session().request(method, upstream + path, data=body or None,
+                                         headers=get_sec_headers(
+                                             {'Content-Type': 'application/json'}
+                                             if body else None))
+
+        return response.status_code, dict(response.headers), response.content
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    """
+    SEC Stand-In Request Handler
+    """
+
+    server: StandinServer
+
+    def _respond(self):
+        """
+        Replay (or record) the response of the request
+        """
+
+        length = int(self.headers.get('Content-Length', 0))
+        body = self.rfile.read(length) if length else b''
+
+        if self.server.latency:
+            sleep(self.server.latency)
+
+        if self.server.is_throttled():
+            self._send(429, {'Content-Type': 'text/plain', 'Retry-After': '1'},
+                       b'Too Many Requests')
+            return
+
+        fixture = self.server.store.get(self.command, self.path, body)
+
+        if fixture is None and self.server.record:
+            fixture = self.server.fetch(self.command, self.path, body)
+            if fixture[0] == 200:
+                self.server.store.put(self.command, self.path, body, *fixture)
+
+        if fixture is None:
+            self._send(404, {'Content-Type': 'text/plain'}, b'Fixture not recorded')
+            return
+
+        status, headers, content = fixture
+
+        # Recorded links point at SEC. Point them at the stand-in instead.
+        content = content.replace(UPSTREAM_SEC.encode('utf-8'), self.server.url.encode('utf-8'))
+
+        self._send(status, headers, content)
+
+    def _send(self, status: int, headers: dict, content: bytes):
+        """
+        Send the response, throttled to the server bandwidth
+
+        :param status: Status code
+        :param headers: Response headers
+        :param content: Response body
+        """
+
+        self.send_response(status)
+        for key, value in headers.items():
+            if key in REPLAY_HEADERS or key == 'Retry-After':
+                self.send_header(key, value)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+
+        if not self.server.bandwidth:
+            self.wfile.write(content)
+            return
+
+        chunk_size = 16 * 1024
+        for i in range(0, len(content), chunk_size):
+            chunk = content[i:i + chunk_size]
+            self.wfile.write(chunk)
+            sleep(len(chunk) / self.server.bandwidth)
+
+    do_GET = _respond  # pylint: disable=invalid-name
+    do_POST = _respond  # pylint: disable=invalid-name
+
+    def log_message(self, *args):
+        pass
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser(description='SEC Stand-In Server')
+    arg_parser.add_argument('--host', default='127.0.0.1')
+    arg_parser.add_argument('--port', type=int, default=8010)
+    arg_parser.add_argument('--fixtures', type=Path, default=FIXTURES_PATH)
+    arg_parser.add_argument('--latency', type=float, default=0, help='Seconds per response')
+    arg_parser.add_argument('--bandwidth', type=float, default=None, help='Bytes per second')
+    arg_parser.add_argument('--throttle', type=float, default=0, help='Fraction of 429s')
+    arg_parser.add_argument('--record', action='store_true', help='Record misses from SEC')
+    arg_parser.add_argument('--seed', type=int, default=0)
+    cli_args = arg_parser.parse_args()
+
+    standin = StandinServer((cli_args.host, cli_args.port),
+                            store=FixtureStore(cli_args.fixtures),
+                            latency=cli_args.latency,
+                            bandwidth=cli_args.bandwidth,
+                            throttle=cli_args.throttle,
+                            record=cli_args.record,
+                            seed=cli_args.seed)
+
+    print(f'SEC stand-in serving {cli_args.fixtures} at {standin.url}')
+    print(f'Set SEC_BASE_URL={standin.url} and SEC_EFTS_BASE_URL={standin.url}')
+
+    try:
+        standin.serve_forever()
+    except KeyboardInterrupt:
+        standin.server_close()
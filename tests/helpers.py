@@ -0,0 +1,119 @@
+"""
+Test Helpers
+Local HTTP server and SEC document builders for offline tests.
+"""
+
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Iterator
+
+from tracker.parser.sec import SEC_RATE, sec_bucket
+
+# Test data directory
+DATA_PATH: Path = Path(__file__).parent.joinpath('data')
+
+# Response: (status code, headers, body)
+Response = tuple[int, dict, bytes]
+
+
+@contextmanager
+def local_server(route: Callable[[BaseHTTPRequestHandler], Response]) -> Iterator[str]:
+    """
+    Run a local HTTP server in a background thread
+
+    :param route: Function that takes the request handler and returns the response
+    :return: Server base URL (http://127.0.0.1:<port>)
+    """
+
+    class _Handler(BaseHTTPRequestHandler):
+        def _respond(self):
+            status, headers, body = route(self)
+            self.send_response(status)
+            for key, value in headers.items():
+                self.send_header(key, value)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        do_GET = _respond  # pylint: disable=invalid-name
+        do_POST = _respond  # pylint: disable=invalid-name
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    try:
+        yield f'http://127.0.0.1:{server.server_port}'
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def build_atom_feed(accession_numbers: list[str], form_type: str = '4') -> bytes:
+    """
+    Build an SEC latest filings Atom feed.
+    Each filing has a (Reporting) and an (Issuer) entry like the SEC feed.
+
+    :param accession_numbers: Accession numbers, newest first
+    :param form_type: Form type of all entries
+    :return: Atom feed bytes
+    """
+
+    entries = []
+    for i, acc_no in enumerate(accession_numbers):
+        cik = acc_no.split('-')[0]
+        link = f"https://www.sec.gov/Archives/edgar/data/{int(cik)}/" \
+               f"{acc_no.replace('-', '')}/{acc_no}-index.htm"
+        minute, second = divmod(59 * 60 - i, 60)
+
+        for role in ('Reporting', 'Issuer'):
+            entries.append(
+                f'<entry>'
+                f'<title>{form_type} - Filer {i} ({cik}) ({role})</title>'
+                f'<link rel="alternate" type="text/html" href="{link}"/>'
+                f'<summary type="html">Filed</summary>'
+                f'<updated>2022-07-01T16:{minute:02d}:{second:02d}-04:00</updated>'
+                f'<category scheme="https://www.sec.gov/" label="form type" term="{form_type}"/>'
+                f'<id>urn:tag:sec.gov,2008:accession-number={acc_no}</id>'
+                f'</entry>')
+
+    return ('<?xml version="1.0" encoding="ISO-8859-1" ?>'
+            '<feed xmlns="http://www.w3.org/2005/Atom">'
+            '<title>Latest Filings</title>'
+            + ''.join(entries) +
+            '</feed>').encode('iso-8859-1')
+
+
+def accession_number(i: int) -> str:
+    """
+    Build a test accession number
+
+    :param i: Sequence number
+    :return: Accession number (##########-##-######)
+    """
+
+    return f'0001234567-22-{i:06d}'
+
+
+def load_fixture(name: str) -> bytes:
+    """
+    Load a test data file
+
+    :param name: File name in tests/data
+    :return: File bytes
+    """
+
+    return DATA_PATH.joinpath(name).read_bytes()
+
+
+def reset_sec_rate() -> None:
+    """
+    Restore the SEC bucket rate and clear the AdaptiveRate (sec_adaptive) cooldown,
+    so throttled responses in one test do not slow down the others
+    """
+
+    sec_bucket.adjust_rate(lambda *_: (SEC_RATE, 0))
@@ -42,9 +42,11 @@ class TestBasicInsiderTrades(unittest.TestCase):
         parsed = manager.parse_filings(filings.head(5))
 
         self.assertIsNotNone(parsed)
-        self.assertEqual(parsed.shape, (5, 4))
-        self.assertEqual(parsed.columns.tolist(),
-                         ['issuer', 'owner', 'non_derivative', 'derivative'])
+        self.assertEqual(parsed.shape, (5, 3))
+        self.assertEqual(parsed.columns.tolist(), ['issuer', 'owner', 'non_derivative'])
+
+        parsed = manager.parse_filings(filings.head(5), sections=['issuer', 'derivative'])
+        self.assertEqual(parsed.columns.tolist(), ['issuer', 'derivative'])
 
 
 if __name__ == '__main__':
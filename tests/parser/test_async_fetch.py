@@ -0,0 +1,114 @@
+"""
+Test Async Fetch API
+"""
+
+import asyncio
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import sleep, time
+
+from tests.helpers import reset_sec_rate
+from tracker.parser import SECParser
+from tracker.parser.sec import fetch_many, gather_bounded
+
+# Server response delay in seconds
+DELAY: float = 0.2
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """
+    Echo the request path after a short delay
+    """
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """
+        Handle GET request
+        """
+
+        sleep(DELAY)
+        body = self.path.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        """
+        Silence request logging
+        """
+
+
+class AsyncFetchTests(unittest.TestCase):
+    """
+    Test SECParser.aget_webpage(), fetch_many() and gather_bounded()
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        cls.base_url = f'http://127.0.0.1:{cls.server.server_port}'
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        reset_sec_rate()
+
+    def test_aget_webpage(self):
+        """
+        Test aget_webpage() method
+        """
+
+        parser = SECParser('Async', f'{self.base_url}/doc')
+        webpage = asyncio.run(parser.aget_webpage())
+
+        self.assertEqual(webpage, '/doc')
+        self.assertEqual(parser.webpage, '/doc')
+        self.assertEqual(parser.response.status_code, 200)
+
+    def test_fetch_many(self):
+        """
+        Test fetch_many() runs requests concurrently and keeps order
+        """
+
+        urls = [f'{self.base_url}/{i}' for i in range(8)]
+
+        start_time = time()
+        webpages = asyncio.run(fetch_many(urls, max_in_flight=8))
+        end_time = time()
+
+        self.assertListEqual(webpages, [f'/{i}' for i in range(8)])
+
+        # 8 requests at DELAY each run concurrently => under the serial time.
+        # The shared SEC bucket (9/s) alone spaces them over ~0.8s, so do not compare to 1s.
+        self.assertLess(end_time - start_time, 8 * DELAY)
+
+    def test_gather_bounded(self):
+        """
+        Test gather_bounded() limits the number of awaitables in flight
+        """
+
+        in_flight = 0
+        max_seen = 0
+
+        async def __task(i: int) -> int:
+            nonlocal in_flight, max_seen
+            in_flight += 1
+            max_seen = max(max_seen, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return i
+
+        results = asyncio.run(gather_bounded([__task(i) for i in range(20)], max_in_flight=3))
+
+        self.assertListEqual(results, list(range(20)))
+        self.assertEqual(max_seen, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+"""
+Test SECFilingsParser Conditional GET
+"""
+
+import unittest
+
+from tests.helpers import local_server, build_atom_feed, accession_number
+from tracker.parser import SECFilingsParser
+
+
+class ConditionalGetTests(unittest.TestCase):
+    """
+    Test SECFilingsParser conditional GET and cached filings
+    """
+
+    def test_not_modified(self):
+        """
+        Test 304 Not Modified returns the cached filings
+        """
+
+        feed = build_atom_feed([accession_number(i) for i in range(3)])
+        requests_headers = []
+
+        def route(handler):
+            requests_headers.append(dict(handler.headers))
+            if handler.headers.get('If-None-Match') == '"v1"':
+                return 304, {'ETag': '"v1"'}, b''
+            return 200, {'Content-Type': 'application/atom+xml', 'ETag': '"v1"',
+                         'Last-Modified': 'Fri, 01 Jul 2022 20:00:00 GMT'}, feed
+
+        with local_server(route) as url:
+            parser = SECFilingsParser('Conditional', url)
+
+            filings = parser.parse()
+            self.assertFalse(parser.not_modified)
+            self.assertEqual(filings.shape[0], 6)
+            self.assertNotIn('If-None-Match', requests_headers[0])
+
+            cached = parser.parse()
+            self.assertTrue(parser.not_modified)
+            self.assertIs(cached, filings)
+            self.assertEqual(requests_headers[1]['If-None-Match'], '"v1"')
+            self.assertEqual(requests_headers[1]['If-Modified-Since'],
+                             'Fri, 01 Jul 2022 20:00:00 GMT')
+
+    def test_same_body(self):
+        """
+        Test an identical body without validators returns the cached filings
+        """
+
+        feeds = [build_atom_feed([accession_number(i) for i in range(3)])] * 2 + \
+                [build_atom_feed([accession_number(i) for i in range(1, 5)])]
+
+        def route(_):
+            return 200, {'Content-Type': 'application/atom+xml'}, feeds.pop(0)
+
+        with local_server(route) as url:
+            parser = SECFilingsParser('Conditional', url)
+
+            filings = parser.parse()
+            self.assertIs(parser.parse(), filings)
+            self.assertTrue(parser.not_modified)
+
+            # Changed body is parsed again
+            updated = parser.parse()
+            self.assertFalse(parser.not_modified)
+            self.assertEqual(updated.shape[0], 8)
+
+    def test_set_url(self):
+        """
+        Test set_url() resets the validators
+        """
+
+        parser = SECFilingsParser('Conditional', 'http://127.0.0.1/a')
+        parser.etag = '"v1"'
+        parser.digest = 'digest'
+
+        parser.set_url('http://127.0.0.1/b')
+        self.assertIsNone(parser.etag)
+        self.assertIsNone(parser.digest)
+
+
+if __name__ == '__main__':
+    unittest.main()
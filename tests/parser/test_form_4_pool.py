@@ -0,0 +1,77 @@
+"""
+Test Form 4 Process Pool Parsing Stage
+"""
+
+import unittest
+
+import pandas as pd
+
+from tests.helpers import load_fixture
+from tracker.parser import Form4Parser
+from tracker.parser.form_4_pool import parse_pool
+
+
+class ParsePoolTests(unittest.TestCase):
+    """
+    Test parse_pool() gives the same tables as Form4Parser.parse_many(), in order
+    """
+
+    def setUp(self):
+        """
+        25 copies of the Form 4 fixture and one invalid document
+        """
+
+        content = load_fixture('form4.xml')
+        self.documents = [(f'acc-{i:02d}', content) for i in range(25)]
+        self.documents.insert(7, ('acc-bad', b'<ownershipDocument'))
+
+    def test_pool(self):
+        """
+        Test batches are yielded in input order with the same tables
+        """
+
+        expected = Form4Parser.parse_many(self.documents)
+        batches = list(parse_pool(self.documents, processes=2, batch_size=4, max_in_flight=2))
+
+        self.assertEqual(len(batches), 7)
+
+        for name, table in expected.items():
+            pd.testing.assert_frame_equal(pd.concat([batch[name] for batch in batches]), table)
+
+        self.assertListEqual(
+            [acc for batch in batches for acc in batch['issuers'].index],
+            [acc for acc, _ in self.documents if acc != 'acc-bad'])
+
+    def test_inline(self):
+        """
+        Test processes=0 uses the same path without a pool
+        """
+
+        batches = list(parse_pool(self.documents, processes=0, batch_size=10))
+
+        self.assertEqual(len(batches), 3)
+        self.assertEqual(batches[0]['transactions'].dtypes['transactionDate'], 'datetime64[ns]')
+        self.assertEqual(batches[0]['transactions'].dtypes['table'], 'category')
+
+    def test_lazy(self):
+        """
+        Test documents are only read while batches are in flight
+        """
+
+        read = []
+
+        def documents():
+            for document in self.documents:
+                read.append(document[0])
+                yield document
+
+        batches = parse_pool(documents(), processes=1, batch_size=2, max_in_flight=2)
+        next(batches)
+
+        # 2 batches submitted, then 1 more after the first was yielded
+        self.assertLessEqual(len(read), 3 * 2 + 1)
+        batches.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,9 +5,13 @@ Test FormParsers
 import unittest
 
 import numpy as np
+import pandas as pd
 
 from tracker.parser import Form4Parser
 from tracker.parser import form4_transaction_codes
+from tracker.parser.form_4 import TransactionSchema, convert_types, section_tags
+from tracker.parser.xml_parser import parse_xml
+from tests.helpers import load_fixture
 
 
 class Form4Tests(unittest.TestCase):
@@ -80,43 +84,43 @@ class Form4Tests(unittest.TestCase):
         # Test All Contents of Owner Table
         self.assertListEqual(parser.owner_table.loc[:, 0].values.tolist(), [
             '0001195345', 'DIMON JAMES', '383 MADISON AVENUE', np.nan, 'NEW YORK',
-            'NY', '10179-0001', np.nan, '1', '1', 'Chairman & CEO'
+            'NY', '10179-0001', np.nan, True, True, 'Chairman & CEO'
         ])
 
         # Test rows 2 and 5 of Non-Derivative Table
         for i, row in enumerate([2, 5]):
             row_data = [
-                ['Common Stock', '2022-03-25', np.nan, '4', 'F', '0', np.nan,
-                 '220486.0522',
-                 '141.9900', 'D', '1166561.0000', 'D', np.nan, np.nan, np.nan],
+                ['Common Stock', pd.Timestamp('2022-03-25'), np.nan, '4', 'F', False, np.nan,
+                 220486.0522,
+                 141.99, 'D', 1166561.0, 'D', np.nan, np.nan, np.nan],
                 ['Common Stock', np.nan, np.nan, np.nan, np.nan, np.nan, np.nan, np.nan,
                  np.nan,
-                 np.nan, '4348004.0000', 'I', np.nan, np.nan, 'By GRATs']
+                 np.nan, 4348004.0, 'I', np.nan, np.nan, 'By GRATs']
             ]
 
             for j, col in enumerate(parser.non_derivative_table.columns):
                 data_point = parser.non_derivative_table.loc[row, col]
                 expected_value = row_data[i][j]
 
-                # Try-Except to handle NaN values
-                try:
-                    self.assertEqual(np.isnan(data_point), np.isnan(expected_value))
-                except TypeError:
+                # Missing values are NaN / NaT
+                if pd.isna(expected_value):
+                    self.assertTrue(pd.isna(data_point))
+                else:
                     self.assertEqual(data_point, expected_value)
 
         # Test row 1 of Derivative Table
-        expected_values = ['Performance Share Units', np.nan, '2022-03-25', '4', 'M',
-                           '0', np.nan,
-                           '398708.0522', '0.0000', 'D', np.nan, np.nan, 'Common Stock',
-                           '398708.0522', '0.0000', 'D']
+        expected_values = ['Performance Share Units', np.nan, pd.Timestamp('2022-03-25'), '4',
+                           'M', False, np.nan,
+                           398708.0522, 0.0, 'D', np.nan, np.nan, 'Common Stock',
+                           398708.0522, 0.0, 'D']
 
         for j, col in enumerate(parser.derivative_table.columns):
             data_point = parser.derivative_table.loc[1, col]
 
-            # Try-Except to handle NaN values
-            try:
-                self.assertEqual(np.isnan(data_point), np.isnan(expected_values[j]))
-            except TypeError:
+            # Missing values are NaN / NaT
+            if pd.isna(expected_values[j]):
+                self.assertTrue(pd.isna(data_point))
+            else:
                 self.assertEqual(data_point, expected_values[j])
 
         # Test Footnotes
@@ -214,5 +218,225 @@ class Form4Tests(unittest.TestCase):
             pass
 
 
+class TransactionSchemaTests(unittest.TestCase):
+    """
+    Test TransactionSchema flattens transactions like the Form 4 tables
+    """
+
+    def test_flatten(self):
+        """
+        Test values, subfields, footnotes and missing fields
+        """
+
+        table = parse_xml(
+            b'<nonDerivativeTable>'
+            b'<nonDerivativeTransaction>'
+            b'<securityTitle><value>Common Stock</value><footnoteId id="F1"/></securityTitle>'
+            b'<!-- comment -->'
+            b'<transactionCoding><transactionCode>S</transactionCode>'
+            b'<footnoteId id="F2"/></transactionCoding>'
+            b'<transactionAmounts>'
+            b'<transactionShares><value>100</value></transactionShares>'
+            b'<transactionPricePerShare><footnoteId id="F3"/></transactionPricePerShare>'
+            b'</transactionAmounts>'
+            b'<unknownField><value>skipped</value></unknownField>'
+            b'</nonDerivativeTransaction>'
+            b'<nonDerivativeHolding>'
+            b'<securityTitle><value>Preferred Stock</value></securityTitle>'
+            b'<deemedExecutionDate></deemedExecutionDate>'
+            b'</nonDerivativeHolding>'
+            b'</nonDerivativeTable>')
+
+        schema = TransactionSchema(('securityTitle', 'deemedExecutionDate',
+                                    'transactionCoding', 'transactionAmounts'))
+        df = schema.flatten(table)
+
+        self.assertListEqual(df.index.tolist(), [1, 2])
+        self.assertListEqual(df.columns.tolist(),
+                             ['securityTitle', 'deemedExecutionDate',
+                              'transactionCoding.transactionCode',
+                              'transactionCoding.footnoteId',
+                              'transactionAmounts.transactionShares',
+                              # Missing from the holding
+                              'transactionCoding', 'transactionAmounts'])
+
+        self.assertListEqual(df['securityTitle'].tolist(), ['Common Stock', 'Preferred Stock'])
+        self.assertEqual(df.loc[1, 'transactionCoding.transactionCode'], 'S')
+        self.assertEqual(df.loc[1, 'transactionAmounts.transactionShares'], '100')
+        self.assertTrue(df['deemedExecutionDate'].isna().all())
+        self.assertTrue(df['transactionCoding.footnoteId'].isna().all())
+        self.assertTrue(np.isnan(df.loc[2, 'transactionAmounts.transactionShares']))
+
+
+class ConvertTypesTests(unittest.TestCase):
+    """
+    Test the typed columns of parse() and convert_types()
+    """
+
+    def test_parse_types(self):
+        """
+        Test parse() returns typed transaction columns and bool owner flags
+        """
+
+        parser = Form4Parser('Dimon', 'http://127.0.0.1/doc4.xml')
+        parser.content = load_fixture('form4.xml')
+        parsed = parser.parse()
+
+        df = parsed['non_derivative']
+        self.assertEqual(df['transactionAmounts.transactionShares'].dtype, np.float64)
+        self.assertEqual(df['transactionAmounts.transactionShares'].iloc[0], 1000.0)
+        self.assertEqual(df['transactionDate'].dtype, 'datetime64[ns]')
+        self.assertEqual(df['transactionDate'].iloc[0], pd.Timestamp('2022-03-25'))
+        self.assertEqual(df['transactionCoding.equitySwapInvolved'].dtype, 'boolean')
+
+        codes = df['transactionCoding.transactionCode']
+        self.assertEqual(codes.dtype, 'category')
+        self.assertListEqual(codes.cat.categories.tolist(), list(form4_transaction_codes))
+
+        self.assertIs(parsed['owner'].loc['Relationship.isDirector', 0], True)
+        self.assertIs(parsed['owner'].loc['Relationship.isTenPercentOwner', 0], False)
+        self.assertEqual(parsed['owner'].loc['Id.Cik', 0], '0001195345')
+
+    def test_convert_types(self):
+        """
+        Test invalid values become NaN / NaT and missing flags are <NA>
+        """
+
+        df = convert_types(pd.DataFrame({
+            'transactionAmounts.transactionPricePerShare': ['10.5', None, 'n/a'],
+            'expirationDate': ['2030-01-01-05:00', None, 'never'],
+            'transactionCoding.equitySwapInvolved': ['1', 'false', None],
+            'transactionCoding.transactionCode': ['S', 'Y', None],
+        }))
+
+        self.assertListEqual(df['transactionAmounts.transactionPricePerShare'].isna().tolist(),
+                             [False, True, True])
+        self.assertEqual(df['expirationDate'].iloc[0], pd.Timestamp('2030-01-01'))
+        self.assertTrue(df['expirationDate'].iloc[1:].isna().all())
+        self.assertListEqual(df['transactionCoding.equitySwapInvolved'].tolist()[:2],
+                             [True, False])
+        self.assertTrue(pd.isna(df['transactionCoding.equitySwapInvolved'].iloc[2]))
+        self.assertListEqual(df['transactionCoding.transactionCode'].isna().tolist(),
+                             [False, True, True])
+
+
+class Form4SectionsTests(unittest.TestCase):
+    """
+    Test Form4Parser only parses the sections requested or accessed
+    """
+
+    def setUp(self):
+        """
+        Form 4 parser of the fixture document
+        """
+
+        self.parser = Form4Parser('Dimon', 'http://127.0.0.1/doc4.xml')
+        self.parser.content = load_fixture('form4.xml')
+
+    def test_sections(self):
+        """
+        Test parse(sections) only builds the requested sections
+        """
+
+        parsed = self.parser.parse(sections=['issuer', 'owner'])
+
+        self.assertListEqual(list(parsed), ['issuer', 'owner'])
+        self.assertEqual(parsed['issuer'].loc['issuerTradingSymbol', 0], 'JPM')
+        self.assertSetEqual(self.parser.parsed_sections, {'issuer', 'owner'})
+        self.assertTrue(self.parser.derivative_table.empty)
+        self.assertIsNone(self.parser.footnotes)
+
+        with self.assertRaises(ValueError):
+            self.parser.parse(sections=['signature'])
+
+    def test_lazy(self):
+        """
+        Test properties parse their section on first access, from one parsed document
+        """
+
+        self.assertSetEqual(self.parser.parsed_sections, set())
+
+        non_derivative = self.parser.non_derivative
+        data = self.parser.data
+
+        self.assertEqual(non_derivative.shape[0], 3)
+        self.assertSetEqual(self.parser.parsed_sections, {'non_derivative'})
+        self.assertIs(self.parser.non_derivative, non_derivative)
+
+        self.assertEqual(self.parser.derivative.shape[0], 1)
+        self.assertIs(self.parser.data, data)
+
+        # The full parse reuses the parsed sections
+        parsed = self.parser.parse()
+        self.assertListEqual(list(parsed), ['issuer', 'owner', 'non_derivative', 'derivative'])
+        self.assertIs(parsed['non_derivative'], non_derivative)
+        self.assertSetEqual(self.parser.parsed_sections, set(section_tags))
+
+    def test_new_content(self):
+        """
+        Test new content is parsed again
+        """
+
+        self.parser.parse(sections=['issuer'])
+        self.parser.content = self.parser.content.replace(b'JPM', b'XYZ')
+
+        self.assertEqual(self.parser.issuer.loc['issuerTradingSymbol', 0], 'XYZ')
+
+
+class Form4ParseManyTests(unittest.TestCase):
+    """
+    Test Form4Parser.parse_many()
+    """
+
+    def test_parse_many(self):
+        """
+        Test the batch tables match the per-filing tables of parse()
+        """
+
+        content = load_fixture('form4.xml')
+        parser = Form4Parser('Dimon', 'http://127.0.0.1/doc4.xml')
+        parser.content = content
+        parsed = parser.parse()
+
+        with self.assertLogs('sec', level='WARNING'):
+            tables = Form4Parser.parse_many([('acc-1', content),
+                                             ('acc-2', content),
+                                             ('acc-3', b'<ownershipDocument'),
+                                             ('acc-4', b'<ownershipDocument/>')])
+
+        transactions = tables['transactions']
+        self.assertListEqual(transactions.index.names, ['acc', 'row'])
+        self.assertEqual(transactions.shape[0], 2 * (3 + 1))
+        self.assertListEqual(transactions.loc['acc-1', 'table'].tolist(),
+                             ['non_derivative'] * 3 + ['derivative'])
+
+        # Same values as parse(), typed
+        shares = transactions.loc['acc-2', 'transactionAmounts.transactionShares']
+        self.assertEqual(shares.dtype, np.float64)
+        np.testing.assert_array_equal(
+            shares.iloc[:3].to_numpy(),
+            parsed['non_derivative']['transactionAmounts.transactionShares'].astype(float))
+        self.assertEqual(transactions['transactionDate'].dtype, 'datetime64[ns]')
+        self.assertEqual(transactions['transactionCoding.transactionCode'].dtype, 'category')
+
+        self.assertListEqual(tables['issuers'].index.tolist(), ['acc-1', 'acc-2'])
+        self.assertListEqual(tables['issuers'].loc['acc-1'].tolist(),
+                             parsed['issuer'].loc[:, 0].tolist())
+
+        owners = tables['owners']
+        self.assertListEqual(owners.index.tolist(), [('acc-1', 1), ('acc-2', 1)])
+        self.assertListEqual(owners.columns.tolist(), parsed['owner'].index.tolist())
+
+    def test_empty(self):
+        """
+        Test an empty batch returns empty tables
+        """
+
+        tables = Form4Parser.parse_many([])
+
+        self.assertTrue(all(table.empty for table in tables.values()))
+        self.assertListEqual(tables['transactions'].index.names, ['acc', 'row'])
+
+
 if __name__ == '__main__':
     unittest.main()
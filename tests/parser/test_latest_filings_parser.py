@@ -0,0 +1,94 @@
+"""
+Test SECFilingsParser
+"""
+
+import unittest
+
+import pandas as pd
+
+from tests.helpers import local_server, build_atom_feed, accession_number
+from tracker.parser.sec_latest_filings_parser import SECFilingsParser
+
+
+class SECFilingsParserTests(unittest.TestCase):
+    """
+    Test SECFilingsParser.parse() offline
+    """
+
+    @staticmethod
+    def _parse(feed: bytes) -> pd.DataFrame:
+        def route(_):
+            return 200, {'Content-Type': 'application/atom+xml'}, feed
+
+        with local_server(route) as url:
+            return SECFilingsParser('Filings', url).parse()
+
+    def test_parse(self):
+        """
+        Test columns, dtypes and values of the parsed feed
+        """
+
+        filings = self._parse(build_atom_feed([accession_number(i) for i in range(100)]))
+
+        self.assertEqual(filings.shape, (200, 4))
+        self.assertEqual(filings.index.name, 'acc')
+        self.assertListEqual(filings.columns.tolist(), ['form_type', 'title', 'date_time', 'link'])
+        self.assertTrue(pd.api.types.is_datetime64_dtype(filings['date_time']))
+
+        first = filings.iloc[0]
+        self.assertEqual(filings.index[0], accession_number(0))
+        self.assertEqual(first['form_type'], '4')
+        self.assertEqual(first['title'], '4 - Filer 0 (0001234567) (Reporting)')
+        self.assertEqual(first['date_time'], pd.Timestamp('2022-07-01 16:59:00'))
+        self.assertEqual(first['link'], 'https://www.sec.gov/Archives/edgar/data/1234567/'
+                                        '000123456722000000/0001234567-22-000000-index.htm')
+
+        self.assertEqual(filings.index[-1], accession_number(99))
+        self.assertEqual(filings.iloc[-1]['title'], '4 - Filer 99 (0001234567) (Issuer)')
+
+    def test_extra_link(self):
+        """
+        Test entries with extra fields still line up
+        """
+
+        feed = build_atom_feed([accession_number(i) for i in range(3)])
+        feed = feed.replace(b'<summary type="html">Filed</summary>',
+                            b'<link rel="related" href="https://www.sec.gov/x"/>', 1)
+
+        filings = self._parse(feed)
+
+        self.assertEqual(filings.shape, (6, 4))
+        self.assertTrue(filings['link'].str.endswith('-index.htm').all())
+
+    def test_missing_field(self):
+        """
+        Test entries with a missing field get NaN / NaT and the other columns still line up
+        """
+
+        feed = build_atom_feed([accession_number(i) for i in range(3)])
+        feed = feed.replace(b'<updated>2022-07-01T16:58:59-04:00</updated>', b'', 1)
+        feed = feed.replace(b'<title>4 - Filer 2 (0001234567) (Issuer)</title>', b'', 1)
+
+        filings = self._parse(feed)
+
+        self.assertEqual(filings.shape, (6, 4))
+        self.assertListEqual(filings['date_time'].isna().tolist(),
+                             [False, False, True, False, False, False])
+        self.assertTrue(pd.isna(filings.iloc[5]['title']))
+        self.assertEqual(filings.iloc[4]['title'], '4 - Filer 2 (0001234567) (Reporting)')
+        self.assertEqual(filings.index[3], accession_number(1))
+
+    def test_empty(self):
+        """
+        Test an empty feed
+        """
+
+        filings = self._parse(build_atom_feed([]))
+
+        self.assertTrue(filings.empty)
+        self.assertEqual(filings.index.name, 'acc')
+        self.assertListEqual(filings.columns.tolist(), ['form_type', 'title', 'date_time', 'link'])
+
+
+if __name__ == '__main__':
+    unittest.main()
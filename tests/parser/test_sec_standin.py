@@ -0,0 +1,96 @@
+"""
+Test SEC Stand-In Server
+"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+import requests
+
+from tests.helpers import build_atom_feed, accession_number
+from scripts.sec_standin import FixtureStore, StandinServer
+from tracker.parser import SECParser, ResponseError
+from tracker.parser.sec_latest_filings_parser import SECFilingsParser
+
+
+class StandinTests(unittest.TestCase):
+    """
+    Test the stand-in server replays recorded responses
+    """
+
+    def setUp(self):
+        """
+        Record an Atom feed and an FTS response in a temporary fixture store
+        """
+
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=R1732
+        self.store = FixtureStore(Path(self.directory.name))
+
+        self.feed_path = '/cgi-bin/browse-edgar?action=getcurrent&output=atom&count=100'
+        self.store.put('GET', self.feed_path, b'', 200,
+                       {'Content-Type': 'application/atom+xml', 'Set-Cookie': 'x'},
+                       build_atom_feed([accession_number(i) for i in range(3)]))
+
+        self.fts_body = json.dumps({'q': 'Form 4'}).encode('utf-8')
+        self.store.put('POST', '/LATEST/search-index', self.fts_body, 200,
+                       {'Content-Type': 'application/json'}, b'{"hits": {"hits": []}}')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _serve(self, **kwargs) -> StandinServer:
+        server = StandinServer(('127.0.0.1', 0), store=self.store, **kwargs)
+        server.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server
+
+    def test_replay(self):
+        """
+        Test the feed is replayed with links pointing at the stand-in
+        """
+
+        server = self._serve()
+
+        parser = SECFilingsParser('Standin', server.url + self.feed_path)
+        filings = parser.parse()
+
+        self.assertListEqual(filings.index.unique().tolist(),
+                             [accession_number(i) for i in range(3)])
+        self.assertTrue(filings['link'].str.startswith(server.url).all())
+        self.assertNotIn('Set-Cookie', parser.response.headers)
+
+        # POST requests are keyed by their body
+        response = requests.post(server.url + '/LATEST/search-index', data=self.fts_body,
+                                 timeout=5)
+        self.assertDictEqual(response.json(), {'hits': {'hits': []}})
+
+        response = requests.post(server.url + '/LATEST/search-index', data=b'{}', timeout=5)
+        self.assertEqual(response.status_code, 404)
+
+    def test_missing(self):
+        """
+        Test unrecorded requests return 404 when not recording
+        """
+
+        server = self._serve()
+
+        with self.assertRaises(ResponseError):
+            SECParser('Missing', server.url + '/Archives/edgar/missing.xml').get_webpage()
+
+    def test_throttle(self):
+        """
+        Test every request is answered with 429 when throttle is 1
+        """
+
+        server = self._serve(throttle=1)
+        response = requests.get(server.url + self.feed_path, timeout=5)
+
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response.headers['Retry-After'], '1')
+
+
+if __name__ == '__main__':
+    unittest.main()
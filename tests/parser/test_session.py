@@ -0,0 +1,69 @@
+"""
+Test Shared HTTP Session
+"""
+
+import unittest
+
+from tracker.parser import SECParser
+from tracker.parser.session import get_session, close_session, get_sec_headers, get_user_agent
+
+
+# pylint: disable=protected-access
+# Tests check private adapter state
+
+class SessionTests(unittest.TestCase):
+    """
+    Test get_session() and close_session()
+    """
+
+    def tearDown(self):
+        close_session()
+
+    def test_shared(self):
+        """
+        Test that the session is shared by all callers
+        """
+
+        session = get_session()
+        self.assertIs(session, get_session())
+
+        # No SEC headers for other hosts
+        self.assertNotEqual(session.headers['User-Agent'], get_user_agent())
+
+        # SECParser uses the same User-Agent
+        parser = SECParser('Session')
+        self.assertEqual(parser._get_user_agent(), get_user_agent())
+
+    def test_sec_headers(self):
+        """
+        Test SEC requests get the default SEC headers and the additional headers
+        """
+
+        headers = get_sec_headers({'If-None-Match': 'etag', 'Accept-Encoding': 'gzip'})
+
+        self.assertEqual(headers['User-Agent'], get_user_agent())
+        self.assertEqual(headers['Accept-Encoding'], 'gzip')
+        self.assertEqual(headers['If-None-Match'], 'etag')
+
+    def test_pool_size(self):
+        """
+        Test the connection pool size
+        """
+
+        close_session()
+        session = get_session(pool_size=3)
+        adapter = session.get_adapter('https://www.sec.gov/')
+        self.assertEqual(adapter._pool_maxsize, 3)
+
+    def test_close(self):
+        """
+        Test close_session() creates a new session on next use
+        """
+
+        session = get_session()
+        close_session()
+        self.assertIsNot(session, get_session())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+"""
+Test WebpageParser Streaming
+"""
+
+import unittest
+
+from tests.helpers import local_server, build_atom_feed, accession_number
+from tracker.parser import SECParser, ResponseError
+from tracker.screener import CIKScreener
+
+
+class StreamingTests(unittest.TestCase):
+    """
+    Test WebpageParser stream(), iter_lines() and iterparse()
+    """
+
+    def test_iterparse(self):
+        """
+        Test iterparse() yields complete elements and clears consumed ones
+        """
+
+        feed = build_atom_feed([accession_number(i) for i in range(500)])
+
+        def route(_):
+            return 200, {'Content-Type': 'application/atom+xml'}, feed
+
+        with local_server(route) as url:
+            parser = SECParser('Stream', url)
+
+            ids = []
+            previous = None
+            for entry in parser.iterparse('{http://www.w3.org/2005/Atom}entry', chunk_size=1024):
+                ids.append(entry.findtext('{http://www.w3.org/2005/Atom}id').split('=')[-1])
+
+                # The previously consumed entry has been cleared. Only entries from
+                # the current chunk are left in the tree, not the whole document.
+                if previous is not None:
+                    self.assertEqual(len(previous), 0)
+                    self.assertLess(len(entry.getparent()), 10)
+                previous = entry
+
+            self.assertEqual(len(ids), 1000)
+            self.assertEqual(ids[0], accession_number(0))
+            self.assertEqual(ids[-1], accession_number(499))
+
+            # Streamed webpages are not cached
+            self.assertIsNone(parser.content)
+
+    def test_iter_lines(self):
+        """
+        Test iter_lines() splits lines across chunk boundaries
+        """
+
+        body = 'ALPHA CORP:0000000001:\r\nBÊTA INC:0000000002:\nGAMMA LLC:0000000003:\n' \
+            .encode('utf-8')
+
+        def route(_):
+            return 200, {'Content-Type': 'text/plain; charset=utf-8'}, body
+
+        with local_server(route) as url:
+            parser = SECParser('Lines', url)
+            lines = list(parser.iter_lines(chunk_size=7))
+
+        self.assertListEqual(lines, ['ALPHA CORP:0000000001:',
+                                     'BÊTA INC:0000000002:',
+                                     'GAMMA LLC:0000000003:'])
+
+    def test_cik_lookup(self):
+        """
+        Test CIKScreener builds the lookup table from the streamed file
+        """
+
+        body = b'ALPHA CORP:0000000001:\nBETA INC:0000000002:\n'
+
+        def route(_):
+            return 200, {'Content-Type': 'text/plain'}, body
+
+        with local_server(route) as url:
+            screener = CIKScreener()
+            screener.parser.set_url(url)
+            df = screener._get_lookup_df_from_url()  # pylint: disable=protected-access
+
+        self.assertListEqual(df['company'].tolist(), ['ALPHA CORP', 'BETA INC'])
+        self.assertListEqual(df['cik'].tolist(), ['0000000001', '0000000002'])
+
+    def test_error(self):
+        """
+        Test stream() raises ResponseError on unsuccessful response
+        """
+
+        def route(_):
+            return 404, {'Content-Type': 'text/plain'}, b'Not Found'
+
+        with local_server(route) as url:
+            parser = SECParser('Error', url)
+
+            with self.assertRaises(ResponseError):
+                list(parser.stream())
+
+
+if __name__ == '__main__':
+    unittest.main()
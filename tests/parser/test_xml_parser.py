@@ -0,0 +1,83 @@
+"""
+Test XML Parser and bytes-in parsing
+"""
+
+import threading
+import unittest
+
+from tests.helpers import local_server, load_fixture
+from tracker.parser import Form4Parser, SECParser
+from tracker.parser.xml_parser import get_xml_parser, parse_xml
+
+
+class XMLParserTests(unittest.TestCase):
+    """
+    Test parse_xml() and bytes-in parsing
+    """
+
+    def test_parse_xml(self):
+        """
+        Test parse_xml() respects the document encoding declaration
+        """
+
+        content = '<?xml version="1.0" encoding="ISO-8859-1" ?><name>Société</name>' \
+            .encode('iso-8859-1')
+        self.assertEqual(parse_xml(content).text, 'Société')
+
+    def test_parser_per_thread(self):
+        """
+        Test each thread gets its own reusable parser
+        """
+
+        parser = get_xml_parser()
+        self.assertIs(parser, get_xml_parser())
+
+        parsers = []
+        thread = threading.Thread(target=lambda: parsers.append(get_xml_parser()))
+        thread.start()
+        thread.join()
+
+        self.assertIsNot(parser, parsers[0])
+
+    def test_form4_content(self):
+        """
+        Test Form4Parser parses the raw document bytes
+        """
+
+        parser = Form4Parser('Dimon', 'http://127.0.0.1/doc4.xml')
+        parser.content = load_fixture('form4.xml')
+        parser.parse()
+
+        self.assertEqual((3, 1), parser.issuer_table.shape)
+        self.assertEqual((13, 1), parser.owner_table.shape)
+        self.assertEqual((3, 16), parser.non_derivative_table.shape)
+        self.assertEqual((1, 16), parser.derivative_table.shape)
+        self.assertEqual(4, len(parser.footnotes))
+        self.assertListEqual(parser.issuer_table.loc[:, 0].values.tolist(),
+                             ['0000019617', 'JPMORGAN CHASE & CO', 'JPM'])
+
+    def test_lazy_webpage(self):
+        """
+        Test webpage text is only decoded on access
+        """
+
+        body = 'Société'.encode('utf-8')
+
+        def route(_):
+            return 200, {'Content-Type': 'text/plain; charset=utf-8'}, body
+
+        with local_server(route) as url:
+            parser = SECParser('Bytes', url)
+
+            self.assertEqual(parser.get_content(), body)
+            self.assertIsNone(parser._webpage)  # pylint: disable=protected-access
+            self.assertEqual(parser.webpage, 'Société')
+
+            # set_url() clears the cached bytes
+            parser.set_url(f'{url}/other')
+            self.assertIsNone(parser.content)
+            self.assertIsNone(parser.webpage)
+
+
+if __name__ == '__main__':
+    unittest.main()
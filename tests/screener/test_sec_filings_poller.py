@@ -0,0 +1,131 @@
+"""
+Test SECFilingsPoller
+"""
+
+import unittest
+from contextlib import contextmanager
+from urllib.parse import parse_qs, urlparse
+
+from tests.helpers import local_server, build_atom_feed, accession_number
+from tracker.screener import SECFilingsScreener
+from tracker.screener.sec_filings_poller import SECFilingsPoller
+from tracker.utils.clock import VirtualClock
+
+
+class SECFilingsPollerTests(unittest.TestCase):
+    """
+    Test SECFilingsPoller only gets the filings newer than the high-water mark
+    """
+
+    def setUp(self):
+        """
+        Simulated feed of 60 filings (2 entries each), newest first
+        """
+
+        self.accs: list[str] = [accession_number(i) for i in range(60, 0, -1)]
+        self.requests: list[dict] = []
+
+    @contextmanager
+    def _poller(self, **kwargs):
+        def route(handler):
+            query = parse_qs(urlparse(handler.path).query)
+            count, start = int(query['count'][0]), int(query.get('start', [0])[0])
+            self.requests.append({'count': count, 'start': start})
+
+            # Each filing has 2 entries in the feed
+            accs = self.accs[start // 2:(start + count) // 2]
+            return 200, {'Content-Type': 'application/atom+xml'}, build_atom_feed(accs)
+
+        with local_server(route) as url:
+            screener = SECFilingsScreener('poller', form='4')
+            screener.base_url = url + '/cgi-bin/browse-edgar?action=getcurrent'
+            yield SECFilingsPoller(screener, **kwargs)
+
+    def _publish(self, count: int) -> list[str]:
+        """
+        Add new filings to the top of the feed
+
+        :return: New accession numbers, newest first
+        """
+
+        newest = int(self.accs[0].split('-')[-1])
+        new = [accession_number(i) for i in range(newest + count, newest, -1)]
+        self.accs = new + self.accs
+
+        return new
+
+    def test_poll(self):
+        """
+        Test the first poll gets a full page and later polls only get new filings
+        """
+
+        with self._poller() as poller:
+            filings = poller.poll()
+            self.assertListEqual(filings.index.tolist(), self.accs[:50])
+            self.assertEqual(poller.high_water, self.accs[0])
+
+            # Nothing new
+            self.assertTrue(poller.poll().empty)
+            self.assertEqual(len(poller.ring), 50)
+
+            new = self._publish(3)
+            self.requests.clear()
+            filings = poller.poll()
+
+            self.assertListEqual(filings.index.tolist(), new)
+            self.assertListEqual(self.requests, [{'count': 20, 'start': 0}])
+            self.assertEqual(poller.high_water, new[0])
+            self.assertListEqual(poller.filings.index.tolist()[:4], new + [self.accs[3]])
+            self.assertEqual(poller.filings.columns.tolist(),
+                             ['form_type', 'title', 'date_time', 'link'])
+
+    def test_page_to_mark(self):
+        """
+        Test pages are fetched until the mark when there are more new filings than head_count
+        """
+
+        with self._poller(prefetch=0) as poller:
+            poller.poll()
+
+            new = self._publish(15)
+            self.requests.clear()
+            filings = poller.poll()
+
+            self.assertListEqual(filings.index.tolist(), new)
+            self.assertListEqual(self.requests, [{'count': 20, 'start': 0},
+                                                 {'count': 100, 'start': 0}])
+            self.assertEqual(len(poller.ring), 65)
+
+    def test_ring_size(self):
+        """
+        Test the ring only keeps the newest filings
+        """
+
+        with self._poller(size=10) as poller:
+            poller.poll()
+            new = self._publish(2)
+            poller.poll()
+
+            self.assertListEqual(poller.filings.index.tolist(), new + self.accs[2:10])
+
+    def test_interval(self):
+        """
+        Test polls within the interval do not send requests
+        """
+
+        clock = VirtualClock()
+
+        with self._poller(interval=10, clock=clock) as poller:
+            poller.poll()
+            self._publish(1)
+
+            clock.advance(5)
+            self.assertTrue(poller.poll().empty)
+            self.assertEqual(len(self.requests), 1)
+
+            clock.advance(5)
+            self.assertEqual(poller.poll().shape[0], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,12 +2,17 @@
 Test SECFilingsScreener
 """
 
+import threading
+import time
 import unittest
+from contextlib import contextmanager
+from urllib.parse import parse_qs, urlparse
 
 import pandas.testing as pdt
 from numpy.random import randint
 
 from baseurls import SEC_LATEST_FILINGS
+from tests.helpers import local_server, build_atom_feed, accession_number
 from tracker.screener import SECFilingsScreener
 
 
@@ -178,5 +183,131 @@ class SECFilingsScreenerTests(unittest.TestCase):
         self.assertLessEqual(filings_until.shape[0], 2000)
 
 
+class PagingTests(unittest.TestCase):
+    """
+    Test get_filings_until() and iter_filings_until() on a simulated feed
+    """
+
+    def setUp(self):
+        """
+        500 filings (2 entries each): 10 pages of 100 entries
+        """
+
+        self.accs: list[str] = [accession_number(i) for i in range(500, 0, -1)]
+        self.starts: list[int] = []
+        self.max_in_flight: int = 0
+        self.latency: float = 0
+        self.on_request = None
+
+    @contextmanager
+    def _screener(self):
+        in_flight = [0]
+        lock = threading.Lock()
+
+        def route(handler):
+            query = parse_qs(urlparse(handler.path).query)
+            count, start = int(query['count'][0]), int(query.get('start', [0])[0])
+
+            with lock:
+                self.starts.append(start)
+                in_flight[0] += 1
+                self.max_in_flight = max(self.max_in_flight, in_flight[0])
+                accs = self.accs[start // 2:(start + count) // 2]
+                if self.on_request is not None:
+                    self.on_request()
+
+            # Latency, so prefetched pages overlap
+            time.sleep(self.latency)
+
+            with lock:
+                in_flight[0] -= 1
+
+            return 200, {'Content-Type': 'application/atom+xml'}, build_atom_feed(accs)
+
+        with local_server(route) as url:
+            screener = SECFilingsScreener('paging', form='4')
+            screener.base_url = url + '/cgi-bin/browse-edgar?action=getcurrent'
+            yield screener
+
+    def test_prefetch(self):
+        """
+        Test prefetched pages give the same filings and stop after the target page
+        """
+
+        self.latency = 0.3
+
+        with self._screener() as screener:
+            # Target on the 6th page
+            target = self.accs[270]
+            expected = screener.get_filings_until(target)
+            self.assertEqual(expected.index[-1], target)
+            self.assertEqual(self.max_in_flight, 1)
+
+            self.starts.clear()
+            filings = screener.get_filings_until(target, prefetch=4)
+
+            pdt.assert_frame_equal(filings, expected)
+            self.assertGreater(self.max_in_flight, 1)
+
+            # Pages after the target page are dropped: at most prefetch - 1 extra requests
+            self.assertLessEqual(max(self.starts), 500 + 300)
+
+            # Missing target: pages until max_count or the end of the feed
+            filings = screener.get_filings_until('missing', max_count=2000, prefetch=4)
+            self.assertListEqual(filings.index.tolist(), self.accs)
+
+    def test_iter(self):
+        """
+        Test each page is yielded before the next page is requested
+        """
+
+        with self._screener() as screener:
+            pages = screener.iter_filings_until(self.accs[120])
+
+            page = next(pages)
+            self.assertListEqual(page.index.tolist(), self.accs[:50])
+            self.assertListEqual(self.starts, [0])
+
+            pages = list(pages)
+            self.assertEqual(len(pages), 2)
+            self.assertEqual(pages[-1].index[-1], self.accs[120])
+
+    def test_close(self):
+        """
+        Test closing the generator early cancels the prefetched pages
+        """
+
+        self.latency = 0.1
+
+        with self._screener() as screener:
+            pages = screener.iter_filings_until('missing', prefetch=4)
+
+            self.assertListEqual(next(pages).index.tolist(), self.accs[:50])
+            pages.close()
+
+            self.assertLessEqual(len(self.starts), 4 + 1)
+
+    def test_window(self):
+        """
+        Test filings repeated by the shifting feed are dropped with a window of 1
+        """
+
+        def publish():
+            # Publish 5 new filings after every request
+            newest = int(self.accs[0].split('-')[-1])
+            self.accs = [accession_number(i) for i in range(newest + 5, newest, -1)] + self.accs
+
+        self.on_request = publish
+        target = self.accs[220]
+
+        with self._screener() as screener:
+            pages = list(screener.iter_filings_until(target, window=1))
+            accs = [acc for page in pages for acc in page.index]
+
+            self.assertEqual(len(accs), len(set(accs)))
+            self.assertEqual(accs[-1], target)
+            self.assertEqual(len(accs), 221)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,141 @@
+"""
+Test DiskCache
+"""
+
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest import mock
+
+from tracker.parser import SECParser
+from tracker.parser.sec import archives_cache
+from tracker.utils.disk_cache import DiskCache
+
+
+class DiskCacheTests(unittest.TestCase):
+    """
+    Test DiskCache
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.path = Path(self.tmp_dir.name)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_get_put(self):
+        """
+        Test get() and put() methods
+        """
+
+        cache = DiskCache(self.path, max_size=1024)
+        url = 'https://www.sec.gov/Archives/edgar/data/1/doc4.xml'
+
+        self.assertIsNone(cache.get(url))
+        self.assertNotIn(url, cache)
+
+        self.assertTrue(cache.put(url, 'text/xml', 'ISO-8859-1', b'<doc>\n</doc>'))
+        self.assertIn(url, cache)
+        self.assertEqual(cache.get(url), ('text/xml', 'ISO-8859-1', b'<doc>\n</doc>'))
+
+        # Missing encoding
+        cache.put(url, 'text/xml', None, b'<doc/>')
+        self.assertEqual(cache.get(url), ('text/xml', None, b'<doc/>'))
+
+        # No temporary files left behind
+        self.assertListEqual(list(self.path.glob('*.tmp')), [])
+
+    def test_replace(self):
+        """
+        Test replacing a document does not count its old size
+        """
+
+        cache = DiskCache(self.path, max_size=400)
+
+        cache.put('url0', 'text/plain', 'utf-8', b'x' * 100)
+        cache.put('url1', 'text/plain', 'utf-8', b'x' * 100)
+        size = cache.size
+
+        # Replacing url1 several times must not evict url0
+        for _ in range(3):
+            cache.put('url1', 'text/plain', 'utf-8', b'y' * 100)
+
+        self.assertEqual(cache.size, size)
+        self.assertIn('url0', cache)
+
+    def test_failed_write(self):
+        """
+        Test a failed write does not leave the temporary file behind
+        """
+
+        cache = DiskCache(self.path, max_size=400)
+
+        with mock.patch('os.replace', side_effect=OSError('disk full')):
+            self.assertFalse(cache.put('url0', 'text/plain', 'utf-8', b'x' * 100))
+
+        self.assertListEqual(list(self.path.glob('*')), [])
+
+    def test_eviction(self):
+        """
+        Test least recently used documents are evicted over max_size
+        """
+
+        cache = DiskCache(self.path, max_size=400)
+        body = b'x' * 100
+
+        for i in range(3):
+            cache.put(f'url{i}', 'text/plain', 'utf-8', body)
+            # Distinct modification times
+            os.utime(cache._get_file(f'url{i}'), (i, i))  # pylint: disable=protected-access
+
+        # Use url0 so url1 is the least recently used
+        self.assertIsNotNone(cache.get('url0'))
+
+        cache.put('url3', 'text/plain', 'utf-8', body)
+
+        self.assertIn('url0', cache)
+        self.assertNotIn('url1', cache)
+        self.assertIn('url2', cache)
+        self.assertIn('url3', cache)
+        self.assertLessEqual(cache.size, 400)
+
+        # Documents larger than the cache are not cached
+        self.assertFalse(cache.put('large', 'text/plain', 'utf-8', b'x' * 500))
+
+    def test_concurrent(self):
+        """
+        Test concurrent writers and readers only see complete documents
+        """
+
+        cache = DiskCache(self.path, max_size=10 * 1024 * 1024)
+        bodies = [bytes([65 + i]) * 10000 for i in range(8)]
+
+        def __put_get(i: int) -> bool:
+            cache.put('url', 'text/plain', 'utf-8', bodies[i])
+            return cache.get('url')[2] in bodies
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            self.assertTrue(all(executor.map(__put_get, list(range(8)) * 5)))
+
+    def test_sec_parser(self):
+        """
+        Test SECParser reads EDGAR Archives documents from the cache
+        """
+
+        url = 'https://www.sec.gov/Archives/edgar/data/0/000000000000000000/test-cache.xml'
+        archives_cache.put(url, 'text/xml', 'utf-8', b'<ownershipDocument/>')
+
+        try:
+            parser = SECParser('Cache', url)
+            self.assertEqual(parser.get_webpage(), '<ownershipDocument/>')
+            self.assertEqual(parser.content_type, 'text/xml')
+            self.assertIsNone(parser.response)
+        finally:
+            archives_cache._get_file(url).unlink()  # pylint: disable=protected-access
+
+
+if __name__ == '__main__':
+    unittest.main()
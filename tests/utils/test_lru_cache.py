@@ -0,0 +1,151 @@
+"""
+Test LRUCache
+"""
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pandas as pd
+
+from tests.helpers import load_fixture, local_server
+from tracker.manage import parse_filing
+from tracker.manage.latest_insider_trades import FULL_SECTIONS, LISTING_SECTIONS
+from tracker.parser import SECFilingParser, form4_parsed_cache
+from tracker.utils.lru_cache import LRUCache
+
+
+class LRUCacheTests(unittest.TestCase):
+    """
+    Test LRUCache
+    """
+
+    def test_get_put(self):
+        """
+        Test get() and put() methods and hit/miss counters
+        """
+
+        cache = LRUCache(max_size=100, sizeof=len)
+
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.get('a', 'default'), 'default')
+
+        self.assertTrue(cache.put('a', 'x' * 10))
+        self.assertEqual(cache.get('a'), 'x' * 10)
+        self.assertIn('a', cache)
+        self.assertEqual(len(cache), 1)
+
+        # Replace value
+        cache.put('a', 'y' * 20)
+        self.assertEqual(cache.get('a'), 'y' * 20)
+        self.assertEqual(cache.size, 20)
+
+        # Peek does not count hits or misses
+        self.assertEqual(cache.peek('a'), 'y' * 20)
+        self.assertIsNone(cache.peek('b'))
+
+        self.assertDictEqual(cache.stats(),
+                             {'hits': 2, 'misses': 2, 'evictions': 0, 'count': 1, 'size': 20})
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.size, 0)
+        self.assertEqual(cache.hits, 0)
+
+    def test_eviction(self):
+        """
+        Test least recently used values are evicted over max_size
+        """
+
+        cache = LRUCache(max_size=30, sizeof=len)
+
+        cache.put('a', 'x' * 10)
+        cache.put('b', 'x' * 10)
+        cache.put('c', 'x' * 10)
+
+        # Use 'a' so 'b' is the least recently used
+        cache.get('a')
+        cache.put('d', 'x' * 10)
+
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertIn('c', cache)
+        self.assertIn('d', cache)
+        self.assertEqual(cache.evictions, 1)
+
+        # Values larger than the cache are not cached
+        self.assertFalse(cache.put('e', 'x' * 31))
+        self.assertNotIn('e', cache)
+
+    def test_threads(self):
+        """
+        Test concurrent access from multiple threads
+        """
+
+        cache = LRUCache(max_size=500, sizeof=len)
+
+        def __put_get(i: int) -> None:
+            cache.put(i % 100, 'x' * 10)
+            cache.get(i % 100)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(__put_get, range(1000)))
+
+        self.assertEqual(len(cache), 50)
+        self.assertEqual(cache.size, 500)
+        self.assertEqual(cache.hits + cache.misses, 1000)
+
+    def test_parse_filing(self):
+        """
+        Test parse_filing() returns the cached parsed Form 4 without downloading
+        """
+
+        acc_no = '0000000000-00-000000'
+        parsed = {'issuer': pd.DataFrame({0: ['0000019617', 'JPMORGAN CHASE & CO', 'JPM']}),
+                  'owner': None, 'non_derivative': None, 'derivative': None}
+        form4_parsed_cache.put(acc_no, parsed)
+
+        hits = form4_parsed_cache.hits
+        trade_data = parse_filing(acc_no, 'https://www.sec.gov/not-downloaded')
+        self.assertEqual(list(trade_data), list(parsed))
+        self.assertIs(trade_data['issuer'], parsed['issuer'])
+        self.assertEqual(form4_parsed_cache.hits, hits + 1)
+        self.assertGreater(form4_parsed_cache.size, 0)
+
+    def test_parse_sections(self):
+        """
+        Test parse_filing() caches parsed sections and only parses the missing ones
+        """
+
+        requests = []
+
+        def route(_):
+            requests.append(1)
+            return 200, {'Content-Type': 'text/xml'}, load_fixture('form4.xml')
+
+        acc_no = '0000000000-00-000001'
+        with local_server(route) as url, \
+                mock.patch.object(SECFilingParser, 'get_document_url', return_value=url):
+            listing = parse_filing(acc_no, url, LISTING_SECTIONS)
+            self.assertEqual(list(listing), list(LISTING_SECTIONS))
+            self.assertEqual(len(requests), 1)
+
+            # Cached subset
+            issuer = parse_filing(acc_no, url, ['issuer'])
+            self.assertIs(issuer['issuer'], listing['issuer'])
+            self.assertEqual(len(requests), 1)
+
+            # Only the derivative table is parsed and merged into the cached filing
+            trade_data = parse_filing(acc_no, url)
+            self.assertEqual(list(trade_data), list(FULL_SECTIONS))
+            self.assertIs(trade_data['non_derivative'], listing['non_derivative'])
+            self.assertEqual(len(requests), 2)
+
+            self.assertEqual(list(form4_parsed_cache.peek(acc_no)),
+                             list(LISTING_SECTIONS) + ['derivative'])
+            parse_filing(acc_no, url)
+            self.assertEqual(len(requests), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
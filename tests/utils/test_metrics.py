@@ -0,0 +1,110 @@
+"""
+Test Metrics
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from defs import PROJECT_PATH
+from tests.helpers import local_server
+from tracker.parser import SECParser
+from tracker.parser.instrumentation import get_endpoint
+from tracker.utils.metrics import add_collector, get_value, render
+
+
+class MetricsTests(unittest.TestCase):
+    """
+    Test the metrics exposition and SEC instrumentation
+    """
+
+    def test_render(self):
+        """
+        Test the SEC metrics are rendered in the Prometheus text format
+        """
+
+        text = render().decode('utf-8')
+
+        self.assertIn('# TYPE sec_requests_total counter', text)
+        self.assertIn('# TYPE sec_request_seconds histogram', text)
+        self.assertIn('# TYPE ratelimit_queue_depth gauge', text)
+
+    def test_collector(self):
+        """
+        Test collectors update gauges before rendering
+        """
+
+        calls = []
+        add_collector(lambda: calls.append(1))
+
+        text = render().decode('utf-8')
+
+        self.assertEqual(len(calls), 1)
+        self.assertIn('form4_parsed_cache{stat="size"}', text)
+
+    def test_multiprocess(self):
+        """
+        Test the metrics of all worker processes are aggregated
+        """
+
+        worker = 'from tracker.parser.instrumentation import record_cache_hit\n' \
+                 'record_cache_hit("document", "disk")\n'
+        scrape = 'import sys\n' \
+                 'from tracker.utils.metrics import render\n' \
+                 'sys.stdout.write(render().decode("utf-8"))\n'
+
+        with tempfile.TemporaryDirectory() as path:
+            env = {**os.environ, 'PROMETHEUS_MULTIPROC_DIR': path}
+
+            for _ in range(2):
+                subprocess.run([sys.executable, '-c', worker], env=env, cwd=PROJECT_PATH,
+                               check=True, capture_output=True)
+
+            text = subprocess.run([sys.executable, '-c', scrape], env=env, cwd=PROJECT_PATH,
+                                  check=True, capture_output=True, text=True).stdout
+
+        self.assertIn('sec_cache_hits_total{cache="disk",endpoint="document"} 2.0', text)
+
+    def test_get_endpoint(self):
+        """
+        Test SEC endpoint classification
+        """
+
+        data = 'https://www.sec.gov/Archives/edgar/data/19617/000122520822011506/'
+        urls = {
+            'https://www.sec.gov/cgi-bin/browse-edgar?action=getcurrent&output=atom&start=100':
+                'atom',
+            data + '0001225208-22-011506-index.htm': 'index',
+            data + 'xslF345X03/doc4.xml': 'document',
+            'https://efts.sec.gov/LATEST/search-index': 'fts',
+            'https://www.sec.gov/Archives/edgar/cik-lookup-data.txt': 'cik',
+            'https://www.sec.gov/': 'other',
+        }
+
+        for url, endpoint in urls.items():
+            self.assertEqual(get_endpoint(url), endpoint, url)
+
+    def test_sec_parser(self):
+        """
+        Test SECParser records requests, status codes and bytes
+        """
+
+        def route(_):
+            return 200, {'Content-Type': 'text/plain'}, b'0123456789'
+
+        with local_server(route) as url:
+            requests = get_value('sec_requests_total', endpoint='other', status=200)
+            downloaded = get_value('sec_response_bytes_total', endpoint='other')
+
+            SECParser('Metrics', url).get_webpage()
+
+        self.assertEqual(get_value('sec_requests_total', endpoint='other', status=200),
+                         requests + 1)
+        self.assertEqual(get_value('sec_response_bytes_total', endpoint='other'),
+                         downloaded + 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,10 +2,22 @@
 Test RateLimit
 """
 
+import asyncio
+import multiprocessing
+import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from time import time, sleep
 
-from tracker.utils.ratelimit import RateLimit, RateLimitException
+import requests
+
+from tracker.utils.ratelimit import RateLimit, RateLimitException, TokenBucket, \
+    SharedTokenBucket, AsyncRateLimit, get_bucket_key, priority, get_priority, \
+    BACKGROUND, INTERACTIVE, AdaptiveRate
+from tracker.utils.clock import VirtualClock, use_clock
+from tracker.parser.sec import SEC_RATE, sec_bucket
+from tracker.utils.metrics import get_value
 
 
 class RateLimitTests(unittest.TestCase):
@@ -92,6 +104,527 @@ class RateLimitTests(unittest.TestCase):
 
         self.assertAlmostEqual(7.5, end_time - start_time, delta=1)
 
+    def test_threads(self):
+        """
+        Test ratelimiting callers from multiple threads
+        """
+
+        call_times = []
+
+        @RateLimit(limit=10, period=1, max_wait=None)
+        def test_func(a: int) -> int:
+            call_times.append(time())
+            return a
+
+        start_time = time()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(test_func, range(30)))
+        end_time = time()
+
+        self.assertListEqual(results, list(range(30)))
+
+        # 10 calls immediately, then 10 more after ~1s and ~2s => ~2s total
+        self.assertAlmostEqual(2, end_time - start_time, delta=0.3)
+
+        # No more than 10 calls in any 1s window
+        call_times.sort()
+        for i in range(10, len(call_times)):
+            self.assertGreaterEqual(call_times[i] - call_times[i - 10], 0.99)
+
+
+class TokenBucketTests(unittest.TestCase):
+    """
+    Test TokenBucket
+    """
+
+    def test_shared(self):
+        """
+        Test functions sharing a bucket stay within its combined rate
+        """
+
+        bucket = TokenBucket(rate=10, capacity=1)
+        call_times = []
+
+        @RateLimit(limit=9, period=1, max_wait=None, bucket=bucket)
+        def test_func_1(a: int) -> int:
+            call_times.append(time())
+            return a
+
+        @RateLimit(limit=2, period=1, max_wait=None, bucket=bucket)
+        def test_func_2(a: int) -> int:
+            call_times.append(time())
+            return a
+
+        start_time = time()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(test_func_1, i) for i in range(16)]
+            futures += [executor.submit(test_func_2, i) for i in range(4)]
+            results = [future.result() for future in futures]
+        end_time = time()
+
+        self.assertListEqual(results, list(range(16)) + list(range(4)))
+
+        # 20 calls at 10/s with a burst of 1 => ~1.9s
+        self.assertAlmostEqual(1.9, end_time - start_time, delta=0.3)
+
+        # No more than 11 calls in any 1s window (rate + capacity)
+        call_times.sort()
+        for i in range(11, len(call_times)):
+            self.assertGreaterEqual(call_times[i] - call_times[i - 11], 0.99)
+
+    def test_weight(self):
+        """
+        Test weighted calls take more tokens
+        """
+
+        bucket = TokenBucket(rate=10, capacity=1)
+
+        @RateLimit(limit=100, period=1, max_wait=None, bucket=bucket, weight=5)
+        def test_func(a: int) -> int:
+            return a
+
+        start_time = time()
+        for i in range(3):
+            test_func(i)
+        end_time = time()
+
+        # Each call takes the full bucket and leaves a debt of 4 tokens.
+        # The next call waits for 5 tokens at 10/s => ~0.5s each => ~1s total
+        self.assertAlmostEqual(1, end_time - start_time, delta=0.15)
+
+    def test_max_wait(self):
+        """
+        Test RateLimitException is raised instead of waiting longer than max_wait
+        """
+
+        bucket = TokenBucket(rate=1, capacity=1)
+
+        @RateLimit(limit=100, period=1, max_wait=0.5, bucket=bucket)
+        def test_func(a: int) -> int:
+            return a
+
+        self.assertEqual(test_func(0), 0)
+        with self.assertRaises(RateLimitException):
+            test_func(1)
+
+        # The failed call did not take tokens
+        self.assertAlmostEqual(bucket.acquire(1), 1, delta=0.1)
+
+    def test_priority(self):
+        """
+        Test interactive callers pass waiting background callers
+        """
+
+        bucket = TokenBucket(rate=10, capacity=1)
+        call_times = {}
+
+        @RateLimit(limit=100, period=1, max_wait=None, bucket=bucket)
+        def test_func(a: str) -> str:
+            call_times[a] = time()
+            return a
+
+        def background(a: str) -> str:
+            with priority(BACKGROUND):
+                self.assertEqual(get_priority(), BACKGROUND)
+                return test_func(a)
+
+        start_time = time()
+        with ThreadPoolExecutor(max_workers=21) as executor:
+            futures = [executor.submit(background, f'background-{i}') for i in range(20)]
+
+            # Wait until the background callers are queued
+            sleep(0.3)
+            self.assertGreater(get_value('ratelimit_queue_depth', priority=BACKGROUND), 10)
+
+            interactive = executor.submit(test_func, 'interactive')
+            self.assertEqual(interactive.result(), 'interactive')
+            interactive_time = time()
+
+            for future in futures:
+                future.result()
+
+        # The interactive call took the next token instead of waiting behind ~17 calls
+        self.assertLess(interactive_time - start_time, 0.6)
+        self.assertLess(sum(t < call_times['interactive'] for t in call_times.values()), 6)
+        self.assertEqual(get_value('ratelimit_queue_depth', priority=BACKGROUND), 0)
+
+        with self.assertRaises(ValueError):
+            with priority('urgent'):
+                pass
+
+    def test_get_bucket_key(self):
+        """
+        Test SEC hosts share one bucket key
+        """
+
+        self.assertEqual(get_bucket_key('https://www.sec.gov/Archives/edgar/data/'), 'sec.gov')
+        self.assertEqual(get_bucket_key('https://efts.sec.gov/LATEST/search-index'), 'sec.gov')
+        self.assertEqual(get_bucket_key('http://127.0.0.1:8010/cgi-bin/'), '127.0.0.1')
+
+
+class SECPriorityTests(unittest.TestCase):
+    """
+    Test priorities with the SEC configuration (window limit equal to the bucket rate)
+    """
+
+    def test_sync(self):
+        """
+        Test an interactive call passes 30 background calls queued on the SEC bucket
+        """
+
+        @RateLimit(limit=SEC_RATE, period=1, max_wait=None, bucket=sec_bucket)
+        def test_func(a: str) -> str:
+            return a
+
+        def background(a: str) -> str:
+            with priority(BACKGROUND):
+                return test_func(a)
+
+        with ThreadPoolExecutor(max_workers=31) as executor:
+            futures = [executor.submit(background, f'background-{i}') for i in range(30)]
+            sleep(0.3)
+
+            start_time = time()
+            self.assertEqual(executor.submit(test_func, 'interactive').result(), 'interactive')
+            interactive_wait = time() - start_time
+
+            for future in futures:
+                future.result()
+
+        # One token (~0.11s) instead of ~3s behind the background calls
+        self.assertLess(interactive_wait, 0.5)
+
+    def test_async(self):
+        """
+        Test an interactive coroutine passes 30 background coroutines queued on the SEC bucket
+        """
+
+        @AsyncRateLimit(limit=SEC_RATE, period=1, max_wait=None, bucket=sec_bucket)
+        async def test_func(a: str) -> str:
+            return a
+
+        async def background(a: str) -> str:
+            with priority(BACKGROUND):
+                return await test_func(a)
+
+        async def run() -> float:
+            tasks = [asyncio.create_task(background(f'background-{i}')) for i in range(30)]
+            await asyncio.sleep(0.3)
+
+            start_time = time()
+            await test_func('interactive')
+            interactive_wait = time() - start_time
+
+            await asyncio.gather(*tasks)
+            return interactive_wait
+
+        self.assertLess(asyncio.run(run()), 0.5)
+
+
+class AsyncRateLimitTests(unittest.TestCase):
+    """
+    Test AsyncRateLimit
+    """
+
+    def test_basic(self):
+        """
+        Test coroutines are rate limited without blocking the event loop
+        """
+
+        call_times = []
+        ticks = []
+
+        @AsyncRateLimit(limit=10, period=1, max_wait=None)
+        async def test_func(a: int) -> int:
+            call_times.append(time())
+            return a
+
+        async def ticker():
+            for _ in range(10):
+                ticks.append(time())
+                await asyncio.sleep(0.1)
+
+        async def run():
+            results = await asyncio.gather(*[test_func(i) for i in range(25)], ticker())
+            return results[:-1]
+
+        start_time = time()
+        results = asyncio.run(run())
+        end_time = time()
+
+        self.assertListEqual(results, list(range(25)))
+
+        # 10 calls immediately, then 10 more after ~1s and 5 after ~2s => ~2s total
+        self.assertAlmostEqual(2, end_time - start_time, delta=0.2)
+
+        # No more than 10 calls in any 1s window
+        call_times.sort()
+        for i in range(10, len(call_times)):
+            self.assertGreaterEqual(call_times[i] - call_times[i - 10], 0.99)
+
+        # The ticker kept running while the calls waited
+        self.assertEqual(len(ticks), 10)
+        self.assertLess(ticks[-1] - start_time, 1.2)
+
+    def test_max_wait(self):
+        """
+        Test RateLimitException is raised when the wait is longer than max_wait
+        """
+
+        @AsyncRateLimit(limit=2, period=2, max_wait=1)
+        async def test_func(a: int) -> int:
+            return a
+
+        async def run():
+            return await asyncio.gather(*[test_func(i) for i in range(3)],
+                                        return_exceptions=True)
+
+        results = asyncio.run(run())
+
+        self.assertListEqual(results[:2], [0, 1])
+        self.assertIsInstance(results[2], RateLimitException)
+
+    def test_bucket(self):
+        """
+        Test coroutines draw from a shared bucket
+        """
+
+        bucket = TokenBucket(rate=10, capacity=1)
+
+        @AsyncRateLimit(limit=100, period=1, max_wait=None, bucket=bucket)
+        async def test_func(a: int) -> int:
+            return a
+
+        async def run():
+            return await asyncio.gather(*[test_func(i) for i in range(10)])
+
+        start_time = time()
+        self.assertListEqual(asyncio.run(run()), list(range(10)))
+
+        # 10 calls at 10/s with a burst of 1 => ~0.9s
+        self.assertAlmostEqual(0.9, time() - start_time, delta=0.15)
+
+
+def _response(status_code: int, content: bytes = b'') -> requests.Response:
+    """
+    Build a response object
+    """
+
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content  # pylint: disable=protected-access
+    return response
+
+
+class AdaptiveRateTests(unittest.TestCase):
+    """
+    Test AdaptiveRate
+    """
+
+    def test_decrease(self):
+        """
+        Test throttled and slow responses decrease the rate once per cooldown
+        """
+
+        adaptive = AdaptiveRate(TokenBucket(rate=8), name='test', cooldown=0.2)
+
+        self.assertEqual(adaptive.record(_response(429), 0.1), 4)
+
+        # Other requests in flight get the same answer within the cooldown
+        self.assertEqual(adaptive.record(_response(429), 0.1), 4)
+
+        sleep(0.2)
+        page = b'<h1>Your Request Originates from an Undeclared Automated Tool</h1>'
+        self.assertEqual(adaptive.record(_response(403, page), 0.1), 2)
+
+        sleep(0.2)
+        self.assertEqual(adaptive.record(_response(200), 10), 1)
+
+        # Not below the floor. Not every 403 is throttling.
+        sleep(0.2)
+        self.assertEqual(adaptive.record(_response(429), 0.1), 1)
+        self.assertFalse(adaptive.is_throttled(_response(403, b'Forbidden')))
+
+        self.assertEqual(adaptive.bucket.rate, 1)
+
+    def test_increase(self):
+        """
+        Test good responses recover the rate additively up to the ceiling
+        """
+
+        adaptive = AdaptiveRate(TokenBucket(rate=2), name='test', increase=1, cooldown=0.1)
+        adaptive.record(_response(429), 0.1)
+        self.assertEqual(adaptive.rate, 1)
+
+        # No increase during the cooldown
+        adaptive.record(_response(200), 0.1)
+        self.assertEqual(adaptive.rate, 1)
+
+        sleep(0.1)
+        for _ in range(10):
+            sleep(0.1)
+            adaptive.record(_response(200), 0.1)
+
+        # ~1 request/s per second for ~1s, capped at the ceiling
+        self.assertEqual(adaptive.rate, 2)
+
+    def test_ratelimit(self):
+        """
+        Test RateLimit feeds responses to AdaptiveRate
+        """
+
+        bucket = TokenBucket(rate=10)
+        adaptive = AdaptiveRate(bucket, name='test')
+
+        @RateLimit(limit=10, period=1, max_wait=None, bucket=bucket, adaptive=adaptive)
+        def test_func(status: int) -> requests.Response:
+            return _response(status)
+
+        self.assertEqual(test_func(429).status_code, 429)
+        self.assertEqual(bucket.rate, 5)
+
+
+class VirtualClockTests(unittest.TestCase):
+    """
+    Test RateLimit and TokenBucket under a VirtualClock
+    """
+
+    def test_ratelimit(self):
+        """
+        Test an hour of rate limited calls is simulated without waiting
+        """
+
+        clock = VirtualClock()
+
+        @RateLimit(limit=10, period=1, max_wait=None, clock=clock)
+        def test_func(a: int) -> int:
+            return a
+
+        start_time = time()
+        for i in range(36000):
+            self.assertEqual(test_func(i), i)
+
+        # 10 calls per second => ~3600s simulated in well under a few seconds
+        self.assertAlmostEqual(3600, clock.elapsed, delta=2)
+        self.assertLess(time() - start_time, 5)
+
+    def test_trading_day(self):
+        """
+        Test a trading day of polling with background backfill uses the whole budget
+        """
+
+        with use_clock(VirtualClock()) as clock:
+            bucket = TokenBucket(rate=9, capacity=1)
+
+            @RateLimit(limit=100, period=1, max_wait=None, bucket=bucket)
+            def fetch() -> None:
+                pass
+
+            calls = {INTERACTIVE: 0, BACKGROUND: 0}
+            next_poll = clock.time()
+            end = clock.time() + 6.5 * 60 * 60
+
+            # Poll 3 pages every minute. Backfill with the leftover capacity.
+            while clock.time() < end:
+                if clock.time() >= next_poll:
+                    for _ in range(3):
+                        fetch()
+                        calls[INTERACTIVE] += 1
+                    next_poll += 60
+                else:
+                    with priority(BACKGROUND):
+                        fetch()
+                        calls[BACKGROUND] += 1
+
+        # Every poll was made and the budget was fully used without exceeding it
+        self.assertEqual(calls[INTERACTIVE], 3 * 390)
+        self.assertAlmostEqual(sum(calls.values()) / (6.5 * 60 * 60), 9, delta=0.01)
+
+
+def _call_shared_bucket(path: str, calls: int, queue: multiprocessing.Queue) -> None:
+    """
+    Call a function rate limited by a SharedTokenBucket from another process
+
+    :param path: Bucket state file
+    :param calls: Number of calls
+    :param queue: Queue to put the call times on
+    """
+
+    @RateLimit(limit=100, period=1, max_wait=None, bucket=SharedTokenBucket(path, rate=10))
+    def test_func() -> float:
+        return time()
+
+    for _ in range(calls):
+        queue.put(test_func())
+
+
+class SharedTokenBucketTests(unittest.TestCase):
+    """
+    Test SharedTokenBucket
+    """
+
+    def test_processes(self):
+        """
+        Test processes sharing a bucket file stay within its combined rate
+        """
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = str(Path(directory).joinpath('test.bucket'))
+
+            context = multiprocessing.get_context()
+            queue = context.Queue()
+            processes = [context.Process(target=_call_shared_bucket, args=(path, 6, queue))
+                         for _ in range(3)]
+
+            start_time = time()
+            for process in processes:
+                process.start()
+            call_times = sorted(queue.get(timeout=10) for _ in range(18))
+            for process in processes:
+                process.join()
+
+        # 18 calls at 10/s combined with a burst of 1 => ~1.7s
+        self.assertAlmostEqual(1.7, call_times[-1] - start_time, delta=0.5)
+
+        # No more than 11 calls in any 1s window (rate + capacity)
+        for i in range(11, len(call_times)):
+            self.assertGreaterEqual(call_times[i] - call_times[i - 11], 0.99)
+
+    def test_state(self):
+        """
+        Test bucket state is persisted in the file
+        """
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory).joinpath('test.bucket')
+
+            SharedTokenBucket(path, rate=10).acquire(3)
+
+            # A new bucket on the same file sees the debt of the heavy call
+            self.assertAlmostEqual(SharedTokenBucket(path, rate=10).acquire(1), 0.3, delta=0.1)
+
+    def test_adaptive(self):
+        """
+        Test a backoff in one process applies to every process sharing the bucket
+        """
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory).joinpath('test.bucket')
+
+            # One bucket and adaptive rate per worker process
+            worker_1 = AdaptiveRate(SharedTokenBucket(path, rate=8), name='test', cooldown=10)
+            worker_2 = AdaptiveRate(SharedTokenBucket(path, rate=8), name='test', cooldown=10)
+
+            self.assertEqual(worker_1.record(_response(429), 0.1), 4)
+
+            # The other worker refills at the backed off rate. Its 429 is in the cooldown.
+            self.assertEqual(worker_2.record(_response(429), 0.1), 4)
+            worker_2.bucket.acquire(1)
+            self.assertAlmostEqual(worker_2.bucket.acquire(1), 0.25, delta=0.05)
+
+            # No increase during the shared cooldown
+            self.assertEqual(worker_2.record(_response(200), 0.1), 4)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,193 @@
+"""
+Test Retry
+"""
+
+import asyncio
+import unittest
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from time import time
+
+import requests
+
+from tests.helpers import local_server, reset_sec_rate
+from tracker.parser import SECParser
+from tracker.utils.ratelimit import RateLimit
+from tracker.utils.clock import VirtualClock
+from tracker.utils.retry import Retry, get_retry_after
+
+
+def _response(status_code: int, headers: dict | None = None) -> requests.Response:
+    """
+    Build a response object
+    """
+
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response._content_consumed = True  # pylint: disable=protected-access
+    return response
+
+
+class RetryTests(unittest.TestCase):
+    """
+    Test Retry
+    """
+
+    def setUp(self):
+        reset_sec_rate()
+
+    def tearDown(self):
+        reset_sec_rate()
+
+    def test_retry(self):
+        """
+        Test retrying transient errors until success
+        """
+
+        statuses = [429, 503, 200]
+
+        @Retry(retries=4, backoff=0.01)
+        def test_func() -> requests.Response:
+            return _response(statuses.pop(0))
+
+        self.assertEqual(test_func().status_code, 200)
+        self.assertListEqual(statuses, [])
+
+    def test_async(self):
+        """
+        Test retrying a coroutine function
+        """
+
+        statuses = [429, 503, 200]
+
+        @Retry(retries=4, backoff=0.01)
+        async def test_func() -> requests.Response:
+            return _response(statuses.pop(0))
+
+        self.assertEqual(asyncio.run(test_func()).status_code, 200)
+        self.assertListEqual(statuses, [])
+
+    def test_virtual_clock(self):
+        """
+        Test the backoff sleeps on the injected clock
+        """
+
+        clock = VirtualClock()
+
+        @Retry(retries=3, backoff=10, max_backoff=60, clock=clock)
+        def test_func() -> requests.Response:
+            return _response(429, {'Retry-After': '30'})
+
+        start_time = time()
+        self.assertEqual(test_func().status_code, 429)
+
+        # 3 retries after 30s each, simulated instantly
+        self.assertAlmostEqual(clock.elapsed, 90)
+        self.assertLess(time() - start_time, 1)
+
+    def test_max_retries(self):
+        """
+        Test the last response is returned after all retries
+        """
+
+        calls = []
+
+        @Retry(retries=2, backoff=0.01)
+        def test_func() -> requests.Response:
+            calls.append(1)
+            return _response(503)
+
+        self.assertEqual(test_func().status_code, 503)
+        self.assertEqual(len(calls), 3)
+
+        # Not retried
+        @Retry(retries=2, backoff=0.01)
+        def test_func_404() -> requests.Response:
+            calls.append(1)
+            return _response(404)
+
+        self.assertEqual(test_func_404().status_code, 404)
+        self.assertEqual(len(calls), 4)
+
+    def test_connection_error(self):
+        """
+        Test retrying connection errors
+        """
+
+        errors = [requests.ConnectionError(), requests.Timeout()]
+
+        @Retry(retries=2, backoff=0.01)
+        def test_func() -> requests.Response:
+            if errors:
+                raise errors.pop(0)
+            return _response(200)
+
+        self.assertEqual(test_func().status_code, 200)
+
+        @Retry(retries=1, backoff=0.01)
+        def test_func_fail() -> requests.Response:
+            raise requests.ConnectionError()
+
+        with self.assertRaises(requests.ConnectionError):
+            test_func_fail()
+
+    def test_delay(self):
+        """
+        Test backoff delays and Retry-After
+        """
+
+        retry = Retry(backoff=1, max_backoff=5)
+
+        for attempt in range(6):
+            self.assertLessEqual(retry.get_delay(attempt), min(5, 2 ** attempt))
+
+        self.assertEqual(retry.get_delay(0, _response(429, {'Retry-After': '3'})), 3)
+        self.assertEqual(retry.get_delay(0, _response(429, {'Retry-After': '600'})), 5)
+
+        retry_dt = datetime.now(timezone.utc) + timedelta(seconds=60)
+        retry_after = get_retry_after(_response(429, {'Retry-After': format_datetime(retry_dt)}))
+        self.assertAlmostEqual(retry_after, 60, delta=2)
+
+        self.assertIsNone(get_retry_after(_response(429, {'Retry-After': 'invalid'})))
+        self.assertIsNone(get_retry_after(_response(429)))
+
+    def test_ratelimit(self):
+        """
+        Test every retry takes a slot from the rate limit
+        """
+
+        calls = []
+
+        @Retry(retries=5, backoff=0)
+        @RateLimit(limit=2, period=1, max_wait=None)
+        def test_func() -> requests.Response:
+            calls.append(time())
+            return _response(429 if len(calls) < 4 else 200)
+
+        start_time = time()
+        self.assertEqual(test_func().status_code, 200)
+
+        # 4 attempts at 2 per second => ~1s
+        self.assertEqual(len(calls), 4)
+        self.assertAlmostEqual(1, time() - start_time, delta=0.2)
+
+    def test_sec_parser(self):
+        """
+        Test SECParser retries throttled requests
+        """
+
+        statuses = [429, 503]
+
+        def route(_):
+            if statuses:
+                return statuses.pop(0), {'Retry-After': '0'}, b'Slow down'
+            return 200, {'Content-Type': 'text/plain'}, b'OK'
+
+        with local_server(route) as url:
+            parser = SECParser('Retry', url)
+            self.assertEqual(parser.get_webpage(), 'OK')
+
+
+if __name__ == '__main__':
+    unittest.main()
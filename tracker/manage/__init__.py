@@ -2,4 +2,4 @@
 tracker.manage
 """
 
-from tracker.manage.latest_insider_trades import LatestInsiderTrades
+from tracker.manage.latest_insider_trades import LatestInsiderTrades, parse_filing
@@ -2,13 +2,28 @@
 Latest Insider Trades Tracker Module
 """
 
+import asyncio
+import threading
 from pathlib import Path
+from typing import Iterable
 
 import pandas as pd
 
 from defs import DATA_DIR_PATH
-from tracker.parser import Form4Parser, SECFilingParser
+from tracker.parser import Form4Parser, SECFilingParser, form4_parsed_cache
+from tracker.parser.sec import gather_bounded
 from tracker.screener import SECFilingsScreener
+from tracker.screener.sec_filings_poller import SECFilingsPoller
+from tracker.utils.ratelimit import priority, BACKGROUND
+
+# Form 4 sections of the trades list. Derivative tables and footnotes are only parsed on demand.
+LISTING_SECTIONS: tuple[str, ...] = ('issuer', 'owner', 'non_derivative')
+
+# Form 4 sections of a full parse (Form4Parser.parse() without sections)
+FULL_SECTIONS: tuple[str, ...] = ('issuer', 'owner', 'non_derivative', 'derivative')
+
+# Lock to merge parsed sections into the cached filings
+_cache_lock: threading.Lock = threading.Lock()
 
 
 class LatestInsiderTrades:
@@ -28,6 +43,9 @@ class LatestInsiderTrades:
                                            form="4",
                                            count=100)
 
+        # Only get the filings newer than the last poll. Keeps the newest 100 filings.
+        self.poller = SECFilingsPoller(self.screener, size=100)
+
         # Cached Data
         self.latest_filings: pd.DataFrame | None = None
 
@@ -36,8 +54,9 @@ class LatestInsiderTrades:
         Get the latest insider trades filings.
         """
 
-        # Get the latest filings
-        latest_filings = self.screener.get_filings()
+        # Get the new filings and the previous ones from the poller ring
+        self.poller.poll()
+        latest_filings = self.poller.filings
 
         # Cache the latest filings
         self.latest_filings = latest_filings
@@ -45,12 +64,15 @@ class LatestInsiderTrades:
         # Return the latest trades
         return latest_filings
 
-    def parse_filings(self, filings: pd.DataFrame | None = None) -> pd.DataFrame:
+    def parse_filings(self,
+                      filings: pd.DataFrame | None = None,
+                      sections: Iterable[str] = LISTING_SECTIONS) -> pd.DataFrame:
         """
         Parse filings to get trade data.
 
         :param filings: Filings DataFrame. If None, uses the latest filings.
-        :return: Trades DataFrame. cols = ['issuer', 'owner', 'non_derivative', 'derivative']
+        :param sections: Form 4 sections to parse. See Form4Parser.parse().
+        :return: Trades DataFrame. cols = sections (default ['issuer', 'owner', 'non_derivative'])
         """
 
         # Get the latest filings if filings is None
@@ -59,28 +81,84 @@ class LatestInsiderTrades:
                 else self.get_latest_filings()
 
         # Initialize parsed filings DataFrame
-        df = pd.DataFrame(columns=['issuer', 'owner', 'non_derivative', 'derivative'])
+        sections = list(sections)
+        df = pd.DataFrame(columns=sections)
+
+        # Parse all filings concurrently. Requests still share the SEC rate limit.
+        # Bulk parsing only uses the capacity interactive requests leave unused.
+        with priority(BACKGROUND):
+            parsed_rows = asyncio.run(
+                gather_bounded([aparse_trade(row, sections) for _, row in filings.iterrows()]))
 
         # Iterate through each row
-        for index, row in filings.iterrows():
-            parsed_row = parse_trade(row)
+        for index, parsed_row in zip(filings.index, parsed_rows):
 
             # Rarely, the trade data is not available for a given filing.
             if parsed_row is not None:
                 # Create a new row from parsed row data
-                df.loc[index] = [parsed_row['issuer'],
-                                 parsed_row['owner'],
-                                 parsed_row['non_derivative'],
-                                 parsed_row['derivative']]
+                df.loc[index] = [parsed_row[section] for section in sections]
 
         return df
 
 
-def parse_trade(trade: pd.Series) -> dict[str, pd.DataFrame | None] | None:
+def parse_trade(trade: pd.Series,
+                sections: list[str] | None = None) -> dict[str, pd.DataFrame | None] | None:
     """
     Parse a trade.
 
     :param trade: Trade data row from the SEC filings.
+    :param sections: Form 4 sections to parse. Defaults to all of them.
+    :return: Parsed trade. None if trade data is not available.
+    """
+
+    return parse_filing(trade.name, trade['link'], sections)
+
+
+def parse_filing(acc_no: str,
+                 filing_link: str,
+                 sections: list[str] | None = None) -> dict[str, pd.DataFrame | None] | None:
+    """
+    Parse a Form 4 filing.
+
+    :param acc_no: Filing Accession Number.
+    :param filing_link: Filing index page URL.
+    :param sections: Form 4 sections to parse. Defaults to all of them. See Form4Parser.parse().
+    :return: Parsed filing. None if trade data is not available.
+
+    Notes
+    -----
+    Parsed sections are cached in form4_parsed_cache, merged by accession number,
+    so each section of a filing is parsed at most once. Only the sections not cached
+    yet are parsed. Do not modify the returned DataFrames.
+    """
+
+    # Check if the filing sections are already parsed
+    trade_data, missing = _get_cached(acc_no, sections)
+    if trade_data is not None:
+        return trade_data
+
+    # Parse Filing
+    filing_parser = SECFilingParser(f'{acc_no}', filing_link)
+    doc_url = filing_parser.get_document_url(prefer_xml=True)
+
+    if doc_url is None:
+        return None
+
+    # Parse the missing sections of the form
+    form_parser = Form4Parser(f'{acc_no}', doc_url)
+
+    # Cache parsed sections
+    return _put_cached(acc_no, sections, form_parser.parse(missing))
+
+
+async def aparse_trade(trade: pd.Series,
+                       sections: list[str] | None = None
+                       ) -> dict[str, pd.DataFrame | None] | None:
+    """
+    Parse a trade without blocking the event loop while downloading.
+
+    :param trade: Trade data row from the SEC filings.
+    :param sections: Form 4 sections to parse. Defaults to all of them.
     :return: Parsed trade. None if trade data is not available.
     """
 
@@ -88,15 +166,62 @@ def parse_trade(trade: pd.Series) -> dict[str, pd.DataFrame | None] | None:
     acc_no = trade.name
     filing_link = trade['link']
 
+    # Check if the filing sections are already parsed
+    trade_data, missing = _get_cached(acc_no, sections)
+    if trade_data is not None:
+        return trade_data
+
     # Parse Filing
     filing_parser = SECFilingParser(f'{acc_no}', filing_link)
+    await filing_parser.aget_content()
     doc_url = filing_parser.get_document_url(prefer_xml=True)
 
     if doc_url is None:
         return None
 
-    # Parse Form
+    # Parse the missing sections of the form
     form_parser = Form4Parser(f'{acc_no}', doc_url)
-    trade_data = form_parser.parse()
+    await form_parser.aget_content()
+
+    # Cache parsed sections
+    return _put_cached(acc_no, sections, form_parser.parse(missing))
+
+
+def _get_cached(acc_no: str,
+                sections: list[str] | None) -> tuple[dict[str, pd.DataFrame | None] | None,
+                                                     list[str]]:
+    """
+    Get the sections of a parsed filing from form4_parsed_cache
+
+    :param acc_no: Filing Accession Number.
+    :param sections: Form 4 sections. None for the full parse.
+    :return: (Cached filing sections or None if any is missing, sections not cached yet)
+    """
+
+    sections = list(FULL_SECTIONS if sections is None else sections)
+    cached = form4_parsed_cache.get(acc_no, {})
+
+    if missing := [section for section in sections if section not in cached]:
+        return None, missing
+
+    return {section: cached[section] for section in sections}, []
+
+
+def _put_cached(acc_no: str,
+                sections: list[str] | None,
+                parsed: dict) -> dict[str, pd.DataFrame | None]:
+    """
+    Merge parsed sections into the cached filing in form4_parsed_cache
+
+    :param acc_no: Filing Accession Number.
+    :param sections: Requested Form 4 sections. None for the full parse.
+    :param parsed: Newly parsed sections. See Form4Parser.parse().
+    :return: Filing sections
+    """
+
+    with _cache_lock:
+        trade_data = {**form4_parsed_cache.peek(acc_no, {}), **parsed}
+        form4_parsed_cache.put(acc_no, trade_data)
 
-    return trade_data
+    return {section: trade_data[section]
+            for section in (FULL_SECTIONS if sections is None else sections)}
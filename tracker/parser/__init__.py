@@ -15,5 +15,6 @@ from tracker.parser.form_3 import Form3Parser
 
 from tracker.parser.form_4 import Form4Parser
 from tracker.parser.form_4 import transaction_codes as form4_transaction_codes
+from tracker.parser.form_4 import parsed_cache as form4_parsed_cache
 
 from tracker.parser.form_5 import Form5Parser
@@ -5,6 +5,7 @@ https://www.sec.gov/edgar/search/#/
 
 import json
 import logging
+from time import perf_counter
 
 import pandas as pd
 import requests
@@ -12,7 +13,10 @@ import requests
 from baseurls import SEC_EDGAR_FTS
 from common import Logger
 from tracker.utils.ratelimit import RateLimit
-from .sec import SECParser
+from tracker.utils.retry import Retry
+from .instrumentation import FTS, record_error, record_response
+from .sec import SECParser, sec_adaptive, sec_bucket
+from .session import get_sec_headers, get_session
 from .webpage_parser import ResponseError
 
 # Define Edgar Logger
@@ -48,7 +52,6 @@ class EdgarParser(SECParser):
         if hasattr(self, 'url'):
             delattr(self, 'url')
 
-    @RateLimit(limit=2, period=1, max_wait=15, logger=logger)
     def get_webpage(self, *args, **kwargs) -> dict:
         """
         Get the search results data
@@ -59,18 +62,8 @@ class EdgarParser(SECParser):
         The EDGAR Full Text Search uses a POST request with filters to get response with results
         """
 
-        # Build Header
-        headers: dict = {
-            'User-Agent': self._get_user_agent()
-        }
-
-        # Build Payload and remove None valued items
-        payload: dict = {k: v for k, v in self.filters.items() if v is not None}
-
         # Post and Get response
-        response = requests.post(url=SEC_EDGAR_FTS,
-                                 json=payload,
-                                 headers=headers)
+        response = self._send()
 
         # Check if response is successful
         if response.status_code != 200:
@@ -79,13 +72,41 @@ class EdgarParser(SECParser):
             raise ResponseError(message=error_msg, response=response)
 
         # Get data from response
-        return_data: dict = json.loads(response.text)
+        return_data: dict = json.loads(response.content)
 
         # Cache return data
         self.webpage = return_data
 
         return return_data
 
+    @Retry(logger=logger)
+    @RateLimit(limit=2, period=1, max_wait=15, logger=logger, bucket=sec_bucket,
+               adaptive=sec_adaptive)
+    def _send(self, headers: dict | None = None, stream: bool = False) -> requests.Response:
+        """
+        Post the search filters through the shared pooled session
+
+        :param headers: Additional HTTP headers
+        :param stream: Do not download the response body until it is iterated
+        :return: Response object
+        """
+
+        # Build Payload and remove None valued items
+        payload: dict = {k: v for k, v in self.filters.items() if v is not None}
+
+        start = perf_counter()
+
+        try:
+            response = get_session().post(url=SEC_EDGAR_FTS, json=payload,
+                                          headers=get_sec_headers(headers), stream=stream)
+        except requests.RequestException as error:
+            record_error(FTS, error, perf_counter() - start)
+            raise
+
+        record_response(FTS, response, perf_counter() - start, stream=stream)
+
+        return response
+
     # pylint: disable=trailing-whitespace
     def parse(self, force_refresh: bool = True) -> pd.DataFrame:
         """
@@ -2,13 +2,19 @@
 Form 4 Parser Class File
 """
 
-from xml.etree import ElementTree
+from typing import Iterable
 
 import numpy as np
 import pandas as pd
+# pylint: disable=c-extension-no-member
+# lxml.etree does have '_Element' class
 from lxml import etree
+from prometheus_client import Gauge
 
-from .sec import SECParser
+from tracker.utils.lru_cache import LRUCache
+from tracker.utils.metrics import add_collector
+from .sec import SECParser, logger
+from .xml_parser import parse_xml
 
 # Global Variables and Caches
 transaction_codes: dict = {
@@ -38,6 +44,352 @@ transaction_codes: dict = {
 }
 
 
+def _get_parsed_size(parsed: dict) -> int:
+    """
+    Get the memory size of Form4Parser.parse() output
+
+    :param parsed: Form4Parser.parse() output
+    :return: Size in bytes
+    """
+
+    return sum(int(df.memory_usage(deep=True).sum())
+               for df in parsed.values() if isinstance(df, pd.DataFrame))
+
+
+# Parsed Form 4 results keyed by accession number. Shared by the manager and the Dash app.
+parsed_cache: LRUCache = LRUCache(max_size=64 * 1024 * 1024, sizeof=_get_parsed_size)
+
+
+# Parsed Form 4 cache statistics, summed over the live workers
+parsed_cache_gauge = Gauge('form4_parsed_cache', 'Parsed Form 4 cache statistics', ['stat'],
+                           multiprocess_mode='livesum')
+
+
+def _collect_parsed_cache_stats() -> None:
+    """
+    Update the parsed Form 4 cache gauges from the cache stats
+    """
+
+    for stat, value in parsed_cache.stats().items():
+        parsed_cache_gauge.labels(stat=stat).set(value)
+
+
+add_collector(_collect_parsed_cache_stats)
+
+# Transaction fields of each table in column order. See the Form4Parser fields tree.
+non_derivative_fields: tuple[str, ...] = (
+    'securityTitle', 'transactionDate', 'deemedExecutionDate', 'transactionCoding',
+    'transactionTimeliness', 'transactionAmounts', 'postTransactionAmounts',
+    'ownershipNature'
+)
+derivative_fields: tuple[str, ...] = (
+    'securityTitle', 'conversionOrExercisePrice', 'transactionDate', 'transactionCoding',
+    'transactionTimeliness', 'transactionAmounts', 'exerciseDate', 'expirationDate',
+    'underlyingSecurity', 'postTransactionAmounts', 'ownershipNature'
+)
+
+
+# Returned by _get_value() for fields without data of their own
+_NO_VALUE: object = object()
+
+
+def _get_children(element: etree._Element) -> list[etree._Element]:
+    """
+    :param element: XML Element
+    :return: Child elements (comments and processing instructions are skipped)
+    """
+
+    return [child for child in element if isinstance(child.tag, str)]
+
+
+def _get_value(element: etree._Element, children: list[etree._Element]) -> str | None | object:
+    """
+    Get the text of a field. Form 4 fields keep their data in a 'value' child,
+    next to optional 'footnoteId' children.
+
+    :param element: Field XML Element
+    :param children: Child elements of the field
+    :return: Field text. _NO_VALUE if the field only has subfields.
+    """
+
+    if not children:
+        return element.text
+
+    for child in children:
+        if child.tag == 'value':
+            return child.text
+
+    return _NO_VALUE
+
+
+class TransactionSchema:
+    """
+    Compiled transaction field schema of a Form 4 table.
+    Flattens the transactions into 'field' and 'field.subfield' columns.
+
+    Notes
+    -----
+    Each transaction is walked once. Fields are looked up by tag in the compiled
+    schema and only their own subtree is visited.
+    - Missing fields are NaN.
+    - A field without children, or with a 'value' child, is one 'field' column.
+    - Otherwise each subfield without children, or with a 'value' child,
+      is a 'field.subfield' column. Other subfields are skipped.
+    """
+
+    def __init__(self, fields: tuple[str, ...]):
+        """
+        TransactionSchema Constructor
+
+        :param fields: Transaction fields in column order
+        """
+
+        self.fields: tuple[str, ...] = fields
+
+        # Field tag -> column position. Other tags are skipped without visiting them.
+        self.positions: dict[str, int] = {field: i for i, field in enumerate(fields)}
+
+    def flatten(self, table: etree._Element) -> pd.DataFrame:
+        """
+        Flatten all transactions (and holdings) of a table
+
+        :param table: Table XML Element (nonDerivativeTable, derivativeTable)
+        :return: Transactions DataFrame indexed from 1
+        """
+
+        rows = {count: self.flatten_transaction(transaction)
+                for count, transaction in enumerate(_get_children(table), start=1)}
+
+        # Create DataFrame from the rows and replace None values with np.nan
+        return pd.DataFrame.from_dict(rows, orient='index').fillna(value=np.nan)
+
+    def flatten_transaction(self, transaction: etree._Element) -> dict:
+        """
+        Flatten one transaction
+
+        :param transaction: Transaction XML Element
+        :return: {column: text}
+        """
+
+        # First element of each schema field
+        elements: list[etree._Element | None] = [None] * len(self.fields)
+        for element in transaction:
+            position = self.positions.get(element.tag)
+            if position is not None and elements[position] is None:
+                elements[position] = element
+
+        row = {}
+        for field, element in zip(self.fields, elements):
+            if element is None:
+                row[field] = np.nan
+                continue
+
+            children = _get_children(element)
+            if (value := _get_value(element, children)) is not _NO_VALUE:
+                row[field] = value
+                continue
+
+            # Field with subfields
+            for sub_field in children:
+                key = f'{field}.{sub_field.tag}'
+                if key in row:
+                    continue
+
+                if (value := _get_value(sub_field, _get_children(sub_field))) is not _NO_VALUE:
+                    row[key] = value
+
+        return row
+
+
+# Compiled schemas of the transaction tables
+non_derivative_schema: TransactionSchema = TransactionSchema(non_derivative_fields)
+derivative_schema: TransactionSchema = TransactionSchema(derivative_fields)
+
+# (XML tag, table name, schema) of the transaction tables
+transaction_tables: tuple[tuple[str, str, TransactionSchema], ...] = (
+    ('nonDerivativeTable', 'non_derivative', non_derivative_schema),
+    ('derivativeTable', 'derivative', derivative_schema),
+)
+
+# Top-level XML tag of each Form4Parser.parse() section
+section_tags: dict[str, str] = {
+    'issuer': 'issuer',
+    'owner': 'reportingOwner',
+    'non_derivative': 'nonDerivativeTable',
+    'derivative': 'derivativeTable',
+    'footnotes': 'footnotes',
+}
+
+
+# Issuer fields
+issuer_fields: tuple[str, ...] = ('issuerCik', 'issuerName', 'issuerTradingSymbol')
+
+# Reporting owner fields. Their subfields are flattened to 'Id.Cik', 'Address.City', ...
+owner_fields: tuple[str, ...] = ('reportingOwnerId', 'reportingOwnerAddress',
+                                 'reportingOwnerRelationship')
+
+# Column types of the transaction tables. See convert_types().
+transaction_types: dict[str, str | pd.CategoricalDtype] = {
+    'table': pd.CategoricalDtype(['non_derivative', 'derivative']),
+
+    'conversionOrExercisePrice': 'float64',
+    'transactionAmounts.transactionShares': 'float64',
+    'transactionAmounts.transactionPricePerShare': 'float64',
+    'underlyingSecurity.underlyingSecurityShares': 'float64',
+    'postTransactionAmounts.sharesOwnedFollowingTransaction': 'float64',
+
+    'transactionDate': 'datetime64[ns]',
+    'deemedExecutionDate': 'datetime64[ns]',
+    'exerciseDate': 'datetime64[ns]',
+    'expirationDate': 'datetime64[ns]',
+
+    'transactionCoding.equitySwapInvolved': 'boolean',
+
+    'transactionCoding.transactionCode': pd.CategoricalDtype(list(transaction_codes)),
+    'transactionAmounts.transactionAcquiredDisposedCode': pd.CategoricalDtype(['A', 'D']),
+    'ownershipNature.directOrIndirectOwnership': pd.CategoricalDtype(['D', 'I']),
+}
+
+# Form 4 flag texts
+flag_values: dict[str, bool] = {'1': True, 'true': True, '0': False, 'false': False}
+
+# Column types of the reporting owner tables
+owner_types: dict[str, str] = {
+    'Relationship.isDirector': 'boolean',
+    'Relationship.isOfficer': 'boolean',
+    'Relationship.isTenPercentOwner': 'boolean',
+    'Relationship.isOther': 'boolean',
+}
+
+
+def _get_issuer_row(issuer: etree._Element) -> dict:
+    """
+    :param issuer: Issuer XML Element
+    :return: {issuer field: text}. Missing fields are None.
+    """
+
+    return {field: issuer.findtext(field) for field in issuer_fields}
+
+
+def _get_owner_row(owner: etree._Element) -> dict:
+    """
+    :param owner: Reporting Owner XML Element
+    :return: {'Id.Cik': text, 'Address.City': text, ...}
+    """
+
+    owner_data = {}
+
+    for field in owner_fields:
+        data = owner.find(field)
+        if data is None:
+            continue
+
+        for sub_field in _get_children(data):
+            owner_data[f"{field[14:]}.{sub_field.tag.split('rptOwner')[-1]}"] = sub_field.text
+
+    return owner_data
+
+
+def _get_document_rows(acc: str,
+                       data: etree._Element) -> tuple[list[dict], list[dict], list[dict]]:
+    """
+    Get the table rows of a Form 4 document. See Form4Parser.parse_many().
+
+    :param acc: Filing Accession Number
+    :param data: Form 4 XML Element
+    :return: (transaction rows, issuer rows, owner rows)
+    """
+
+    transactions, issuers, owners = [], [], []
+
+    if (issuer := data.find('issuer')) is not None:
+        issuers.append({'acc': acc, **_get_issuer_row(issuer)})
+
+    for number, owner in enumerate(data.iterfind('reportingOwner'), start=1):
+        owners.append({'acc': acc, 'owner': number, **_get_owner_row(owner)})
+
+    row = 1
+    for tag, table, schema in transaction_tables:
+        if (element := data.find(tag)) is None:
+            continue
+
+        for transaction in _get_children(element):
+            transactions.append({'acc': acc, 'row': row, 'table': table,
+                                 **schema.flatten_transaction(transaction)})
+            row += 1
+
+    return transactions, issuers, owners
+
+
+def _fill_missing(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Replace None with np.nan. Columns without any value become float64.
+
+    :param df: Parsed table
+    :return: df
+    """
+
+    df = df.fillna(value=np.nan)
+
+    for column in df.columns[df.isna().all().to_numpy()]:
+        df[column] = df[column].astype('float64')
+
+    return df
+
+
+def _convert(values: pd.Series, dtype: str | pd.CategoricalDtype) -> pd.Series:
+    """
+    Convert a whole text column to a type
+
+    :param values: Text values
+    :param dtype: 'float64', 'datetime64[ns]', 'boolean' or a CategoricalDtype
+    :return: Typed values
+    """
+
+    if dtype == 'float64':
+        return pd.to_numeric(values, errors='coerce').astype('float64')
+
+    # Keep the day only ('2022-03-25-05:00' -> 2022-03-25)
+    if dtype == 'datetime64[ns]':
+        return pd.to_datetime(values.astype('string').str[:10], format='%Y-%m-%d',
+                              errors='coerce').astype('datetime64[ns]')
+
+    # Form 4 flags are '1' / '0' or 'true' / 'false'. Missing flags stay <NA> (nullable boolean).
+    if dtype == 'boolean':
+        flags = values.astype('string').str.strip().str.lower()
+        return flags.map(flag_values).astype('boolean')
+
+    # Codes outside the categories are missing
+    return values.where(values.isin(dtype.categories)).astype(dtype)
+
+
+def convert_types(df: pd.DataFrame,
+                  types: dict[str, str | pd.CategoricalDtype] | None = None) -> pd.DataFrame:
+    """
+    Convert the text columns of a parsed table to typed columns in place
+
+    :param df: Parsed table (transactions or owners)
+    :param types: {column: dtype}. Defaults to transaction_types.
+    :return: df with float64 amounts, datetime64 dates, boolean flags and categorical codes
+
+    Notes
+    -----
+    Each column is converted at once. Missing columns are skipped.
+    Values that cannot be converted (e.g. footnote-only prices, unknown codes)
+    become NaN / NaT. Transaction codes are categories of transaction_codes.
+    """
+
+    types = transaction_types if types is None else types
+
+    for column, dtype in types.items():
+        if column in df.columns:
+            df[column] = _convert(df[column], dtype)
+
+    return df
+
+
+# pylint: disable=too-many-instance-attributes
+# Many attributes are required for modularity
 class Form4Parser(SECParser):
     """
     Form 4 Parser
@@ -158,9 +510,7 @@ class Form4Parser(SECParser):
         self.filings = AttributeError('Form 4 does not have filings.')
 
         # Fields that can be parsed into DataFrames
-        self.parsable_fields = ['issuer', 'reportingOwner',
-                                'nonDerivativeTable', 'derivativeTable',
-                                'footnotes']
+        self.parsable_fields = list(section_tags.values())
 
         # Cached Data
         # Parsed DataFrames
@@ -172,66 +522,154 @@ class Form4Parser(SECParser):
         # Parsed Footnotes
         self.footnotes: dict | None = None
 
-    def parse(self) -> dict[str, pd.DataFrame | None]:
+        # Parsed XML document, the content it was parsed from and the sections parsed from it
+        self.data: etree._Element | None = None
+        self.data_content: bytes | None = None
+        self.parsed_sections: set[str] = set()
+
+    # region lazy sections
+
+    @property
+    def issuer(self) -> pd.DataFrame | None:
+        """
+        :return: Issuer table or None. Parsed on first access.
+        """
+
+        self._parse_section('issuer')
+        return self.issuer_table if not self.issuer_table.empty else None
+
+    @property
+    def owner(self) -> pd.DataFrame | None:
+        """
+        :return: Reporting owner table or None. Parsed on first access.
+        """
+
+        self._parse_section('owner')
+        return self.owner_table if not self.owner_table.empty else None
+
+    @property
+    def non_derivative(self) -> pd.DataFrame | None:
+        """
+        :return: Non-derivative table or None. Parsed on first access.
+        """
+
+        self._parse_section('non_derivative')
+        return self.non_derivative_table if not self.non_derivative_table.empty else None
+
+    @property
+    def derivative(self) -> pd.DataFrame | None:
+        """
+        :return: Derivative table or None. Parsed on first access.
+        """
+
+        self._parse_section('derivative')
+        return self.derivative_table if not self.derivative_table.empty else None
+
+    # endregion
+
+    def parse(self, sections: Iterable[str] | None = None) -> dict[str, pd.DataFrame | None]:
         """
         Parse document and organize data into dataframe
 
+        :param sections: Sections to parse ('issuer', 'owner', 'non_derivative', 'derivative',
+                         'footnotes'). Defaults to all of them.
         :return: {
             'issuer': issuer_table or None,
             'owner': owner_table or None,
             'non_derivative': non_derivative_table or None,
             'derivative': derivative_table or None
         }
+        With sections, only the requested sections ('footnotes': footnotes dict or None).
+
+        Notes
+        -----
+        The XML document is parsed once and each section at most once, so the
+        sections not requested are never built.
+        Usage:
+            parser.parse(sections=['issuer', 'owner'])
+            parser.non_derivative  # parsed on first access
         """
 
-        # Check if webpage HTML text is cached. If not, get webpage first.
-        if self.webpage is None:
-            self.get_webpage()
+        # Parse every section, return the tables
+        if sections is None:
+            for section in section_tags:
+                self._parse_section(section)
 
-        # Parse XML
-        # pylint: disable=c-extension-no-member
-        # lxml.etree does have 'fromstring' method
-        data = etree.fromstring(self.webpage)
+            return {
+                'issuer': self.issuer,
+                'owner': self.owner,
+                'non_derivative': self.non_derivative,
+                'derivative': self.derivative,
+            }
 
-        # All top-level fields in XML data
-        all_fields = data.findall('./')
+        # Parse the requested sections only
+        sections = list(sections)
+        for section in sections:
+            self._parse_section(section)
 
-        # Data Fields to Parse
-        fields = [field.tag for field in all_fields if field.tag in self.parsable_fields]
+        return {section: getattr(self, section) for section in sections}
 
-        # TODO: Check if all the fields exist, if not create with NaN values
+    def _get_data(self) -> etree._Element:
+        """
+        Get the parsed XML document
 
-        # Parse Issuer
-        if 'issuer' in fields:
-            self.issuer_table = self._parse_issuer(data.find('./issuer'))
+        :return: Document root element
 
-        # Parse Reporting Owner
-        if 'reportingOwner' in fields:
-            self.owner_table = self._parse_owner(data.find('./reportingOwner'))
+        Notes
+        -----
+        The raw XML bytes are parsed once. New content (e.g. another download)
+        is parsed again and its sections are parsed again on access.
+        """
 
-        # Parse Non-Derivative Table
-        if 'nonDerivativeTable' in fields:
-            self.non_derivative_table = \
-                self._parse_non_derivative_table(data.find('./nonDerivativeTable'))
+        # Check if webpage is cached. If not, get webpage first.
+        if self.content is None:
+            self.get_content()
 
-        # Parse Derivative Table
-        if 'derivativeTable' in fields:
-            self.derivative_table = self._parse_derivative_table(data.find('./derivativeTable'))
+        # Parse the raw XML bytes once per content
+        if self.data is None or self.data_content is not self.content:
+            self.data = parse_xml(self.content)
+            self.data_content = self.content
+            self.parsed_sections.clear()
 
-        # Parse Footnotes
-        if 'footnotes' in fields:
-            self.footnotes = self._parse_footnotes(data.find('./footnotes'))
+        return self.data
 
-        return {
-            'issuer': self.issuer_table if not self.issuer_table.empty else None,
-            'owner': self.owner_table if not self.owner_table.empty else None,
+    def _parse_section(self, section: str) -> None:
+        """
+        Parse one section of the document into its cached table, if not parsed yet
 
-            'non_derivative': self.non_derivative_table
-            if not self.non_derivative_table.empty else None,
+        :param section: Section name. See section_tags.
+        """
 
-            'derivative': self.derivative_table
-            if not self.derivative_table.empty else None
-        }
+        if section not in section_tags:
+            raise ValueError(f'Invalid section: {section}. Expected one of {list(section_tags)}.')
+
+        data = self._get_data()
+
+        if section in self.parsed_sections:
+            return
+
+        self.parsed_sections.add(section)
+
+        # Missing sections keep their empty table
+        # TODO: Check if all the fields exist, if not create with NaN values
+        if (element := data.find(section_tags[section])) is None:
+            return
+
+        if section == 'issuer':
+            self.issuer_table = self._parse_issuer(element)
+
+        elif section == 'owner':
+            self.owner_table = self._parse_owner(element)
+
+        # Transaction tables are typed (float64, datetime64, boolean, category)
+        elif section == 'non_derivative':
+            self.non_derivative_table = convert_types(self._parse_non_derivative_table(element))
+
+        elif section == 'derivative':
+            self.derivative_table = convert_types(self._parse_derivative_table(element))
+
+        else:
+            self.footnotes = self._parse_footnotes(element)
 
     def get_footnotes(self, _id: int | str | None = None) -> dict | str:
         """
@@ -241,10 +679,8 @@ class Form4Parser(SECParser):
         :return: Footnote or all footnotes if _id is not specified
         """
 
-        # Check if footnotes are cached
-        if self.footnotes is None:
-            # If not, parse the document
-            self.parse()
+        # Parse the footnotes if not cached
+        self._parse_section('footnotes')
 
         # Convert footnote ID if int
         if isinstance(_id, int):
@@ -261,10 +697,57 @@ class Form4Parser(SECParser):
         # Return all footnotes if _id not specified or does not exist
         return self.footnotes
 
+    @staticmethod
+    def parse_many(documents: Iterable[tuple[str, bytes]]) -> dict[str, pd.DataFrame]:
+        """
+        Parse a batch of Form 4 documents into one long-format table per entity
+
+        :param documents: (accession number, raw XML bytes) of each filing
+        :return: {
+            'transactions': index (acc, row). Non-derivative then derivative rows of each filing,
+                            'table' column ('non_derivative' | 'derivative') and the
+                            transaction columns of parse(), typed by convert_types(),
+            'issuers': index acc. issuerCik, issuerName, issuerTradingSymbol,
+            'owners': index (acc, owner). 'Id.Cik', 'Address.City', 'Relationship.isDirector', ...
+        }
+
+        Notes
+        -----
+        Rows are collected for the whole batch and each table is built once,
+        instead of four DataFrames per filing.
+        Documents that are not valid XML are logged and skipped.
+        """
+
+        transactions, issuers, owners = [], [], []
+
+        for acc, content in documents:
+            try:
+                data = parse_xml(content)
+            except etree.XMLSyntaxError as error:
+                logger.warning('Form4Parser: %s is not valid XML: %s', acc, error)
+                continue
+
+            for rows, document_rows in zip((transactions, issuers, owners),
+                                           _get_document_rows(acc, data)):
+                rows.extend(document_rows)
+
+        transactions_df = pd.DataFrame(transactions, columns=None if transactions
+                                       else ['acc', 'row', 'table'])
+        issuers_df = pd.DataFrame(issuers, columns=None if issuers else ['acc', *issuer_fields])
+        owners_df = pd.DataFrame(owners, columns=None if owners else ['acc', 'owner'])
+
+        return {
+            'transactions': convert_types(
+                _fill_missing(transactions_df.set_index(['acc', 'row']))),
+            'issuers': _fill_missing(issuers_df.set_index('acc')),
+            'owners': convert_types(_fill_missing(owners_df.set_index(['acc', 'owner'])),
+                                    owner_types),
+        }
+
     # region parse sub-functions
 
     @staticmethod
-    def _parse_issuer(issuer: ElementTree.Element) -> pd.DataFrame:
+    def _parse_issuer(issuer: etree._Element) -> pd.DataFrame:
         """
         Parse Issuer XML Data.
 
@@ -272,16 +755,8 @@ class Form4Parser(SECParser):
         :return: Parsed Issuer DataFrame
         """
 
-        # Fields to Parse
-        issuer_fields = ['issuerCik', 'issuerName', 'issuerTradingSymbol']
-
-        # Initialize Data Dictionary
-        issuer_data = {}
-
-        # Iterate through fields and get data from XML
-        for field in issuer_fields:
-            data = issuer.find(f'./{field}').text
-            issuer_data.update({field: data})
+        # Get data from XML
+        issuer_data = _get_issuer_row(issuer)
 
         # Create DataFrame from Data Dictionary
         issuer_df = pd.DataFrame.from_dict(issuer_data, orient='index')
@@ -292,7 +767,7 @@ class Form4Parser(SECParser):
         return issuer_df
 
     @staticmethod
-    def _parse_owner(owner: ElementTree.Element) -> pd.DataFrame:
+    def _parse_owner(owner: etree._Element) -> pd.DataFrame:
         """
         Parse Reporting Owner XML Data.
 
@@ -300,20 +775,8 @@ class Form4Parser(SECParser):
         :return: Parsed Reporting Owner DataFrame
         """
 
-        # Fields to Parse
-        owner_fields = ['reportingOwnerId', 'reportingOwnerAddress', 'reportingOwnerRelationship']
-
-        # Initialize Data Dictionary
-        owner_data = {}
-
-        # Iterate through fields and get data from XML
-        for field in owner_fields:
-            data = owner.find(f'./{field}')
-
-            # Iterate through subfields and get data from XML
-            for sub_field in data.findall('./'):
-                sub_data = sub_field.text
-                owner_data.update({f"{field[14:]}.{sub_field.tag.split('rptOwner')[-1]}": sub_data})
+        # Get data from XML
+        owner_data = _get_owner_row(owner)
 
         # Create DataFrame from Data Dictionary
         owner_df = pd.DataFrame.from_dict(owner_data, orient='index')
@@ -321,12 +784,16 @@ class Form4Parser(SECParser):
         # Replace None with np.nan
         owner_df = owner_df.fillna(np.nan)
 
+        # Convert the relationship flags to boolean
+        flags = owner_df.index.isin(list(owner_types))
+        if flags.any():
+            owner_df[0] = owner_df[0].astype(object)
+            owner_df.loc[flags, 0] = _convert(owner_df.loc[flags, 0], 'boolean').astype(object)
+
         return owner_df
 
-    # pylint: disable= too-many-branches, too-many-nested-blocks
-    # TODO: Refactor this function
     @staticmethod
-    def _parse_non_derivative_table(non_derivative_table: ElementTree.Element) -> pd.DataFrame:
+    def _parse_non_derivative_table(non_derivative_table: etree._Element) -> pd.DataFrame:
         """
         Parse Non-Derivative Table XML Data.
         Note: non-derivative is common stock, preferred stock, and other stock
@@ -335,74 +802,10 @@ class Form4Parser(SECParser):
         :return: Parsed Non-Derivative Table DataFrame
         """
 
-        transaction_fields = [
-            'securityTitle', 'transactionDate', 'deemedExecutionDate', 'transactionCoding',
-            'transactionTimeliness', 'transactionAmounts', 'postTransactionAmounts',
-            'ownershipNature'
-        ]
-
-        # Initialize Data Dictionary: Stores {count: transaction_data}
-        transactions_dict = {}
-        count: int = 1
-
-        # Iterate through transactions
-        for transaction in non_derivative_table.findall('./'):
-            # Initialize Transaction Data Dictionary
-            transaction_data = {}
-
-            # Iterate through top-level transaction fields and get data from XML
-            for field in transaction_fields:
-                sub_fields = [subfield.tag for subfield in transaction.findall(f'./{field}/')]
-
-                # Check if field has subfields
-                if not sub_fields:
-                    try:
-                        transaction_data.update({field: transaction.find(f'./{field}').text})
-                    except AttributeError:
-                        transaction_data.update({field: np.nan})
-
-                # Check if Value is a Subfield
-                elif 'value' in sub_fields:
-                    if len(transaction.findall(f'./{field}/value')) > 0:
-                        transaction_data.update({field: transaction.find(f'./{field}/value').text})
-                    else:
-                        transaction_data.update({field: np.nan})
-
-                # Iterate through subfields and get data from XML
-                else:
-                    for sub_field in sub_fields:
-                        sub_sub_fields = [ssf.tag
-                                          for ssf in transaction.findall(f'./{field}/{sub_field}/')]
-
-                        # Check if field has subfields
-                        if not sub_sub_fields:
-                            try:
-                                ssf_data = transaction.find(f'./{field}/{sub_field}').text
-                                transaction_data.update({f"{field}.{sub_field}": ssf_data})
-                            except AttributeError:
-                                transaction_data.update({f"{field}.{sub_field}": np.nan})
-
-                        # Check if Value is a Subfield
-                        elif 'value' in sub_sub_fields:
-                            if len(transaction.findall(f'./{field}/{sub_field}/value')) > 0:
-                                ssf_data = transaction.find(f'./{field}/{sub_field}/value').text
-                                transaction_data.update({f"{field}.{sub_field}": ssf_data})
-                            else:
-                                transaction_data.update({f"{field}.{sub_field}": np.nan})
-
-            transactions_dict.update({count: transaction_data})
-            count += 1
-
-        # Create DataFrame from Data Dictionary
-        transactions_df = pd.DataFrame.from_dict(transactions_dict, orient='index')
-
-        # Replace None values with np.nan
-        transactions_df = transactions_df.fillna(value=np.nan)
-
-        return transactions_df
+        return non_derivative_schema.flatten(non_derivative_table)
 
     @staticmethod
-    def _parse_derivative_table(derivative_table: ElementTree.Element) -> pd.DataFrame:
+    def _parse_derivative_table(derivative_table: etree._Element) -> pd.DataFrame:
         """
         Parse Derivative Table XML Data.
         Note: derivative is RSU, option and future on underlying stock or bonds and notes.
@@ -411,73 +814,10 @@ class Form4Parser(SECParser):
         :return: Parsed Derivative Table DataFrame
         """
 
-        transaction_fields = [
-            'securityTitle', 'conversionOrExercisePrice', 'transactionDate', 'transactionCoding',
-            'transactionTimeliness', 'transactionAmounts', 'exerciseDate', 'expirationDate',
-            'underlyingSecurity', 'postTransactionAmounts', 'ownershipNature'
-        ]
-
-        # Initialize Data Dictionary: Stores {count: transaction_data}
-        transactions_dict = {}
-        count: int = 1
-
-        # Iterate through transactions
-        for transaction in derivative_table.findall('./'):
-            # Initialize Transaction Data Dictionary
-            transaction_data = {}
-
-            for field in transaction_fields:
-                sub_fields = [subfield.tag for subfield in transaction.findall(f'./{field}/')]
-
-                # Check if field has subfields
-                if not sub_fields:
-                    try:
-                        transaction_data.update({field: transaction.find(f'./{field}').text})
-                    except AttributeError:
-                        transaction_data.update({field: np.nan})
-
-                # Check if Value is a Subfield
-                elif 'value' in sub_fields:
-                    if len(transaction.findall(f'./{field}/value')) > 0:
-                        transaction_data.update({field: transaction.find(f'./{field}/value').text})
-                    else:
-                        transaction_data.update({field: np.nan})
-
-                # Iterate through subfields and get data from XML
-                else:
-                    for sub_field in sub_fields:
-                        sub_sub_fields = [ssf.tag
-                                          for ssf in transaction.findall(f'./{field}/{sub_field}/')]
-
-                        # Check if field has subfields
-                        if not sub_sub_fields:
-                            try:
-                                ssf_data = transaction.find(f'./{field}/{sub_field}').text
-                                transaction_data.update({f"{field}.{sub_field}": ssf_data})
-                            except AttributeError:
-                                transaction_data.update({f"{field}.{sub_field}": np.nan})
-
-                        # Check if Value is a Subfield
-                        elif 'value' in sub_sub_fields:
-                            if len(transaction.findall(f'./{field}/{sub_field}/value')) > 0:
-                                ssf_data = transaction.find(f'./{field}/{sub_field}/value').text
-                                transaction_data.update({f"{field}.{sub_field}": ssf_data})
-                            else:
-                                transaction_data.update({f"{field}.{sub_field}": np.nan})
-
-            transactions_dict.update({count: transaction_data})
-            count += 1
-
-        # Create DataFrame from Data Dictionary
-        transactions_df = pd.DataFrame.from_dict(transactions_dict, orient='index')
-
-        # Replace None values with np.nan
-        transactions_df = transactions_df.fillna(value=np.nan)
-
-        return transactions_df
+        return derivative_schema.flatten(derivative_table)
 
     @staticmethod
-    def _parse_footnotes(footnotes: ElementTree.Element) -> dict:
+    def _parse_footnotes(footnotes: etree._Element) -> dict:
         """
         Parse Footnotes Section
         :param footnotes: Footnotes Section XML Data
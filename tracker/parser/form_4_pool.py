@@ -0,0 +1,122 @@
+"""
+Form 4 Process Pool Parsing Stage
+
+Parses raw Form 4 documents on all cores for bulk backfills.
+Workers run Form4Parser.parse_many() on batches of documents and send the tables back
+as Arrow IPC buffers instead of pickled DataFrames.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator
+
+import pandas as pd
+import pyarrow as pa
+
+from .form_4 import Form4Parser
+
+# Documents per batch sent to a worker
+BATCH_SIZE: int = 256
+
+
+def _to_arrow(df: pd.DataFrame) -> pa.Buffer:
+    """
+    Serialize a DataFrame to an Arrow IPC stream
+
+    :param df: DataFrame (index, categories and datetimes are kept)
+    :return: Arrow IPC buffer
+    """
+
+    table = pa.Table.from_pandas(df, preserve_index=True)
+    sink = pa.BufferOutputStream()
+
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+
+    return sink.getvalue()
+
+
+def _from_arrow(buffer: pa.Buffer) -> pd.DataFrame:
+    """
+    Deserialize a DataFrame from an Arrow IPC stream
+
+    :param buffer: Arrow IPC buffer
+    :return: DataFrame
+    """
+
+    return pa.ipc.open_stream(buffer).read_all().to_pandas()
+
+
+def _parse_batch(documents: list[tuple[str, bytes]]) -> dict[str, pa.Buffer]:
+    """
+    Parse a batch of documents in a worker process
+
+    :param documents: (accession number, raw XML bytes) of each filing
+    :return: {table name: Arrow IPC buffer}. See Form4Parser.parse_many().
+    """
+
+    return {name: _to_arrow(df) for name, df in Form4Parser.parse_many(documents).items()}
+
+
+def parse_pool(documents: Iterable[tuple[str, bytes]],
+               processes: int | None = None,
+               batch_size: int = BATCH_SIZE,
+               max_in_flight: int | None = None) -> Iterator[dict[str, pd.DataFrame]]:
+    """
+    Parse Form 4 documents on a process pool
+
+    :param documents: (accession number, raw XML bytes) of each filing. Read lazily.
+    :param processes: Worker processes. Defaults to the CPU count. 0 parses in this process.
+    :param batch_size: Documents per batch
+    :param max_in_flight: Maximum batches submitted and not yet yielded.
+                          Defaults to twice the number of processes.
+    :return: Form4Parser.parse_many() tables of each batch, in the order of the documents
+
+    Notes
+    -----
+    Memory is bounded by max_in_flight batches of documents and results:
+    documents are only read when a batch is submitted, and batches are only
+    submitted while the caller keeps up.
+    Results are yielded in input order, so the output does not depend on worker timing.
+
+    Usage:
+        tables = list(parse_pool(documents))
+        transactions = pd.concat([table['transactions'] for table in tables])
+    """
+
+    documents = iter(documents)
+
+    def _next_batch() -> list[tuple[str, bytes]]:
+        return list(islice(documents, batch_size))
+
+    # Same serialization path without a pool (debugging, small batches)
+    if processes == 0:
+        while batch := _next_batch():
+            yield {name: _from_arrow(buffer) for name, buffer in _parse_batch(batch).items()}
+        return
+
+    processes = processes or os.cpu_count() or 1
+    max_in_flight = max_in_flight or 2 * processes
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures: deque[Future] = deque()
+
+        try:
+            while True:
+                # Keep max_in_flight batches submitted
+                while len(futures) < max_in_flight and (batch := _next_batch()):
+                    futures.append(executor.submit(_parse_batch, batch))
+
+                if not futures:
+                    return
+
+                # Yield in submission order
+                buffers = futures.popleft().result()
+                yield {name: _from_arrow(buffer) for name, buffer in buffers.items()}
+
+        finally:
+            # Generator closed early: drop the batches not started yet
+            for future in futures:
+                future.cancel()
@@ -0,0 +1,109 @@
+"""
+SEC HTTP Instrumentation File
+
+Request counters, latency histograms, downloaded bytes and cache hits
+labelled by SEC endpoint class.
+"""
+
+import requests
+from prometheus_client import Counter, Histogram
+
+from baseurls import SEC_CIK_LOOKUP, SEC_EDGAR_FTS, SEC_FILING_DATA, SEC_LATEST_FILINGS
+from tracker.utils.metrics import DEFAULT_BUCKETS
+
+# Endpoint classes
+ATOM: str = 'atom'  # Latest filings Atom feed
+INDEX: str = 'index'  # Filing index page
+DOCUMENT: str = 'document'  # Filing document (Form 4 XML)
+FTS: str = 'fts'  # EDGAR Full Text Search
+CIK: str = 'cik'  # CIK lookup data file
+OTHER: str = 'other'
+
+# Metrics
+requests_total = Counter('sec_requests_total',
+                         'SEC HTTP requests by endpoint class and status code',
+                         ['endpoint', 'status'])
+request_seconds = Histogram('sec_request_seconds',
+                            'SEC HTTP request latency in seconds by endpoint class',
+                            ['endpoint'], buckets=DEFAULT_BUCKETS)
+response_bytes = Counter('sec_response_bytes_total',
+                         'SEC HTTP response bytes downloaded by endpoint class',
+                         ['endpoint'])
+cache_hits = Counter('sec_cache_hits_total',
+                     'SEC responses served from a cache by endpoint class and cache',
+                     ['endpoint', 'cache'])
+
+
+def get_endpoint(url: str | None) -> str:
+    """
+    Get the endpoint class of an SEC URL
+
+    :param url: Request URL
+    :return: Endpoint class (atom, index, document, fts, cik or other)
+    """
+
+    if not url:
+        return OTHER
+
+    if url.startswith(SEC_EDGAR_FTS):
+        return FTS
+
+    if url.startswith(SEC_LATEST_FILINGS.split('?', maxsplit=1)[0]) and 'output=atom' in url:
+        return ATOM
+
+    if url.startswith(SEC_CIK_LOOKUP):
+        return CIK
+
+    if url.startswith(SEC_FILING_DATA):
+        return INDEX if url.endswith('-index.htm') or url.endswith('-index.html') else DOCUMENT
+
+    return OTHER
+
+
+def record_response(endpoint: str,
+                    response: requests.Response,
+                    seconds: float,
+                    stream: bool = False) -> None:
+    """
+    Record a completed HTTP request
+
+    :param endpoint: Endpoint class
+    :param response: Response
+    :param seconds: Time from sending the request to receiving the response
+    :param stream: The response body has not been downloaded yet
+    """
+
+    requests_total.labels(endpoint=endpoint, status=response.status_code).inc()
+    request_seconds.labels(endpoint=endpoint).observe(seconds)
+
+    # Streamed bodies are not downloaded yet. Use the declared length instead.
+    if stream:
+        size = int(response.headers.get('Content-Length', 0))
+    else:
+        size = len(response.content or b'')
+
+    response_bytes.labels(endpoint=endpoint).inc(size)
+
+
+def record_error(endpoint: str, error: Exception, seconds: float) -> None:
+    """
+    Record a failed HTTP request (connection error, timeout)
+
+    :param endpoint: Endpoint class
+    :param error: Raised exception
+    :param seconds: Time from sending the request to the error
+    """
+
+    requests_total.labels(endpoint=endpoint, status=error.__class__.__name__).inc()
+    request_seconds.labels(endpoint=endpoint).observe(seconds)
+
+
+def record_cache_hit(endpoint: str, cache: str) -> None:
+    """
+    Record a response served from a cache
+
+    :param endpoint: Endpoint class
+    :param cache: Cache name (disk, not_modified, parsed)
+    """
+
+    cache_hits.labels(endpoint=endpoint, cache=cache).inc()
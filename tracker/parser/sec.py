@@ -2,20 +2,50 @@
 SEC Webpage Parser Class File
 """
 
+import asyncio
 import logging
 from datetime import datetime
+from time import perf_counter
+from typing import Awaitable, Iterable
 
 import requests
 
 import config
+from baseurls import SEC_BASE_URL, SEC_FILING_DATA
 from common import Logger
-from tracker.utils.ratelimit import RateLimit
+from defs import DATA_DIR_PATH
+from tracker.utils.disk_cache import DiskCache
+from tracker.utils.ratelimit import (AdaptiveRate, AsyncRateLimit, RateLimit, TokenBucket,
+                                     get_bucket, get_bucket_key)
+from tracker.utils.retry import Retry
+from .instrumentation import get_endpoint, record_cache_hit, record_error, record_response
+from .session import get_sec_headers, get_session, get_user_agent
 from .webpage_parser import WebpageParser, ResponseError
 
 # Define SEC Logger
 SECLogger: Logger = Logger('sec')
 logger: logging.Logger = SECLogger.get_logger()
 
+# Requests per second to all SEC hosts combined (SEC allows 10)
+SEC_RATE: int = 9
+
+# Token bucket shared by every SEC request in the process.
+# With config shared_ratelimit, it is also shared with the other processes on the host.
+sec_bucket: TokenBucket = get_bucket(
+    get_bucket_key(SEC_BASE_URL), rate=SEC_RATE,
+    path=DATA_DIR_PATH.joinpath('ratelimit') if config.SHARED_RATELIMIT else None)
+
+# Back off the SEC bucket rate on throttled or slow responses and recover up to SEC_RATE
+sec_adaptive: AdaptiveRate = AdaptiveRate(sec_bucket, name='sec', logger=logger)
+
+# Maximum number of requests in flight at once on the event loop
+MAX_IN_FLIGHT: int = 8
+
+# Disk cache for EDGAR Archives documents. They never change once published.
+archives_cache: DiskCache = DiskCache(DATA_DIR_PATH.joinpath('cache', 'archives'),
+                                      max_size=config.CACHE_SIZE * 1024 * 1024,
+                                      logger=logger)
+
 
 class SECParser(WebpageParser):
     """
@@ -43,7 +73,7 @@ class SECParser(WebpageParser):
         if url != self.url:
             self.response = None
             self.response_dt = None
-            self.webpage = None
+            self._set_content(None, None)
             self.content_type = None
             self.soup = None
 
@@ -62,51 +92,139 @@ class SECParser(WebpageParser):
         :return: User-Agent for header
         """
 
-        # Check if required config values are available.
-        if config.NAME is not None and config.EMAIL is not None:
-            return f'{config.NAME} {config.EMAIL}'
-
-        # Else: Use Chrome user agent (NOT RECOMMENDED).
-        return self.chrome_user_agent
+        return get_user_agent()
 
     # pylint: disable=unused-argument
     # *args and **kwargs are used to pass optional arguments to the function
     # pylint: disable=R0801
-    # Override get_webpage() method by adding RateLimit decorator
-    @RateLimit(limit=9, period=1, max_wait=15, logger=logger)
-    def get_webpage(self, *args, **kwargs) -> str:
+    def get_webpage(self, *args, headers: dict | None = None, **kwargs) -> str:
         """
         Get the webpage HTML text
 
+        :param headers: Additional HTTP headers (e.g. conditional GET validators)
         :return: Webpage HTML text
 
         Notes
         -----
         This method caches the webpage HTML texts in self.webpage.
-        Follows guidelines: https://www.sec.gov/os/accessing-edgar-data.
+        Use get_content() to get the raw bytes without decoding them.
         """
 
-        # pylint: disable=pointless-string-statement
-        # Headers Notes
+        self.get_content(headers=headers)
+
+        return self.webpage
+
+    def get_content(self, headers: dict | None = None) -> bytes:
         """
-        User-Agent: Sample Company Name AdminContact@<sample company domain>.com
-        Accept-Encoding: gzip, deflate
-        Host: www.sec.gov
+        Get the raw webpage bytes without decoding them
+
+        :param headers: Additional HTTP headers (e.g. conditional GET validators)
+        :return: Webpage bytes
+
+        Notes
+        -----
+        This method caches the webpage bytes in self.content.
+        Follows guidelines: https://www.sec.gov/os/accessing-edgar-data.
+        A 304 Not Modified response returns the cached webpage.
+        EDGAR Archives documents are cached on disk and only downloaded once.
         """
-        headers: dict = {
-            'Accept-Encoding': 'gzip, deflate',
-            'Host': 'www.sec.gov',
-            'User-Agent': self._get_user_agent()
-        }
+
+        # Check if the document is in the EDGAR Archives disk cache
+        if self._load_cached():
+            return self.content
 
         # Get the webpage HTML text
         self.logger.debug('Getting %s webpage from %s', self.name, self.url)
-        response = requests.get(self.url, headers=headers)
+        response = self._send(headers=self._get_headers(headers))
+
+        return self._set_response(response)
+
+    async def aget_webpage(self, *args, headers: dict | None = None, **kwargs) -> str:
+        """
+        Get the webpage HTML text without blocking the event loop
+
+        :param headers: Additional HTTP headers (e.g. conditional GET validators)
+        :return: Webpage HTML text
+        """
+
+        await self.aget_content(headers=headers)
+
+        return self.webpage
+
+    async def aget_content(self, headers: dict | None = None) -> bytes:
+        """
+        Get the raw webpage bytes without blocking the event loop
+
+        :param headers: Additional HTTP headers (e.g. conditional GET validators)
+        :return: Webpage bytes
+
+        Notes
+        -----
+        Waits for the rate limit on the event loop (AsyncRateLimit) and only uses
+        worker threads for the request itself and the disk cache, so waiting
+        requests do not hold threads. Shares the SEC token bucket and the pooled
+        session with synchronous callers.
+        """
+
+        if await asyncio.to_thread(self._load_cached):
+            return self.content
+
+        self.logger.debug('Getting %s webpage from %s', self.name, self.url)
+        response = await self._asend(headers=self._get_headers(headers))
+
+        return await asyncio.to_thread(self._set_response, response)
+
+    def _get_headers(self, headers: dict | None) -> dict | None:
+        """
+        Get the request headers. Override to add headers (e.g. conditional GET validators).
+
+        :param headers: Additional HTTP headers
+        :return: Request headers
+        """
+
+        return headers
+
+    def _load_cached(self) -> bool:
+        """
+        Load the webpage from the EDGAR Archives disk cache
+
+        :return: True if the webpage was cached
+        """
+
+        if not self.url.startswith(SEC_FILING_DATA):
+            return False
+
+        if (cached := archives_cache.get(self.url)) is None:
+            return False
+
+        self.logger.debug('Getting %s webpage from cache: %s', self.name, self.url)
+        record_cache_hit(get_endpoint(self.url), 'disk')
+
+        self.content_type, encoding, body = cached
+        self.response = None
+        self.response_dt = datetime.now()
+        self._set_content(body, encoding)
+
+        return True
+
+    def _set_response(self, response: requests.Response) -> bytes:
+        """
+        Check the response and cache the webpage
+
+        :param response: Response
+        :return: Webpage bytes
+        """
 
         # Cache Response
         self.response = response
         self.response_dt = datetime.now()
 
+        # Webpage has not changed since the cached response
+        if response.status_code == 304 and self.content is not None:
+            self.logger.debug('%s webpage not modified: %s', self.name, self.url)
+            record_cache_hit(get_endpoint(self.url), 'not_modified')
+            return self.content
+
         # Get the content type of the response
         self.content_type = response.headers['Content-Type']
 
@@ -116,6 +234,104 @@ class SECParser(WebpageParser):
             self.logger.error(error_msg)
             raise ResponseError(message=error_msg, response=response)
 
-        self.webpage = response.text
+        # Cache EDGAR Archives documents
+        if self.url.startswith(SEC_FILING_DATA):
+            archives_cache.put(self.url, self.content_type, response.encoding, response.content)
+
+        self._set_content(response.content, response.encoding)
+
+        return self.content
+
+    # Override _send() method by adding Retry and RateLimit decorators.
+    # Every retry takes a slot from the rate limit.
+    @Retry(logger=logger)
+    @RateLimit(limit=SEC_RATE, period=1, max_wait=15, logger=logger, bucket=sec_bucket,
+               adaptive=sec_adaptive)
+    def _send(self, headers: dict | None = None, stream: bool = False) -> requests.Response:
+        """
+        Send the HTTP request through the shared pooled session
+
+        :param headers: Additional HTTP headers
+        :param stream: Do not download the response body until it is iterated
+        :return: Response object
+        """
+
+        return self._request(headers=headers, stream=stream)
+
+    @Retry(logger=logger)
+    @AsyncRateLimit(limit=SEC_RATE, period=1, max_wait=15, logger=logger, bucket=sec_bucket,
+                    adaptive=sec_adaptive)
+    async def _asend(self, headers: dict | None = None) -> requests.Response:
+        """
+        Send the HTTP request from a worker thread after awaiting the rate limit
+
+        :param headers: Additional HTTP headers
+        :return: Response object
+        """
+
+        return await asyncio.to_thread(self._request, headers=headers)
+
+    def _request(self, headers: dict | None = None, stream: bool = False) -> requests.Response:
+        """
+        Send the HTTP request through the shared pooled session without rate limiting.
+        Use _send() or _asend().
+
+        :param headers: Additional HTTP headers
+        :param stream: Do not download the response body until it is iterated
+        :return: Response object
+        """
+
+        # Headers Notes
+        # User-Agent: Sample Company Name AdminContact@<sample company domain>.com
+        # Accept-Encoding: gzip, deflate
+        # Both are added to every SEC request. Host is set from the url by requests.
+        endpoint = get_endpoint(self.url)
+        start = perf_counter()
+
+        try:
+            response = get_session().get(self.url, headers=get_sec_headers(headers),
+                                         stream=stream)
+        except requests.RequestException as error:
+            record_error(endpoint, error, perf_counter() - start)
+            raise
+
+        record_response(endpoint, response, perf_counter() - start, stream=stream)
+
+        return response
+
+
+async def gather_bounded(aws: Iterable[Awaitable], max_in_flight: int = MAX_IN_FLIGHT) -> list:
+    """
+    Run awaitables concurrently with at most max_in_flight running at once
+
+    :param aws: Awaitables to run
+    :param max_in_flight: Maximum number of awaitables running at once
+    :return: Results in the same order as aws
+    """
+
+    semaphore = asyncio.Semaphore(max_in_flight)
+
+    async def __run(_aw: Awaitable):
+        async with semaphore:
+            return await _aw
+
+    return await asyncio.gather(*[__run(aw) for aw in aws])
+
+
+async def fetch_many(urls: Iterable[str], max_in_flight: int = MAX_IN_FLIGHT) -> list[str]:
+    """
+    Get many SEC webpages concurrently on one event loop
+
+    :param urls: Webpage URLs
+    :param max_in_flight: Maximum number of requests in flight at once
+    :return: Webpage HTML texts in the same order as urls
+
+    Notes
+    -----
+    All requests still go through the SECParser AsyncRateLimit and SEC token bucket.
+    Usage: texts = asyncio.run(fetch_many(urls))
+    """
+
+    parsers = [SECParser(url, url) for url in urls]
 
-        return response.text
+    return await gather_bounded([parser.aget_webpage() for parser in parsers], max_in_flight)
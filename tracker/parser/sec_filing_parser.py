@@ -4,6 +4,7 @@ SEC Filing Parser
 
 import pandas as pd
 
+from baseurls import SEC_BASE_URL
 from .sec import SECParser
 
 
@@ -43,7 +44,7 @@ class SECFilingParser(SECParser):
         links = table.find_all('a')
 
         # Parse document links
-        links = ["https://www.sec.gov/" + link.get('href') for link in links]
+        links = [SEC_BASE_URL + "/" + link.get('href') for link in links]
 
         # Convert table to DataFrame
         df = pd.read_html(str(table))[0]
@@ -91,7 +92,7 @@ class SECFilingParser(SECParser):
             _type = row_data[3].text
 
             if _type == form_type or form_type is None:
-                _link = "https://www.sec.gov" + row_data[2].find('a').get('href').strip()
+                _link = SEC_BASE_URL + row_data[2].find('a').get('href').strip()
                 links.update({_document: _link})
                 doc_types.append(_document)
 
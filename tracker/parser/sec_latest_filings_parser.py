@@ -3,14 +3,52 @@ SEC Latest Filings Parser
 https://www.sec.gov/cgi-bin/browse-edgar?action=getcurrent
 """
 
-from datetime import datetime
-from xml.etree import ElementTree
-
+import hashlib
 import pandas as pd
+import requests
+# pylint: disable=c-extension-no-member
+# lxml.etree does have 'XPath' method
 from lxml import etree
 
 from baseurls import SEC_LATEST_FILINGS
 from .sec import SECParser
+from .xml_parser import parse_xml
+
+# Atom namespace
+ATOM_NAMESPACES: dict = {'atom': 'http://www.w3.org/2005/Atom'}
+
+# Filings columns. 'acc' becomes the index.
+FILING_COLUMNS: list[str] = ['acc', 'form_type', 'title', 'date_time', 'link']
+
+# Compiled XPaths of each column relative to an entry
+_entry_xpaths: dict[str, etree.XPath] = {
+    'acc': etree.XPath('atom:id/text()', namespaces=ATOM_NAMESPACES),
+    'form_type': etree.XPath('atom:category/@term', namespaces=ATOM_NAMESPACES),
+    'title': etree.XPath('atom:title/text()', namespaces=ATOM_NAMESPACES),
+    'date_time': etree.XPath('atom:updated/text()', namespaces=ATOM_NAMESPACES),
+    'link': etree.XPath('atom:link/@href', namespaces=ATOM_NAMESPACES),
+}
+
+# Compiled XPaths of each column over all entries of the feed
+_column_xpaths: dict[str, etree.XPath] = {
+    'acc': etree.XPath('atom:entry/atom:id/text()', namespaces=ATOM_NAMESPACES),
+    'form_type': etree.XPath('atom:entry/atom:category/@term', namespaces=ATOM_NAMESPACES),
+    'title': etree.XPath('atom:entry/atom:title/text()', namespaces=ATOM_NAMESPACES),
+    'date_time': etree.XPath('atom:entry/atom:updated/text()', namespaces=ATOM_NAMESPACES),
+    'link': etree.XPath('atom:entry/atom:link/@href', namespaces=ATOM_NAMESPACES),
+}
+
+_entries: etree.XPath = etree.XPath('atom:entry', namespaces=ATOM_NAMESPACES)
+_count_entries: etree.XPath = etree.XPath('count(atom:entry)', namespaces=ATOM_NAMESPACES)
+
+
+def _get_first(values: list) -> str | None:
+    """
+    :param values: XPath results of an entry field
+    :return: First value as a string. None if the entry is missing the field.
+    """
+
+    return str(values[0]) if values else None
 
 
 class SECFilingsParser(SECParser):
@@ -36,57 +74,129 @@ class SECFilingsParser(SECParser):
 
         self.filings: pd.DataFrame = pd.DataFrame()
 
-    def parse(self, force_refresh: bool = True) -> pd.DataFrame:
+        # Conditional GET validators of the cached webpage
+        self.etag: str | None = None  # ETag response header
+        self.last_modified: str | None = None  # Last-Modified response header
+        self.digest: str | None = None  # SHA-256 of the webpage body
+        self.not_modified: bool = False  # True if the last get_webpage() found no changes
+
+    def set_url(self, url: str) -> None:
         """
-        Parse the SEC Filings into DataFrame
+        Set the Parser URL
 
-        :param force_refresh: Re-download the webpage data
-        :return: Filings DataFrame
+        :param url: New Parser URL
         """
 
-        # Initialize DataFrame
-        filing_cols = ['acc', 'form_type', 'title', 'date_time', 'link']
-        filings = pd.DataFrame(columns=filing_cols)
+        # Delete the validators of the previous url
+        if url != self.url:
+            self.etag = None
+            self.last_modified = None
+            self.digest = None
+            self.not_modified = False
+            self.filings = pd.DataFrame()
 
-        # Check if webpage HTML text is cached. If not, get webpage first.
-        if self.webpage is None or force_refresh:
-            self.get_webpage()
+        super().set_url(url)
 
-        # Convert Webpage text to XML ElementTree
-        # pylint: disable=c-extension-no-member
-        # lxml.etree does have 'fromstring' method
-        data: ElementTree = etree.fromstring(self.webpage.encode('utf-8'))
+    def _get_headers(self, headers: dict | None) -> dict:
+        """
+        Add the conditional GET validators of the cached webpage
 
-        # Iterate through entries
-        entries = data.findall('{http://www.w3.org/2005/Atom}entry')
+        :param headers: Additional HTTP headers
+        :return: Request headers
 
-        for entry in entries:
-            namespaces = {'atom': 'http://www.w3.org/2005/Atom'}
+        Notes
+        -----
+        Sends If-None-Match and If-Modified-Since validators of the cached webpage.
+        """
+
+        # Build validator headers only if there is a cached webpage to fall back on
+        headers = {} if headers is None else dict(headers)
+        if self.content is not None:
+            if self.etag is not None:
+                headers['If-None-Match'] = self.etag
+            if self.last_modified is not None:
+                headers['If-Modified-Since'] = self.last_modified
+
+        return headers
+
+    def _set_response(self, response: requests.Response) -> bytes:
+        """
+        Cache the webpage and its validators
+
+        :param response: Response
+        :return: Webpage Atom bytes
+
+        Notes
+        -----
+        Sets self.not_modified if SEC returns 304 or the body hash is unchanged.
+        """
 
-            # Get filing title
-            title = entry.xpath('atom:title/text()', namespaces=namespaces)[0]
+        content = super()._set_response(response)
 
-            # Get filing documents link
-            link = entry.xpath('atom:link/@href', namespaces=namespaces)[0]
+        # 304 Not Modified
+        if response.status_code == 304:
+            self.not_modified = True
+            return content
 
-            # Summary
-            # entry.xpath('atom:summary/text()', namespaces=namespaces)[0]
+        # Compare the body hash in case the server ignores the validators
+        digest = hashlib.sha256(content).hexdigest()
+        self.not_modified = digest == self.digest
 
-            # Get Filing Date Time
-            date_time = datetime.strptime(
-                entry.xpath('atom:updated/text()', namespaces=namespaces)[0][:-6],
-                '%Y-%m-%dT%H:%M:%S')
+        # Cache validators
+        self.etag = response.headers.get('ETag')
+        self.last_modified = response.headers.get('Last-Modified')
+        self.digest = digest
 
-            # Get form type
-            form_type = entry.xpath('atom:category/@term', namespaces=namespaces)[0]
+        return content
 
-            # Get Accession Number
-            acc_no = entry.xpath('atom:id/text()', namespaces=namespaces)[0].split('=')[-1]
+    def parse(self, force_refresh: bool = True) -> pd.DataFrame:
+        """
+        Parse the SEC Filings into DataFrame
+
+        :param force_refresh: Re-download the webpage data
+        :return: Filings DataFrame
+
+        Notes
+        -----
+        Returns the cached filings without parsing if the webpage has not changed.
+        The DataFrame is built once from whole columns (date_time is datetime64).
+        """
 
-            # Update DataFrame
-            filings = pd.concat(
-                [filings, pd.DataFrame({'acc': [acc_no], 'form_type': [form_type], 'title': [title],
-                                        'date_time': [date_time], 'link': [link]})])
+        # Check if webpage is cached. If not, get webpage first.
+        if self.content is None or force_refresh:
+            self.get_content()
+
+            # Nothing changed since the last poll
+            if self.not_modified and not self.filings.empty:
+                self.logger.debug('SECFilingsParser: %s. Not modified. Using cached filings.',
+                                  self.name)
+                return self.filings
+
+        # Parse the raw webpage bytes to XML ElementTree
+        data: etree._Element = parse_xml(self.content)
+
+        # Gather each column with one compiled XPath over the whole feed
+        columns = {col: xpath(data) for col, xpath in _column_xpaths.items()}
+
+        # Fall back to a pass per entry if an entry is missing a field or has extra ones.
+        # Missing fields are None (NaN / NaT), so the columns stay aligned.
+        count = int(_count_entries(data))
+        if any(len(values) != count for values in columns.values()):
+            columns = {col: [_get_first(xpath(entry)) for entry in _entries(data)]
+                       for col, xpath in _entry_xpaths.items()}
+
+        filings = pd.DataFrame({
+            'acc': [str(_id).rsplit('=', maxsplit=1)[-1] if _id is not None else None
+                    for _id in columns['acc']],
+            'form_type': [str(term) if term is not None else None
+                          for term in columns['form_type']],
+            'title': [str(title) if title is not None else None for title in columns['title']],
+            # Drop the UTC offset ('-04:00') like the SEC website displays it
+            'date_time': pd.to_datetime([str(updated)[:-6] if updated is not None else None
+                                         for updated in columns['date_time']],
+                                        format='%Y-%m-%dT%H:%M:%S'),
+            'link': [str(link) if link is not None else None for link in columns['link']],
+        }, columns=FILING_COLUMNS)
 
         # Set acc as index
         filings.set_index('acc', inplace=True)
@@ -0,0 +1,134 @@
+"""
+Shared HTTP Session File
+
+All parsers share one pooled requests.Session per process so that
+connections to www.sec.gov are kept alive between requests instead of
+opening a new TCP + TLS connection for every filing.
+The session has no SEC headers. SEC requests add them with get_sec_headers(),
+so other hosts never get the configured name and email.
+"""
+
+import logging
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import config
+from common import Logger
+
+# Define Session Logger
+SessionLogger: Logger = Logger('session')
+logger: logging.Logger = SessionLogger.get_logger()
+
+# Chrome User-Agent header (fallback when name and email are not configured)
+CHROME_USER_AGENT: str = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) ' \
+                         'AppleWebKit/537.36 (KHTML, like Gecko) ' \
+                         'Chrome/102.0.5005.63 Safari/537.36'
+
+# Global Variables and Caches
+_session: requests.Session | None = None
+_session_lock: threading.Lock = threading.Lock()
+
+
+def get_user_agent() -> str:
+    """
+    Get the User-Agent to access the SEC website.
+    Uses the recommended 'Sample Company Name AdminContact@<sample company domain>.com'
+    header if name and email are configured, else mocks Chrome web browser header.
+
+    :return: User-Agent for header
+    """
+
+    # Check if required config values are available.
+    if config.NAME is not None and config.EMAIL is not None:
+        return f'{config.NAME} {config.EMAIL}'
+
+    # Else: Use Chrome user agent (NOT RECOMMENDED).
+    return CHROME_USER_AGENT
+
+
+def get_default_headers() -> dict:
+    """
+    Get the default SEC headers sent with every SEC request
+
+    :return: Default headers
+
+    Notes
+    -----
+    Follows guidelines: https://www.sec.gov/os/accessing-edgar-data.
+    """
+
+    return {
+        'Accept-Encoding': 'gzip, deflate',
+        'User-Agent': get_user_agent()
+    }
+
+
+def get_sec_headers(headers: dict | None = None) -> dict:
+    """
+    Get the headers of an SEC request
+
+    :param headers: Additional HTTP headers. They override the default SEC headers.
+    :return: Default SEC headers and the additional headers
+    """
+
+    return {**get_default_headers(), **(headers or {})}
+
+
+def get_session(pool_size: int | None = None) -> requests.Session:
+    """
+    Get the process-wide pooled HTTP session.
+    The session is created on first use.
+
+    :param pool_size: Number of connections kept alive per host (default: config.POOL_SIZE).
+                      Only used when the session is created.
+    :return: Shared requests.Session
+    """
+
+    # pylint: disable=global-statement
+    # Session is a process-wide cache
+    global _session
+
+    with _session_lock:
+        if _session is None:
+            _session = _create_session(pool_size if pool_size is not None else config.POOL_SIZE)
+
+        return _session
+
+
+def close_session() -> None:
+    """
+    Close the process-wide HTTP session and its pooled connections.
+    The next call to get_session() creates a new session.
+    """
+
+    # pylint: disable=global-statement
+    # Session is a process-wide cache
+    global _session
+
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+            logger.info('Closed HTTP session.')
+
+
+def _create_session(pool_size: int) -> requests.Session:
+    """
+    Create a pooled HTTP session
+
+    :param pool_size: Number of connections kept alive per host
+    :return: requests.Session
+    """
+
+    session = requests.Session()
+
+    # Keep-alive connection pool. pool_connections is the number of hosts to cache pools for.
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+
+    logger.info('Created HTTP session. Pool size: %s.', pool_size)
+
+    return session
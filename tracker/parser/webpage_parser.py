@@ -2,17 +2,23 @@
 Webpage Parser Parent Class File
 """
 
+import codecs
 import logging
 import uuid
 from datetime import datetime
 from pathlib import Path
+from typing import Iterator
 
 import requests
 # noinspection PyPep8Naming
 from bs4 import BeautifulSoup as bs
+# pylint: disable=c-extension-no-member
+# lxml.etree does have 'XMLPullParser' method
+from lxml import etree
 
 from common import Logger
 from defs import LOG_DIR_PATH
+from .session import CHROME_USER_AGENT, get_session
 
 # Define Webpage Logger
 WebpageLogger = Logger('webpage')
@@ -41,17 +47,17 @@ class WebpageParser:
         self.logger: logging.Logger = logger
 
         # Chrome User-Agent header
-        self.chrome_user_agent = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) ' \
-                                 'AppleWebKit/537.36 (KHTML, like Gecko) ' \
-                                 'Chrome/102.0.5005.63 Safari/537.36'
+        self.chrome_user_agent = CHROME_USER_AGENT
         self.header_chrome_user_agent = {'User-Agent': self.chrome_user_agent}
 
         # Caches
         self.response: requests.Response | None = None  # Response object
         self.response_dt: datetime | None = None  # Response datetime
-        self.webpage: str | None = None  # Webpage HTML text (requests.get.text)
+        self.content: bytes | None = None  # Raw webpage bytes (requests.get.content)
+        self.encoding: str | None = None  # Webpage text encoding (requests.get.encoding)
         self.content_type: str | None = None  # requests.get.headers['Content-Type']
         self.soup: bs | None = None  # BeautifulSoup object of webpage
+        self._webpage: str | None = None  # Decoded webpage text. See self.webpage.
 
     def __repr__(self) -> str:
         """
@@ -60,6 +66,22 @@ class WebpageParser:
 
         return f'{self.name} Parser for {self.url}.'
 
+    @property
+    def webpage(self) -> str | None:
+        """
+        Webpage HTML text (requests.get.text).
+        Decoded from self.content on first access.
+        """
+
+        if self._webpage is None and self.content is not None:
+            self._webpage = self.content.decode(self.encoding or 'utf-8', errors='replace')
+
+        return self._webpage
+
+    @webpage.setter
+    def webpage(self, webpage: str | None) -> None:
+        self._webpage = webpage
+
     def get_webpage(self, headers: dict = None) -> str:
         """
         Get the webpage HTML text
@@ -72,12 +94,28 @@ class WebpageParser:
         This method caches the webpage HTML texts in self.webpage.
         """
 
+        self.get_content(headers=headers)
+
+        return self.webpage
+
+    def get_content(self, headers: dict = None) -> bytes:
+        """
+        Get the raw webpage bytes without decoding them
+
+        :param headers: HTTP header
+        :return: Webpage bytes
+
+        Notes
+        -----
+        This method caches the webpage bytes in self.content.
+        """
+
         # Default headers
         headers = {} if headers is None else headers
 
         # Get the webpage HTML text
         self.logger.debug('Getting %s webpage from %s', self.name, self.url)
-        response = requests.get(self.url, headers=headers)
+        response = self._send(headers=headers)
 
         # Cache the response object
         self.response = response
@@ -92,8 +130,137 @@ class WebpageParser:
             self.logger.error(error_msg)
             raise ResponseError(message=error_msg, response=response)
 
-        self.webpage = response.text
-        return response.text
+        self._set_content(response.content, response.encoding)
+
+        return self.content
+
+    def _set_content(self, content: bytes | None, encoding: str | None) -> None:
+        """
+        Cache the raw webpage bytes and reset the decoded webpage text
+
+        :param content: Webpage bytes
+        :param encoding: Webpage text encoding
+        """
+
+        self.content = content
+        self.encoding = encoding
+        self._webpage = None
+
+    def _send(self, headers: dict | None = None, stream: bool = False) -> requests.Response:
+        """
+        Send the HTTP request through the shared pooled session
+
+        :param headers: HTTP header
+        :param stream: Do not download the response body until it is iterated
+        :return: Response object
+        """
+
+        return get_session().get(self.url, headers=headers, stream=stream)
+
+    # region streaming
+
+    def stream(self, chunk_size: int = 64 * 1024, headers: dict = None) -> Iterator[bytes]:
+        """
+        Stream the raw webpage bytes in chunks without holding the whole document in memory
+
+        :param chunk_size: Chunk size in bytes
+        :param headers: HTTP header
+        :return: Iterator of webpage byte chunks
+
+        Notes
+        -----
+        Streamed webpages are not cached in self.content.
+        """
+
+        self.logger.debug('Streaming %s webpage from %s', self.name, self.url)
+        response = self._send(headers=headers, stream=True)
+
+        # Cache the response object
+        self.response = response
+        self.response_dt = datetime.now()
+        self.content_type = response.headers.get('Content-Type')
+        self.encoding = response.encoding
+
+        # Check if response is successful
+        if response.status_code != 200:
+            error_msg = f'Response Error: {response.status_code} - {response.reason}'
+            self.logger.error(error_msg)
+            raise ResponseError(message=error_msg, response=response)
+
+        with response:
+            yield from response.iter_content(chunk_size=chunk_size)
+
+    def iter_lines(self, chunk_size: int = 64 * 1024, headers: dict = None) -> Iterator[str]:
+        """
+        Stream the webpage text line by line
+
+        :param chunk_size: Chunk size in bytes
+        :param headers: HTTP header
+        :return: Iterator of lines without line endings
+        """
+
+        decoder = None
+        buffer = ''
+
+        for chunk in self.stream(chunk_size=chunk_size, headers=headers):
+            # Encoding is known once the response headers are received
+            if decoder is None:
+                decoder = codecs.getincrementaldecoder(self.encoding or 'utf-8')(errors='replace')
+
+            buffer += decoder.decode(chunk)
+            lines = buffer.split('\n')
+
+            # Keep the last partial line in the buffer
+            buffer = lines.pop()
+            for line in lines:
+                yield line.rstrip('\r')
+
+        if decoder is not None:
+            buffer += decoder.decode(b'', final=True)
+
+        if buffer:
+            yield buffer.rstrip('\r')
+
+    def iterparse(self,
+                  tag: str | list[str],
+                  chunk_size: int = 64 * 1024,
+                  headers: dict = None) -> Iterator[etree._Element]:
+        """
+        Stream and parse the XML webpage, yielding each matching element once it is complete
+
+        :param tag: Element tag(s) to yield. Include the namespace: '{namespace}tag'
+        :param chunk_size: Chunk size in bytes
+        :param headers: HTTP header
+        :return: Iterator of complete elements
+
+        Notes
+        -----
+        Each element is cleared, along with its preceding siblings, as soon as the caller
+        moves on to the next one. Memory stays flat no matter the document size.
+        Copy any data needed from an element before advancing the iterator.
+        """
+
+        parser = etree.XMLPullParser(events=('end',), tag=tag,
+                                     resolve_entities=False, no_network=True, huge_tree=True)
+
+        def __read_events() -> Iterator[etree._Element]:
+            for _, element in parser.read_events():
+                yield element
+
+                # Free the consumed element and any preceding siblings
+                element.clear(keep_tail=True)
+                parent = element.getparent()
+                while parent is not None and element.getprevious() is not None:
+                    del parent[0]
+
+        for chunk in self.stream(chunk_size=chunk_size, headers=headers):
+            parser.feed(chunk)
+            yield from __read_events()
+
+        parser.close()
+        yield from __read_events()
+
+    # endregion streaming
 
     def get_soup(self) -> bs:
         """
@@ -106,15 +273,15 @@ class WebpageParser:
         This method caches the BeautifulSoup object in self.soup.
         """
 
-        # Check if webpage HTML text is cached. If not, get webpage first.
-        if self.webpage is None:
-            self.get_webpage()
+        # Check if webpage is cached. If not, get webpage first.
+        if self.content is None and self.webpage is None:
+            self.get_content()
 
         # User appropriate parser. Default is lxml.
         parser = 'xml' if 'xml' in self.content_type else 'lxml'
 
-        # Parse the webpage contents
-        self.soup = bs(self.webpage, parser)
+        # Parse the raw webpage bytes. BeautifulSoup detects the encoding.
+        self.soup = bs(self.content if self.content is not None else self.webpage, parser)
 
         return self.soup
 
@@ -0,0 +1,48 @@
+"""
+XML Parser File
+
+Reusable, preconfigured lxml parsers that parse raw response bytes directly.
+"""
+
+import threading
+
+# pylint: disable=c-extension-no-member
+# lxml.etree does have 'XMLParser' and 'fromstring' methods
+from lxml import etree
+
+# lxml parsers must not be shared between threads. Keep one parser per thread.
+_local: threading.local = threading.local()
+
+
+def get_xml_parser() -> etree.XMLParser:
+    """
+    Get the XML parser of the current thread
+
+    :return: lxml XMLParser
+
+    Notes
+    -----
+    Entities and network access are disabled. Huge trees are allowed for large documents.
+    """
+
+    parser = getattr(_local, 'parser', None)
+
+    if parser is None:
+        parser = etree.XMLParser(resolve_entities=False,
+                                 no_network=True,
+                                 huge_tree=True,
+                                 collect_ids=False)
+        _local.parser = parser
+
+    return parser
+
+
+def parse_xml(content: bytes) -> etree._Element:
+    """
+    Parse raw XML bytes without decoding them first
+
+    :param content: XML document bytes (the document encoding declaration is respected)
+    :return: Root element
+    """
+
+    return etree.fromstring(content, parser=get_xml_parser())
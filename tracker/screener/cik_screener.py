@@ -7,6 +7,7 @@ from pathlib import Path
 
 import pandas as pd
 
+from baseurls import SEC_CIK_LOOKUP
 from defs import DATA_DIR_PATH
 from tracker.parser import SECParser, ResponseError
 
@@ -18,7 +19,7 @@ class CIKScreener:
 
     def __init__(self):
         # Lookup Data
-        self.lookup_url: str = "https://www.sec.gov/Archives/edgar/cik-lookup-data.txt"
+        self.lookup_url: str = SEC_CIK_LOOKUP
         self.lookup_df: pd.DataFrame = pd.DataFrame()
         self.lookup_source_from_url: bool | None = None  # True: lookup_df from URL. False: parquet
 
@@ -62,23 +63,32 @@ class CIKScreener:
         return self.lookup_df
 
     def _get_lookup_df_from_url(self) -> pd.DataFrame | None:
-        # Get cik master-list from SEC
+        """
+        Get the CIK Lookup DataFrame from the SEC cik-lookup-data.txt file
+
+        :return: CIK Lookup DataFrame (pd.DataFrame) or None if not loaded
+
+        Note
+        ----
+        The file is streamed line by line and never held in memory as a whole.
+        Line format: 'COMPANY NAME:0000000000:'
+        """
+
+        companies: list[str] = []
+        ciks: list[str] = []
+
+        # Stream cik master-list from SEC
         try:
-            self.parser.get_webpage()
+            for line in self.parser.iter_lines():
+                # Split last 12 characters of company name to get CIK
+                companies.append(line[:-12])
+                ciks.append(line[-11:-1])
         except ResponseError:
             print(f"Failed to get {self.lookup_url}.")
             return None
 
-        data = self.parser.webpage.split("\n")
-
         # Create DataFrame from the data
-        df = pd.DataFrame(data, columns=["company"])
-
-        # Split last 12 characters of company name to get CIK
-        df["cik"] = df["company"].str[-11:-1]
-
-        # Update company column to remove CIK
-        df["company"] = df["company"].str[:-12]
+        df = pd.DataFrame({"company": companies, "cik": ciks})
 
         # Cache lookup_df
         self.lookup_df = df
@@ -3,6 +3,7 @@ SEC EDGAR Screener
 https://www.sec.gov/edgar/search/#
 """
 
+import asyncio
 from copy import deepcopy
 from urllib.parse import urlencode
 
@@ -10,6 +11,8 @@ import pandas as pd
 
 from baseurls import SEC_EDGAR, SEC_FILING_DATA
 from tracker.parser import EdgarParser, Form4Parser
+from tracker.parser.sec import gather_bounded
+from tracker.utils.ratelimit import priority, BACKGROUND
 
 
 class EdgarScreener:
@@ -84,6 +87,7 @@ class EdgarScreener:
         Notes:
         - Cached to self.parsed_filings.
         - This is a slow operation (Takes ~12.5s at 8 filings per second).
+        - Filings are downloaded concurrently, so it is bound by the rate limit, not latency.
         """
 
         # Get filings first
@@ -111,7 +115,7 @@ class EdgarScreener:
         # Initialize parsed filings dict
         parsed_filings: dict = {}
 
-        def __parse_filing(url: str, acc_no: str) -> dict[str, pd.DataFrame]:
+        async def __parse_filing(url: str, acc_no: str) -> dict[str, pd.DataFrame]:
             """
             Parse Filing
             :param url: Filing XML Document URL
@@ -119,15 +123,21 @@ class EdgarScreener:
             :return: Parsed Filing Tables
             """
             __parser = Form4Parser(acc_no, url)
+            await __parser.aget_content()
             __data = __parser.parse()
 
-            parsed_filings.update({acc_no: __data})
-
             return {acc_no: __data}
 
-        # Iterate through filings and parse each filing
-        for _, row in results.iterrows():
-            __parse_filing(row['link'], row['id'].split(":")[0])
+        # Download and parse all filings concurrently under the SEC rate limit.
+        # Bulk downloads only use the capacity interactive requests leave unused.
+        with priority(BACKGROUND):
+            parsed = asyncio.run(gather_bounded([__parse_filing(row['link'],
+                                                                row['id'].split(":")[0])
+                                                 for _, row in results.iterrows()]))
+
+        # Keep the filings order
+        for parsed_filing in parsed:
+            parsed_filings.update(parsed_filing)
 
         # Cache parsed filings
         self.parsed_filings = parsed_filings
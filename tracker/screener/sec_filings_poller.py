@@ -0,0 +1,149 @@
+"""
+SEC Latest Filings Poller
+Incrementally polls the SEC latest filings feed for new filings.
+"""
+
+from collections import deque
+
+import pandas as pd
+
+from tracker.parser.sec_latest_filings_parser import FILING_COLUMNS, SECFilingsParser
+from tracker.utils.clock import Clock, get_clock
+from .sec_filings_screener import SECFilingsScreener
+
+
+# pylint: disable=too-many-instance-attributes
+# Many attributes are required for modularity
+class SECFilingsPoller:
+    """
+    SEC Latest Filings Poller Class
+
+    Remembers the newest accession number seen (high-water mark) and only gets the
+    filings newer than it on each poll. New filings are kept in a bounded ring.
+    """
+
+    # pylint: disable=too-many-arguments
+    # Many arguments are required for modularity
+    def __init__(self,
+                 screener: SECFilingsScreener,
+                 size: int = 1000,
+                 head_count: int = 20,
+                 max_count: int = 2000,
+                 prefetch: int = 4,
+                 interval: float = 0,
+                 filter_str: str | None = 'index',
+                 filter_condition: str = 'contains',
+                 clock: Clock | None = None):
+        """
+        SEC Filings Poller Class Constructor
+
+        :param screener: Filings screener (filters and pagination)
+        :param size: Maximum number of filings kept in the ring
+        :param head_count: Entries checked for new filings on each poll [10, 20, 40, 80, 100]
+        :param max_count: Maximum entries to page through to reach the high-water mark
+        :param prefetch: Pages fetched in parallel while paging to the high-water mark
+        :param interval: Minimum seconds between polls. Earlier polls get nothing.
+        :param filter_str: Filings filter. See SECFilingsScreener.get_filings().
+        :param filter_condition: Filter condition ('endswith' | 'contains')
+        :param clock: Clock for the poll interval. Defaults to the process clock.
+        """
+
+        self.screener: SECFilingsScreener = screener
+        self.head_count: int = head_count
+        self.max_count: int = max_count
+        self.prefetch: int = prefetch
+        self.interval: float = interval
+        self.filter_str: str | None = filter_str
+        self.filter_condition: str = filter_condition
+        self.clock: Clock | None = clock
+
+        # Parser of the newest entries.
+        # Kept apart from the screener parser, so its conditional GET validators
+        # survive the screener paging to the high-water mark.
+        self.parser: SECFilingsParser = SECFilingsParser(
+            f'{screener.name}_head', screener.build_url(override_count=head_count))
+
+        # Newest accession number seen in the feed
+        self.high_water: str | None = None
+
+        # Filings ring, newest first: (accession number, row)
+        self.ring: deque[tuple[str, dict]] = deque(maxlen=size)
+
+        # Clock time of the last poll
+        self.updated: float | None = None
+
+    @property
+    def filings(self) -> pd.DataFrame:
+        """
+        :return: Filings in the ring, newest first
+        """
+
+        filings = pd.DataFrame([row for _, row in self.ring], index=[acc for acc, _ in self.ring],
+                               columns=FILING_COLUMNS[1:])
+        filings.index.name = 'acc'
+
+        return filings
+
+    def poll(self) -> pd.DataFrame:
+        """
+        Get the filings newer than the high-water mark and add them to the ring
+
+        :return: New filings, newest first
+
+        Notes
+        -----
+        The first poll gets one full page of filings.
+        Later polls check the newest head_count entries (usually a 304 Not Modified)
+        and only page further with get_filings_until() if the mark is not among them.
+        """
+
+        # Too early to poll again
+        now = get_clock(self.clock).time()
+        if self.updated is not None and now - self.updated < self.interval:
+            return self._empty()
+        self.updated = now
+
+        if self.high_water is None:
+            self.screener.get_url()
+            filings = self.screener.parser.parse()
+        else:
+            filings = self.parser.parse()
+
+            # Page through older filings if there are more new filings than head_count
+            if not filings.empty and self.high_water not in filings.index:
+                filings = self.screener.get_filings_until(self.high_water, self.max_count,
+                                                          prefetch=self.prefetch)
+
+        if filings.empty:
+            return self._empty()
+
+        # Remove duplicates by index and the filings older than the mark
+        filings = filings[~filings.index.duplicated(keep='first')]
+        if self.high_water in filings.index:
+            filings = filings.loc[:self.high_water].iloc[:-1]
+
+        # Move the mark before filtering, so filtered out filings are not fetched again
+        if not filings.empty:
+            self.high_water = filings.index[0]
+
+        # Filter the new filings like SECFilingsScreener.get_filings()
+        if self.screener.form is not None:
+            filings = filings[filings['form_type'] == self.screener.form]
+        filings = self.screener.filter_filings(filings, self.filter_str, self.filter_condition)
+
+        # Skip filings still in the ring (the feed can repeat filings across pages)
+        filings = filings[~filings.index.isin([acc for acc, _ in self.ring])]
+
+        # Add the new filings to the ring, newest first
+        self.ring.extendleft(reversed(list(zip(filings.index,
+                                               filings.to_dict('records')))))
+
+        return filings
+
+    @staticmethod
+    def _empty() -> pd.DataFrame:
+        """
+        :return: Empty filings DataFrame
+        """
+
+        return pd.DataFrame(columns=FILING_COLUMNS).set_index('acc')
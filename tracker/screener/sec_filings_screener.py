@@ -3,6 +3,9 @@ SEC Latest Filings Screener
 https://www.sec.gov/cgi-bin/browse-edgar?action=getcurrent
 """
 
+import asyncio
+from collections import deque
+from typing import AsyncIterator, Iterator
 from urllib.parse import urlencode
 
 import pandas as pd
@@ -10,6 +13,9 @@ import pandas as pd
 from baseurls import SEC_LATEST_FILINGS
 from tracker.parser.sec_latest_filings_parser import SECFilingsParser
 
+# Maximum entries per page allowed by SEC
+PAGE_COUNT: int = 100
+
 
 # pylint: disable=too-many-instance-attributes
 # Many attributes are required for modularity
@@ -170,14 +176,16 @@ class SECFilingsScreener:
 
         return url
 
-    def get_url(self) -> str:
+    def get_url(self, override_count: int | None = None, start_count: int | None = None) -> str:
         """
         Get the URL and cache it both locally and in the parser.
 
+        :param override_count: Override the count
+        :param start_count: Start count (for pagination)
         :return: URL
         """
 
-        self.build_url()
+        self.build_url(override_count=override_count, start_count=start_count)
 
         # Update the parser URL
         self.parser.set_url(self.url)
@@ -219,6 +227,21 @@ class SECFilingsScreener:
         # Cache the filings before string filtering
         self.filings = filings
 
+        return self.filter_filings(filings, filter_str, filter_condition)
+
+    @staticmethod
+    def filter_filings(filings: pd.DataFrame,
+                       filter_str: str | None = "index",
+                       filter_condition: str = "contains") -> pd.DataFrame:
+        """
+        Filter the filings by title
+
+        :param filings: Filings
+        :param filter_str: Filings filter 'title' endswith. See get_filings().
+        :param filter_condition: Filter condition ('endswith' | 'contains')
+        :return: Filtered filings
+        """
+
         # Apply filter_str and filter_condition
         # Remove duplicates by index if filter is None
         if filter_str == 'index':
@@ -236,68 +259,191 @@ class SECFilingsScreener:
 
         return filings
 
-    def get_filings_until(self, accession_number: str, max_count: int = 2000) -> pd.DataFrame:
+    def get_filings_until(self,
+                          accession_number: str,
+                          max_count: int = 2000,
+                          prefetch: int = 0) -> pd.DataFrame:
         """
         Get Filings until filing with accession number is found before max_count.
 
         :param accession_number: SEC Filing Accession Number (required)
                                     (Format: ##########-##-######)
         :param max_count: Maximum filings to get (default and max is 2000)
+        :param prefetch: Pages to fetch in parallel. 0 fetches one page at a time.
         :return: Filings (pd.DataFrame)
 
         Notes
         -----
         If the accession number is not found, the filings will be returned up to the max_count.
         Does include the filing with given accession number in the returned dataframe.
+        See iter_filings_until() to process the filings page by page.
+        """
+
+        pages = list(self.iter_filings_until(accession_number, max_count, prefetch=prefetch))
+
+        # Concatenate the pages once
+        if not pages:
+            return pd.DataFrame()
+
+        return pd.concat(pages, ignore_index=False, sort=False, axis=0)
+
+    def iter_filings_until(self,
+                           accession_number: str,
+                           max_count: int = 2000,
+                           prefetch: int = 0,
+                           window: int | None = None) -> Iterator[pd.DataFrame]:
+        """
+        Yield the Filings page by page until filing with accession number is found.
+
+        :param accession_number: SEC Filing Accession Number (required)
+                                    (Format: ##########-##-######)
+        :param max_count: Maximum filings to get (default and max is 2000)
+        :param prefetch: Pages to fetch in parallel. 0 fetches one page at a time.
+        :param window: Previous pages remembered to drop repeated filings.
+                       None remembers all pages. 1 keeps memory bounded to one page.
+        :return: Deduplicated filings of each page, newest first
+
+        Notes
+        -----
+        Each page is yielded as soon as it is parsed, so callers can start working
+        on the first page while the next pages download.
+        The last page ends with the filing with the given accession number.
+
+        With prefetch, up to prefetch pages are in flight at once on a private event loop.
+        All pages share the SEC rate limit. Pages still in flight when the filing is found
+        (or the generator is closed) are cancelled and dropped.
+        Do not use prefetch inside a running event loop.
+
+        New filings shift the feed between requests, so a page can repeat the last
+        filings of the previous page. Those are dropped. A window of 1 is enough
+        unless more than a page of filings is published during the paging.
         """
 
         # Check max_count bound
         max_count = min(abs(max_count), 2000)
 
-        # Set count to 100 (Max allowed by SEC per request)
-        count: int = 100
-        start: int = 0
-        found: bool = False
+        pages = self._iter_pages(max_count) if prefetch <= 0 \
+            else self._iter_prefetched_pages(max_count, prefetch)
+
+        # Accession numbers of the previous pages
+        seen: deque[pd.Index] = deque(maxlen=window)
+
+        try:
+            for df in pages:
+                # Remove duplicates by index
+                df = df[~df.index.duplicated(keep='first')]
+
+                # Check if the filing was found.
+                # Check membership first: slicing a sorted index by a missing label does not raise.
+                found = accession_number in df.index
+                if found:
+                    df = df.loc[:accession_number]
 
-        # Initialize the filings dataframe
-        filings: pd.DataFrame = pd.DataFrame()
+                # Drop the filings of the previous pages
+                for index in seen:
+                    df = df[~df.index.isin(index)]
+                seen.append(df.index)
 
-        # Cache last index
-        last_index: str = ""
+                if not df.empty:
+                    yield df
 
-        # Loop until we find the filing, or we reach the max count
-        while not found and start < max_count:
-            # Build URL to get the filings
-            self.build_url(override_count=count, start_count=start)
+                if found:
+                    break
+
+        finally:
+            pages.close()
+
+    def _iter_pages(self, max_count: int) -> Iterator[pd.DataFrame]:
+        """
+        Get the pages one at a time with the screener parser
+
+        :param max_count: Maximum filings to get
+        :return: Filings of each page
+        """
+
+        for start in range(0, max_count, PAGE_COUNT):
+            # Build URL to get the filings and update the parser URL
+            self.get_url(override_count=PAGE_COUNT, start_count=start)
 
             # Get the filings and parse to a dataframe
             df = self.parser.parse()
 
-            # Remove duplicates by index
-            df = df[~df.index.duplicated(keep='first')]
+            # Reached the end of the feed
+            if df.empty:
+                return
 
-            # Check if the filing was found
-            try:
-                df = df.loc[:accession_number]
-                found = True
-            except (pd.errors.InvalidIndexError, KeyError):
-                pass
+            yield df
 
-            # Append the dataframe to the filings
-            if filings.empty:
-                filings = df
-                last_index = df.iloc[-1].index
+    def _iter_prefetched_pages(self, max_count: int, prefetch: int) -> Iterator[pd.DataFrame]:
+        """
+        Get the pages in parallel on a private event loop
 
-            else:
-                # Trim df to the last index to avoid duplicates
+        :param max_count: Maximum filings to get
+        :param prefetch: Maximum pages in flight at once
+        :return: Filings of each page, in feed order
+        """
+
+        loop = asyncio.new_event_loop()
+        pages = self._aiter_pages(max_count, prefetch)
+
+        try:
+            while True:
                 try:
-                    df = df.loc[last_index:]
-                except (pd.errors.InvalidIndexError, KeyError):
-                    pass
+                    df = loop.run_until_complete(pages.__anext__())
+                except StopAsyncIteration:
+                    return
 
-                filings = pd.concat([filings, df], ignore_index=False, sort=False, axis=0)
+                # The loop is paused while the caller works on the page.
+                # Requests already sent keep downloading in worker threads.
+                yield df
 
-            # Increment the start count
-            start += count
+        finally:
+            # Cancel the pages in flight
+            loop.run_until_complete(pages.aclose())
+            loop.run_until_complete(loop.shutdown_default_executor())
+            loop.close()
 
-        return filings
+    async def _aiter_pages(self, max_count: int, prefetch: int) -> AsyncIterator[pd.DataFrame]:
+        """
+        Get the pages with up to prefetch requests in flight
+
+        :param max_count: Maximum filings to get
+        :param prefetch: Maximum pages in flight at once
+        :return: Filings of each page, in feed order
+        """
+
+        starts = iter(range(0, max_count, PAGE_COUNT))
+        pages: deque[asyncio.Task] = deque()
+
+        async def _aparse(_parser: SECFilingsParser) -> pd.DataFrame:
+            await _parser.aget_content()
+            return _parser.parse(force_refresh=False)
+
+        def _fill() -> None:
+            # Keep prefetch pages in flight, in feed order
+            while len(pages) < prefetch and (start := next(starts, None)) is not None:
+                # One parser per page, so pages do not overwrite each other
+                parser = SECFilingsParser(f'{self.name}_{start}',
+                                          self.build_url(override_count=PAGE_COUNT,
+                                                         start_count=start))
+                pages.append(asyncio.create_task(_aparse(parser)))
+
+        try:
+            _fill()
+
+            while pages:
+                df = await pages.popleft()
+
+                # Reached the end of the feed
+                if df.empty:
+                    return
+
+                yield df
+
+                _fill()
+
+        finally:
+            # Drop the surplus pages
+            for page in pages:
+                page.cancel()
+            await asyncio.gather(*pages, return_exceptions=True)
@@ -0,0 +1,176 @@
+"""
+Clocks for time-dependent utilities (RateLimit, TokenBucket, Retry, pollers)
+
+The system clock reads the wall time and really sleeps.
+The virtual clock advances instantly when slept on, so hours of rate-limited
+polling can be simulated in milliseconds.
+"""
+
+import asyncio
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class SystemClock:
+    """
+    Wall clock
+    """
+
+    @staticmethod
+    def time() -> float:
+        """
+        :return: Current time in seconds since the epoch
+        """
+
+        return time.time()
+
+    @staticmethod
+    def sleep(seconds: float) -> None:
+        """
+        Block the current thread
+
+        :param seconds: Time to sleep
+        """
+
+        time.sleep(seconds)
+
+    @staticmethod
+    async def asleep(seconds: float) -> None:
+        """
+        Wait without blocking the event loop
+
+        :param seconds: Time to sleep
+        """
+
+        await asyncio.sleep(seconds)
+
+
+class VirtualClock:
+    """
+    Simulated clock. Sleeping advances the clock instead of waiting.
+
+    Notes
+    -----
+    Sleeps advance one shared timeline, so concurrent sleepers add up.
+    Use it to simulate one caller at a time (e.g. a poller loop).
+    """
+
+    def __init__(self, start: float | None = None):
+        """
+        VirtualClock Constructor
+
+        :param start: Start time in seconds since the epoch. Defaults to the wall time,
+                      so state recorded with the system clock stays consistent.
+        """
+
+        self.now: float = time.time() if start is None else start
+        self.start: float = self.now
+
+        # Total simulated sleep time
+        self.slept: float = 0.0
+
+        self.lock: threading.Lock = threading.Lock()
+
+    def time(self) -> float:
+        """
+        :return: Simulated time in seconds since the epoch
+        """
+
+        with self.lock:
+            return self.now
+
+    def sleep(self, seconds: float) -> None:
+        """
+        Advance the clock
+
+        :param seconds: Time to sleep
+        """
+
+        self.advance(seconds)
+        self.slept += max(0.0, seconds)
+
+    async def asleep(self, seconds: float) -> None:
+        """
+        Advance the clock and yield to the event loop
+
+        :param seconds: Time to sleep
+        """
+
+        self.sleep(seconds)
+        await asyncio.sleep(0)
+
+    def advance(self, seconds: float) -> float:
+        """
+        Move the clock forward (e.g. to simulate work between calls)
+
+        :param seconds: Time to advance by
+        :return: Simulated time
+        """
+
+        with self.lock:
+            self.now += max(0.0, seconds)
+            return self.now
+
+    @property
+    def elapsed(self) -> float:
+        """
+        :return: Simulated seconds since the start
+        """
+
+        return self.time() - self.start
+
+
+# Clock = SystemClock | VirtualClock
+Clock = SystemClock | VirtualClock
+
+# Process default clock. Used by everything that was not given a clock.
+_clock: Clock = SystemClock()
+
+
+def get_clock(clock: Clock | None = None) -> Clock:
+    """
+    Get the clock to use
+
+    :param clock: Injected clock
+    :return: clock if given, else the process default clock
+    """
+
+    return clock if clock is not None else _clock
+
+
+def set_clock(clock: Clock) -> Clock:
+    """
+    Set the process default clock
+
+    :param clock: New default clock
+    :return: Previous default clock
+    """
+
+    global _clock  # pylint: disable=global-statement, invalid-name
+    previous, _clock = _clock, clock
+
+    return previous
+
+
+@contextmanager
+def use_clock(clock: Clock) -> Iterator[Clock]:
+    """
+    Use a clock as the process default inside the context
+
+    :param clock: Clock (e.g. VirtualClock())
+    :return: clock
+
+    Usage:
+        with use_clock(VirtualClock()) as clock:
+            poller.poll()
+            print(clock.elapsed)
+    """
+
+    previous = set_clock(clock)
+
+    try:
+        yield clock
+    finally:
+        set_clock(previous)
@@ -0,0 +1,205 @@
+"""
+Disk Cache for immutable web documents
+"""
+
+import contextlib
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+from common import Logger
+
+
+class DiskCache:
+    """
+    Content cache on disk keyed by URL.
+    Size-capped with least-recently-used eviction.
+
+    Notes
+    -----
+    Each entry is one file: '<content_type>\\t<encoding>\\n<body>'.
+    Writes go to a temporary file that is atomically renamed into place,
+    so concurrent readers (threads or processes) only ever see complete entries.
+    Reads touch the file modification time, which is used as the LRU order.
+    """
+
+    def __init__(self,
+                 path: Path,
+                 max_size: int,
+                 logger: logging.Logger | None = None):
+        """
+        DiskCache Constructor
+
+        :param path: Cache directory
+        :param max_size: Maximum cache size in bytes
+        :param logger: Logger
+        """
+
+        self.path: Path = path
+        self.max_size: int = max_size
+
+        if logger is not None:
+            self.logger: logging.Logger = logger
+        else:
+            self.logger = Logger('cache', file_handler=True, stream_handler=True).get_logger()
+
+        # Approximate total size of the cache in bytes. Computed on first write.
+        self.size: int | None = None
+
+        # Lock to protect size bookkeeping and eviction
+        self.lock: threading.Lock = threading.Lock()
+
+    def __contains__(self, url: str) -> bool:
+        """
+        :return: True if url is cached
+        """
+
+        return self._get_file(url).exists()
+
+    def get(self, url: str) -> tuple[str, str | None, bytes] | None:
+        """
+        Get a cached document
+
+        :param url: Document URL
+        :return: (content_type, encoding, body) or None if not cached
+        """
+
+        file = self._get_file(url)
+
+        try:
+            with open(file, 'rb') as file_obj:
+                data = file_obj.read()
+
+            # Mark as recently used
+            os.utime(file)
+
+        # Not cached or evicted by another reader
+        except FileNotFoundError:
+            return None
+
+        header, body = data.split(b'\n', 1)
+        content_type, encoding = header.decode('utf-8').split('\t')
+
+        return content_type, encoding or None, body
+
+    def put(self, url: str, content_type: str, encoding: str | None, body: bytes) -> bool:
+        """
+        Cache a document
+
+        :param url: Document URL
+        :param content_type: Document Content-Type
+        :param encoding: Document text encoding
+        :param body: Document body
+        :return: True if cached, False otherwise
+        """
+
+        data = f'{content_type}\t{encoding or ""}\n'.encode('utf-8') + body
+
+        # Do not cache documents larger than the cache
+        if len(data) > self.max_size:
+            return False
+
+        file = self._get_file(url)
+        tmp_name: str | None = None
+
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+
+            # Write to a temporary file in the same directory and atomically rename it
+            with tempfile.NamedTemporaryFile(dir=self.path, suffix='.tmp', delete=False) as tmp:
+                tmp_name = tmp.name
+                tmp.write(data)
+
+            # Size of the entry being replaced
+            try:
+                old_size = os.path.getsize(file)
+            except FileNotFoundError:
+                old_size = 0
+
+            os.replace(tmp_name, file)
+
+        except OSError as error:
+            self.logger.error('Failed to cache %s. Error: %s', url, error)
+
+            # Do not leave the temporary file behind
+            if tmp_name is not None:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_name)
+
+            return False
+
+        with self.lock:
+            if self.size is None:
+                self.size = self._get_size()
+            else:
+                self.size += len(data) - old_size
+
+            if self.size > self.max_size:
+                self._evict()
+
+        return True
+
+    def clear(self) -> None:
+        """
+        Delete all cached documents
+        """
+
+        with self.lock:
+            for file in self.path.glob('*.cache'):
+                file.unlink(missing_ok=True)
+
+            self.size = 0
+
+    def _get_file(self, url: str) -> Path:
+        """
+        :param url: Document URL
+        :return: Cache file path of url
+        """
+
+        return self.path.joinpath(f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.cache")
+
+    def _get_size(self) -> int:
+        """
+        :return: Total size of the cache files in bytes
+        """
+
+        size = 0
+        for file in self.path.glob('*.cache'):
+            try:
+                size += file.stat().st_size
+            except FileNotFoundError:
+                pass
+
+        return size
+
+    def _evict(self) -> None:
+        """
+        Delete least recently used files until the cache is below max_size.
+        Must be called with the lock held.
+        """
+
+        # Stat all files. Other processes may have written or evicted files.
+        files = []
+        for file in self.path.glob('*.cache'):
+            try:
+                stat = file.stat()
+                files.append((stat.st_mtime, stat.st_size, file))
+            except FileNotFoundError:
+                pass
+
+        # Oldest first
+        files.sort()
+
+        self.size = sum(size for _, size, _ in files)
+
+        for _, size, file in files:
+            if self.size <= self.max_size:
+                break
+
+            file.unlink(missing_ok=True)
+            self.size -= size
+
+            self.logger.debug('Evicted %s from cache.', file.name)
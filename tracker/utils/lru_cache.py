@@ -0,0 +1,152 @@
+"""
+Memory-bounded LRU Cache
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+# pylint: disable=too-many-instance-attributes
+# Many attributes are required for modularity
+class LRUCache:
+    """
+    Thread-safe least-recently-used cache bounded by memory size.
+    Tracks hit and miss counts.
+    """
+
+    def __init__(self,
+                 max_size: int,
+                 sizeof: Callable[[Any], int] = sys.getsizeof):
+        """
+        LRUCache Constructor
+
+        :param max_size: Maximum total size of cached values in bytes
+        :param sizeof: Function that returns the size of a value in bytes
+        """
+
+        self.max_size: int = max_size
+        self.sizeof: Callable[[Any], int] = sizeof
+
+        # Cached {key: (value, size)}. Least recently used first.
+        self._data: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+
+        # Total size of cached values in bytes
+        self.size: int = 0
+
+        # Statistics
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+        # Lock to protect the cache from multiple threads
+        self.lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """
+        :return: Number of cached values
+        """
+
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """
+        :return: True if key is cached. Does not count as a hit or miss.
+        """
+
+        return key in self._data
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached value and mark it as recently used
+
+        :param key: Cache key
+        :param default: Value to return if key is not cached
+        :return: Cached value or default
+        """
+
+        with self.lock:
+            try:
+                value, _ = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+
+            return value
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached value without marking it as recently used or counting a hit or miss
+
+        :param key: Cache key
+        :param default: Value to return if key is not cached
+        :return: Cached value or default
+        """
+
+        with self.lock:
+            item = self._data.get(key)
+
+        return item[0] if item is not None else default
+
+    def put(self, key: Hashable, value: Any) -> bool:
+        """
+        Cache a value and evict least recently used values over max_size
+
+        :param key: Cache key
+        :param value: Value to cache
+        :return: True if cached, False if value is larger than max_size
+        """
+
+        size = self.sizeof(value)
+
+        # Do not cache values larger than the cache
+        if size > self.max_size:
+            return False
+
+        with self.lock:
+            # Replace existing value
+            if key in self._data:
+                self.size -= self._data.pop(key)[1]
+
+            self._data[key] = (value, size)
+            self.size += size
+
+            # Evict least recently used values
+            while self.size > self.max_size:
+                _, (_, evicted_size) = self._data.popitem(last=False)
+                self.size -= evicted_size
+                self.evictions += 1
+
+        return True
+
+    def clear(self) -> None:
+        """
+        Delete all cached values and reset statistics
+        """
+
+        with self.lock:
+            self._data.clear()
+            self.size = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> dict[str, int]:
+        """
+        Get cache statistics
+
+        :return: {'hits', 'misses', 'evictions', 'count', 'size'}
+        """
+
+        with self.lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'count': len(self._data),
+                'size': self.size
+            }
@@ -0,0 +1,88 @@
+"""
+Prometheus Metrics
+
+Metrics are prometheus_client Counters, Gauges and Histograms in the default registry.
+Under gunicorn, every worker writes its values to files in PROMETHEUS_MULTIPROC_DIR
+(see gunicorn.conf.py) and render() aggregates all workers.
+"""
+
+import os
+import threading
+from typing import Callable
+
+from prometheus_client import REGISTRY, CollectorRegistry, generate_latest, multiprocess
+
+# Default histogram buckets in seconds
+DEFAULT_BUCKETS: tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+                                      1, 2.5, 5, 10, 30)
+
+# Functions called before rendering to update gauges from other sources
+_collectors: list[Callable[[], None]] = []
+_collectors_lock: threading.Lock = threading.Lock()
+
+
+def add_collector(collector: Callable[[], None]) -> None:
+    """
+    Add a function that is called before rendering (e.g. to set gauges)
+
+    :param collector: Collector function
+    """
+
+    with _collectors_lock:
+        _collectors.append(collector)
+
+
+def collect() -> None:
+    """
+    Call all collectors
+    """
+
+    with _collectors_lock:
+        collectors = list(_collectors)
+
+    for collector in collectors:
+        collector()
+
+
+def is_multiprocess() -> bool:
+    """
+    :return: True if metrics are shared between processes (PROMETHEUS_MULTIPROC_DIR is set)
+    """
+
+    return bool(os.environ.get('PROMETHEUS_MULTIPROC_DIR'))
+
+
+def render() -> bytes:
+    """
+    :return: All metrics in the Prometheus text exposition format
+
+    Notes
+    -----
+    In multiprocess mode, the metrics of all workers are aggregated from their files.
+    Collectors only run in the process answering the scrape, so the gauges they set
+    are as of the last scrape each worker answered.
+    """
+
+    collect()
+
+    if is_multiprocess():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+
+    return generate_latest(registry)
+
+
+def get_value(name: str, **labels) -> float:
+    """
+    Get a sample value of this process
+
+    :param name: Sample name (e.g. 'sec_requests_total', 'sec_request_seconds_count')
+    :param labels: Sample labels
+    :return: Sample value. 0 if not recorded.
+    """
+
+    value = REGISTRY.get_sample_value(name, {key: str(value) for key, value in labels.items()})
+
+    return value if value is not None else 0
@@ -2,10 +2,100 @@
 Ratelimit decorator for functions and methods
 """
 
+import itertools
 import logging
-from time import time, sleep
+import mmap
+import os
+import struct
+import threading
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from ipaddress import ip_address
+from pathlib import Path
+from typing import Callable, Iterator
+from urllib.parse import urlparse
+
+try:
+    import fcntl
+except ImportError:  # Windows: no file locking. Shared buckets only lock between threads.
+    fcntl = None
+
+from prometheus_client import Gauge, Histogram
 
 from common import Logger
+from tracker.utils.clock import Clock, get_clock
+from tracker.utils.metrics import DEFAULT_BUCKETS
+
+# Priority classes, highest first
+INTERACTIVE: str = 'interactive'  # Dash requests a user is waiting for
+BACKGROUND: str = 'background'  # Polling, backfill and bulk ingestion
+PRIORITIES: tuple[str, ...] = (INTERACTIVE, BACKGROUND)
+
+# Priority of the current thread or task. Copied into asyncio tasks and to_thread calls.
+_priority: ContextVar[str] = ContextVar('ratelimit_priority', default=INTERACTIVE)
+
+# Time spent waiting for a slot, labelled by decorated function and priority
+wait_seconds = Histogram('ratelimit_wait_seconds',
+                         'Time in seconds spent waiting in RateLimit by function',
+                         ['limiter', 'priority'], buckets=DEFAULT_BUCKETS)
+bucket_wait_seconds = Histogram('ratelimit_bucket_wait_seconds',
+                                'Time in seconds spent waiting for bucket tokens by priority',
+                                ['priority'], buckets=DEFAULT_BUCKETS)
+# Gauges are summed over the live workers, except the rate which is kept per worker
+queue_depth = Gauge('ratelimit_queue_depth', 'Callers waiting for bucket tokens by priority',
+                    ['priority'], multiprocess_mode='livesum')
+rate_gauge = Gauge('ratelimit_rate', 'Effective adaptive rate in requests per second',
+                   ['bucket'], multiprocess_mode='liveall')
+
+
+@contextmanager
+def priority(name: str) -> Iterator[None]:
+    """
+    Set the rate limit priority of the requests made inside the context
+
+    :param name: Priority (INTERACTIVE or BACKGROUND)
+
+    Usage:
+        with priority(BACKGROUND):
+            parser.get_content()
+    """
+
+    if name not in PRIORITIES:
+        raise ValueError(f'Invalid priority: {name}. Expected one of {PRIORITIES}.')
+
+    token = _priority.set(name)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def get_priority() -> str:
+    """
+    :return: Rate limit priority of the current thread or task
+    """
+
+    return _priority.get()
+
+
+def _uses_window(limit: int, period: int, bucket: 'TokenBucket | None') -> bool:
+    """
+    Check if a rate limit decorator needs its own rolling window
+
+    :param limit: Number of calls per period
+    :param period: Window period in seconds
+    :param bucket: Shared token bucket of the decorator
+    :return: False if the bucket alone limits the calls to the same rate or less
+
+    Notes
+    -----
+    The window is FIFO. When the bucket is at least as strict, skipping the window
+    means callers only queue in the bucket's priority lanes, so interactive callers
+    are not held behind background callers. Adaptive backoff only lowers the bucket rate.
+    """
+
+    return bucket is None or limit / period < bucket.rate
 
 
 # pylint: disable=too-many-instance-attributes, too-few-public-methods
@@ -15,19 +105,37 @@ class RateLimit:
     """
     Decorator for Rate-Limiting functions.
     Implements rolling window rate limiting.
+
+    Notes
+    -----
+    Each call reserves the next free slot in the window and then sleeps
+    outside the lock, so callers never hold the lock while they wait.
+    The window is skipped when a shared bucket is at least as strict (see _uses_window()),
+    so callers only wait in the bucket's priority lanes.
     """
 
+    # pylint: disable=too-many-arguments
+    # Many arguments are required for modularity
     def __init__(self,
                  limit: int | None = None,
                  period: int = 1,
                  max_wait: int | None = 10,
-                 logger: logging.Logger | None = None):
+                 logger: logging.Logger | None = None,
+                 bucket: 'TokenBucket | None' = None,
+                 weight: float = 1,
+                 adaptive: 'AdaptiveRate | None' = None,
+                 clock: Clock | None = None):
         """
         RateLimit decorator for functions and methods
 
         :param limit: Number of times the function can be called
         :param period: Time in seconds between calls
         :param max_wait: Maximum time in seconds to wait before raising RateLimitException
+        :param logger: Logger
+        :param bucket: Shared TokenBucket every call also draws from (see get_bucket())
+        :param weight: Number of tokens each call takes from the bucket
+        :param adaptive: AdaptiveRate fed with every call's response and duration
+        :param clock: Clock to read the time from and sleep on. Defaults to get_clock().
         """
 
         # Initialize RateLimit
@@ -49,8 +157,17 @@ class RateLimit:
         # Points to the first element in the call_times array
         self.call_times_index: int = 0
 
-        # Initialize waiting variable to hold number of function calls waiting to be made
-        self.waiting: int = 0
+        # Lock to serialize slot reservations from multiple threads
+        self.lock: threading.Lock = threading.Lock()
+
+        # Shared token bucket (e.g. one per host across all decorated functions)
+        self.bucket: TokenBucket | None = bucket
+        self.weight: float = weight
+
+        # Adaptive rate controller of the bucket
+        self.adaptive: AdaptiveRate | None = adaptive
+
+        self.clock: Clock | None = clock
 
     def __call__(self, func: callable) -> callable:
         """
@@ -69,46 +186,690 @@ class RateLimit:
             :return: Result of the function
             """
 
-            # Get the current time in seconds
-            now = time()
+            clock = get_clock(self.clock)
+            start = clock.time()
+
+            if _uses_window(self.limit, self.period, self.bucket):
+                # Reserve a slot. Callers from multiple threads queue on the lock.
+                # pylint: disable=consider-using-with
+                # 'with' cannot time out. The lock is released in the finally block below.
+                if not self.lock.acquire(timeout=-1 if self.max_wait is None
+                                         else self.max_wait):
+                    error_msg = f'Rate limit exceeded. Waited {self.max_wait}s for lock.'
+                    raise RateLimitException(error_msg, logger=self.logger)
+
+                try:
+                    wait_time = self._reserve(func, args, kwargs)
+                finally:
+                    self.lock.release()
+
+                # Wait for the slot without holding the lock
+                if wait_time > 0:
+                    clock.sleep(wait_time)
+
+            # Take the call's tokens from the shared bucket. Callers wait in priority lanes
+            # outside the lock, so interactive callers can pass waiting background callers.
+            if self.bucket is not None:
+                max_wait = None if self.max_wait is None \
+                    else self.max_wait - (clock.time() - start)
+                if self.bucket.acquire(self.weight, max_wait=max_wait) is None:
+                    error_msg = f'Rate limit exceeded. Shared bucket wait time exceeds ' \
+                                f'{self.max_wait}s calling {func.__qualname__}'
+                    raise RateLimitException(error_msg, logger=self.logger)
+
+            # Record the time spent queueing on the lock and waiting for a slot
+            call_start = clock.time()
+            wait_seconds.labels(limiter=func.__qualname__,
+                                priority=get_priority()).observe(call_start - start)
+
+            result = func(*args, **kwargs)
+
+            if self.adaptive is not None:
+                self.adaptive.record(result, clock.time() - call_start)
+
+            return result
+
+        return wrapper
+
+    def _reserve(self, func: callable, args: tuple, kwargs: dict) -> float:
+        """
+        Reserve the next permissible call time.
+        Must be called with the lock held.
+
+        :param func: Decorated function
+        :param args: Arguments for the function
+        :param kwargs: Keyword arguments for the function
+        :return: Seconds to wait until the reserved call time
+        """
+
+        # Get the current time in seconds
+        now = get_clock(self.clock).time()
+
+        # The call must be at least one period after the call limit calls ago
+        call_time = max(now, self.call_times[self.call_times_index] + self.period)
+        wait_time = call_time - now
+
+        if wait_time > 0:
+            # Log
+            self.logger.info('RateLimit: Waiting %.2fs before calling %s from %s. '
+                             'args: %s. kwargs: %s.',
+                             wait_time, func.__qualname__, func.__module__,
+                             list(args), kwargs)
+
+            # Check if wait time is greater than max_wait
+            if self.max_wait is not None and wait_time > self.max_wait:
+                error_msg = f'Rate limit exceeded. Wait time: {wait_time}'
+                raise RateLimitException(error_msg, logger=self.logger)
+
+        # Record the reserved call time and move to the next slot
+        self.call_times[self.call_times_index] = call_time
+        self.call_times_index = (self.call_times_index + 1) % self.limit
+
+        return wait_time
+
+
+# pylint: disable=too-many-instance-attributes, too-few-public-methods
+# Many attributes are required for modularity
+# Decorator does not need many public methods
+class AsyncRateLimit:
+    """
+    Decorator for Rate-Limiting coroutine functions.
+    Implements rolling window rate limiting without blocking the event loop.
+
+    Notes
+    -----
+    Each call reserves the next free slot in the window and then awaits it,
+    so other coroutines keep running while it waits.
+    Like RateLimit, the window is skipped when the shared bucket is at least as strict.
+    """
+
+    # pylint: disable=too-many-arguments
+    # Many arguments are required for modularity
+    def __init__(self,
+                 limit: int,
+                 period: int = 1,
+                 max_wait: int | None = 10,
+                 logger: logging.Logger | None = None,
+                 bucket: 'TokenBucket | None' = None,
+                 weight: float = 1,
+                 adaptive: 'AdaptiveRate | None' = None,
+                 clock: Clock | None = None):
+        """
+        AsyncRateLimit decorator for coroutine functions
+
+        :param limit: Number of times the function can be called
+        :param period: Time in seconds between calls
+        :param max_wait: Maximum time in seconds to wait before raising RateLimitException
+        :param logger: Logger
+        :param bucket: Shared TokenBucket every call also draws from (see get_bucket())
+        :param weight: Number of tokens each call takes from the bucket
+        :param adaptive: AdaptiveRate fed with every call's response and duration
+        :param clock: Clock to read the time from and sleep on. Defaults to get_clock().
+        """
+
+        self.limit: int = limit
+        self.period: int = period
+        self.max_wait: int | None = max_wait
+
+        if logger is not None:
+            self.logger: logging.Logger = logger
+        else:
+            self.logger = Logger('ratelimit', file_handler=True, stream_handler=True).get_logger()
+
+        # Reserved call times of the last n (limit) calls
+        self.call_times: list = [0] * limit
+        self.call_times_index: int = 0
+
+        # Reserving a slot never awaits. The lock only protects against other threads' loops.
+        self.lock: threading.Lock = threading.Lock()
+
+        self.bucket: TokenBucket | None = bucket
+        self.weight: float = weight
+        self.adaptive: AdaptiveRate | None = adaptive
+
+        self.clock: Clock | None = clock
+
+    def __call__(self, func: callable) -> callable:
+        """
+        Decorator for coroutine functions
 
-            # Calculate next permissible call time
-            delta_time = self.call_times[self.call_times_index] + self.period
+        :param func: Coroutine function to be decorated
+        :return: Decorated coroutine function
+        """
 
-            # Check if the first call was made within the last period
-            if delta_time >= now:
-                # Calculate wait time
-                wait_time = (delta_time - now) + (self.rate * (self.waiting % self.limit))
+        async def wrapper(*args, **kwargs):
+            """
+            Wrapper coroutine for AsyncRateLimit decorator.
 
-                # Log
-                self.logger.info('RateLimit: Waiting %.2fs before calling %s from %s. '
-                                 'args: %s. kwargs: %s.',
-                                 wait_time, func.__qualname__, func.__module__,
-                                 list(args), kwargs)
+            :param args: Arguments for the function
+            :param kwargs: Keyword arguments for the function
+            :return: Result of the function
+            """
 
-                # Check if wait time is greater than max_wait
-                if self.max_wait is not None and wait_time > self.max_wait:
-                    error_msg = f'Rate limit exceeded. Wait time: {wait_time}'
+            clock = get_clock(self.clock)
+            wait_time = self._reserve() if _uses_window(self.limit, self.period, self.bucket) \
+                else 0
+
+            if wait_time > 0:
+                self.logger.info('AsyncRateLimit: Waiting %.2fs before calling %s from %s.',
+                                 wait_time, func.__qualname__, func.__module__)
+                await clock.asleep(wait_time)
+
+            # Take the call's tokens from the shared bucket
+            if self.bucket is not None:
+                max_wait = None if self.max_wait is None else self.max_wait - wait_time
+                if (bucket_wait := await self.bucket.acquire_async(self.weight, max_wait)) \
+                        is None:
+                    error_msg = f'Rate limit exceeded. Shared bucket wait time exceeds ' \
+                                f'{self.max_wait}s calling {func.__qualname__}'
                     raise RateLimitException(error_msg, logger=self.logger)
+                wait_time += bucket_wait
+
+            wait_seconds.labels(limiter=func.__qualname__,
+                                priority=get_priority()).observe(wait_time)
+
+            call_start = clock.time()
+            result = await func(*args, **kwargs)
+
+            if self.adaptive is not None:
+                self.adaptive.record(result, clock.time() - call_start)
+
+            return result
+
+        return wrapper
+
+    def _reserve(self) -> float:
+        """
+        Reserve the next permissible call time
 
-                # Increment waiting count
-                self.waiting += 1
+        :return: Seconds to wait until the reserved call time
+        """
 
-                # Wait for the wait time
-                sleep(wait_time)
+        with self.lock:
+            now = get_clock(self.clock).time()
 
-                # Decrement waiting count
-                self.waiting -= 1
+            # The call must be at least one period after the call limit calls ago
+            call_time = max(now, self.call_times[self.call_times_index] + self.period)
+            wait_time = call_time - now
 
-            # Update the call time array
-            self.call_times[self.call_times_index] = now
+            if self.max_wait is not None and wait_time > self.max_wait:
+                error_msg = f'Rate limit exceeded. Wait time: {wait_time}'
+                raise RateLimitException(error_msg, logger=self.logger)
 
-            # Increment the call time index
+            self.call_times[self.call_times_index] = call_time
             self.call_times_index = (self.call_times_index + 1) % self.limit
 
-            return func(*args, **kwargs)
+        return wait_time
 
-        return wrapper
+
+# pylint: disable=redefined-outer-name
+# Methods take the caller 'priority' by name, like the priority() context manager
+class TokenBucket:
+    """
+    Thread-safe Token Bucket shared by many callers.
+    Tokens refill at rate per second up to capacity.
+
+    Notes
+    -----
+    Waiting callers queue in priority lanes (see PRIORITIES). A caller only takes
+    tokens when no caller of a higher priority is waiting and it is first in its lane,
+    so background callers only get the capacity interactive callers leave unused.
+    With capacity 1, no more than rate + 1 calls are made in any 1s window.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1, clock: Clock | None = None):
+        """
+        TokenBucket Constructor
+
+        :param rate: Tokens added per second
+        :param capacity: Maximum number of tokens (burst size)
+        :param clock: Clock to read the time from and sleep on. Defaults to get_clock().
+        """
+
+        self.rate: float = rate
+        self.capacity: float = capacity
+        self.clock: Clock | None = clock
+
+        # Available tokens. Negative after a call heavier than the capacity (see _try_take()).
+        self.tokens: float = capacity
+        self.updated: float = get_clock(clock).time()
+
+        # Adaptive rate state (see AdaptiveRate): times of the last decrease and rate update
+        self.last_decrease: float = 0
+        self.rate_updated: float = self.updated
+
+        self.lock: threading.Lock = threading.Lock()
+
+        # Waiting callers by priority: [(ticket, weight), ...] in arrival order
+        self.lanes: dict[str, deque] = {lane: deque() for lane in PRIORITIES}
+        self._tickets: Iterator[int] = itertools.count()
+
+    @contextmanager
+    def _state(self) -> Iterator[None]:
+        """
+        Hold the lock to read and update the bucket state
+        """
+
+        with self.lock:
+            yield
+
+    def _refill(self, now: float) -> None:
+        """
+        Add the tokens accrued since the last update. Must be called with the state held.
+
+        :param now: Current time
+        """
+
+        # The time may go back when the default clock is switched (see use_clock())
+        self.tokens = min(self.capacity, self.tokens + max(0.0, now - self.updated) * self.rate)
+        self.updated = now
+
+    def adjust_rate(self, adjust: Callable[[float, float, float], tuple[float, float]]) -> float:
+        """
+        Change the refill rate atomically from the current rate state
+
+        :param adjust: (rate, last decrease time, last update time) ->
+                       (new rate, new last decrease time). See AdaptiveRate.record().
+        :return: New rate
+        """
+
+        with self._state():
+            now = get_clock(self.clock).time()
+            self._refill(now)
+            self.rate, self.last_decrease = adjust(self.rate, self.last_decrease,
+                                                   self.rate_updated)
+            self.rate_updated = now
+
+            return self.rate
+
+    def _enqueue(self, priority: str, weight: float) -> int:
+        """
+        Join the lane of a priority
+
+        :param priority: Caller priority
+        :param weight: Number of tokens
+        :return: Ticket
+        """
+
+        with self.lock:
+            ticket = next(self._tickets)
+            self.lanes[priority].append((ticket, weight))
+            queue_depth.labels(priority=priority).set(len(self.lanes[priority]))
+
+        return ticket
+
+    def _dequeue(self, priority: str, ticket: int) -> None:
+        """
+        Leave the lane of a priority
+
+        :param priority: Caller priority
+        :param ticket: Ticket from _enqueue()
+        """
+
+        with self.lock:
+            lane = self.lanes[priority]
+            lane.remove(next(item for item in lane if item[0] == ticket))
+            queue_depth.labels(priority=priority).set(len(lane))
+
+    def _try_take(self, priority: str, ticket: int, weight: float) -> float:
+        """
+        Take the tokens if it is the caller's turn and they are available
+
+        :param priority: Caller priority
+        :param ticket: Ticket from _enqueue()
+        :param weight: Number of tokens
+        :return: 0 if the tokens were taken. Otherwise, estimated seconds to wait.
+        """
+
+        with self._state():
+            self._refill(get_clock(self.clock).time())
+
+            # Tokens needed by the callers ahead: higher lanes and earlier callers in the lane
+            ahead = 0.0
+            for lane in PRIORITIES[:PRIORITIES.index(priority)]:
+                ahead += sum(item[1] for item in self.lanes[lane])
+            for item_ticket, item_weight in self.lanes[priority]:
+                if item_ticket == ticket:
+                    break
+                ahead += item_weight
+
+            # Calls heavier than the capacity take a full bucket and leave a debt
+            needed = min(weight, self.capacity)
+            if ahead == 0 and self.tokens >= needed:
+                self.tokens -= weight
+                return 0
+
+        return max(0.001, (ahead + needed - self.tokens) / self.rate)
+
+    def acquire(self,
+                weight: float = 1,
+                max_wait: float | None = None,
+                priority: str | None = None) -> float | None:
+        """
+        Take tokens from the bucket, waiting in the priority lane until they are available
+
+        :param weight: Number of tokens
+        :param max_wait: Maximum time in seconds to wait
+        :param priority: Caller priority. Defaults to the current priority (see priority()).
+        :return: Seconds waited. None if the wait would be longer than max_wait.
+        """
+
+        clock = get_clock(self.clock)
+        priority = priority or get_priority()
+        start = clock.time()
+        ticket = self._enqueue(priority, weight)
+
+        try:
+            while (wait_time := self._try_take(priority, ticket, weight)) > 0:
+                if max_wait is not None and clock.time() - start + wait_time > max_wait:
+                    return None
+                clock.sleep(wait_time)
+        finally:
+            self._dequeue(priority, ticket)
+
+        waited = clock.time() - start
+        bucket_wait_seconds.labels(priority=priority).observe(waited)
+
+        return waited
+
+    async def acquire_async(self,
+                            weight: float = 1,
+                            max_wait: float | None = None,
+                            priority: str | None = None) -> float | None:
+        """
+        Take tokens from the bucket without blocking the event loop
+
+        :param weight: Number of tokens
+        :param max_wait: Maximum time in seconds to wait
+        :param priority: Caller priority. Defaults to the current priority (see priority()).
+        :return: Seconds waited. None if the wait would be longer than max_wait.
+        """
+
+        clock = get_clock(self.clock)
+        priority = priority or get_priority()
+        start = clock.time()
+        ticket = self._enqueue(priority, weight)
+
+        try:
+            while (wait_time := self._try_take(priority, ticket, weight)) > 0:
+                if max_wait is not None and clock.time() - start + wait_time > max_wait:
+                    return None
+                await clock.asleep(wait_time)
+        finally:
+            self._dequeue(priority, ticket)
+
+        waited = clock.time() - start
+        bucket_wait_seconds.labels(priority=priority).observe(waited)
+
+        return waited
+
+
+class SharedTokenBucket(TokenBucket):
+    """
+    Token Bucket shared by all processes on one host (e.g. gunicorn workers).
+    The bucket state is kept in a memory-mapped file locked with fcntl.flock.
+
+    Notes
+    -----
+    Priority lanes are per process. Processes share the tokens, not the lanes.
+    The rate and the adaptive rate state are shared too, so a backoff after a throttled
+    response in one process slows down every process.
+    """
+
+    # State: tokens, updated, rate, last_decrease, rate_updated (five doubles)
+    STATE: struct.Struct = struct.Struct('ddddd')
+
+    def __init__(self, path: Path, rate: float, capacity: float = 1, clock: Clock | None = None):
+        """
+        SharedTokenBucket Constructor
+
+        :param path: State file path. All processes using the same file share the bucket.
+        :param rate: Tokens added per second
+        :param capacity: Maximum number of tokens (burst size)
+        :param clock: Clock to read the time from and sleep on. Defaults to get_clock().
+        """
+
+        super().__init__(rate=rate, capacity=capacity, clock=clock)
+
+        self.path: Path = Path(path)
+
+        # File and memory map are opened per process (see _get_map())
+        self._fd: int | None = None
+        self._map: mmap.mmap | None = None
+        self._pid: int | None = None
+
+    def _get_map(self) -> mmap.mmap:
+        """
+        Open the state file and memory map it. Reopened after a fork, because flock
+        locks are shared by processes that inherited the same open file.
+
+        :return: Memory-mapped state
+        """
+
+        if self._map is None or self._pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            self._pid = os.getpid()
+
+            with self._file_lock():
+                # Initialize a new state file with a full bucket at the configured rate
+                if os.fstat(self._fd).st_size < self.STATE.size:
+                    now = get_clock(self.clock).time()
+                    os.ftruncate(self._fd, self.STATE.size)
+                    os.pwrite(self._fd,
+                              self.STATE.pack(self.capacity, now, self.rate, 0, now), 0)
+
+            self._map = mmap.mmap(self._fd, self.STATE.size)
+
+        return self._map
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """
+        Hold an exclusive lock on the state file
+        """
+
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    @contextmanager
+    def _state(self) -> Iterator[None]:
+        """
+        Hold the lock and the file lock, loading and storing the bucket state in the file
+        """
+
+        with self.lock:
+            state = self._get_map()
+
+            with self._file_lock():
+                self.tokens, self.updated, self.rate, self.last_decrease, self.rate_updated = \
+                    self.STATE.unpack_from(state)
+
+                try:
+                    yield
+                finally:
+                    self.STATE.pack_into(state, 0, self.tokens, self.updated, self.rate,
+                                         self.last_decrease, self.rate_updated)
+
+
+# pylint: disable=too-many-instance-attributes
+# Many attributes are required for modularity
+class AdaptiveRate:
+    """
+    Additive-increase / multiplicative-decrease (AIMD) control of a TokenBucket rate.
+
+    Notes
+    -----
+    Throttled responses (429, or 403 "Undeclared Automated Tool" pages) and slow
+    responses cut the rate by decrease (at most once per cooldown, since the other
+    requests in flight get the same answer). Other responses raise it by increase
+    requests/s per second back up to the ceiling (the configured rate).
+    The rate, the last decrease and the last update are kept in the bucket, so with a
+    SharedTokenBucket the backoff and cooldown apply to every process sharing it.
+    The effective rate is exported as the ratelimit_rate metric.
+    """
+
+    # pylint: disable=too-many-arguments
+    # Many arguments are required for modularity
+    def __init__(self,
+                 bucket: TokenBucket,
+                 name: str = 'bucket',
+                 floor: float = 1,
+                 decrease: float = 0.5,
+                 increase: float = 0.2,
+                 slow: float = 3,
+                 cooldown: float = 2,
+                 logger: logging.Logger | None = None):
+        """
+        AdaptiveRate Constructor
+
+        :param bucket: Controlled token bucket. Its current rate is the ceiling.
+        :param name: Name of the rate in logs and metrics
+        :param floor: Minimum rate (requests per second)
+        :param decrease: Factor to multiply the rate by on throttled or slow responses
+        :param increase: Rate increase in requests per second per second of good responses
+        :param slow: Responses slower than this many seconds count as throttled
+        :param cooldown: Minimum seconds between decreases, and before increasing again
+        :param logger: Logger
+        """
+
+        self.bucket: TokenBucket = bucket
+        self.name: str = name
+        self.ceiling: float = bucket.rate
+        self.floor: float = min(floor, self.ceiling)
+        self.decrease: float = decrease
+        self.increase: float = increase
+        self.slow: float = slow
+        self.cooldown: float = cooldown
+
+        if logger is not None:
+            self.logger: logging.Logger = logger
+        else:
+            self.logger = Logger('ratelimit', file_handler=True, stream_handler=True).get_logger()
+
+        rate_gauge.labels(bucket=self.name).set(self.rate)
+
+    @property
+    def rate(self) -> float:
+        """
+        :return: Effective rate (requests per second)
+        """
+
+        return self.bucket.rate
+
+    @staticmethod
+    def is_throttled(response) -> bool:
+        """
+        Check if a response means the server is throttling or blocking the requests
+
+        :param response: requests.Response (other results are never throttled)
+        :return: True if throttled
+        """
+
+        status = getattr(response, 'status_code', None)
+
+        if status == 429:
+            return True
+
+        # SEC answers undeclared or too fast automated tools with a 403 page
+        if status == 403:
+            return b'Undeclared Automated Tool' in (response.content or b'')
+
+        return False
+
+    def record(self, response, seconds: float) -> float:
+        """
+        Adjust the rate after a call
+
+        :param response: Call result (requests.Response)
+        :param seconds: Call duration
+        :return: Effective rate
+        """
+
+        now = get_clock(self.bucket.clock).time()
+        throttled = self.is_throttled(response) or seconds > self.slow
+        decreased = False
+
+        def _adjust(rate: float, last_decrease: float, updated: float) -> tuple[float, float]:
+            nonlocal decreased
+
+            if throttled:
+                if now - last_decrease >= self.cooldown:
+                    decreased = True
+                    return max(self.floor, rate * self.decrease), now
+
+            elif rate < self.ceiling and now - last_decrease >= self.cooldown:
+                return min(self.ceiling, rate + self.increase * min(now - updated, 1)), \
+                    last_decrease
+
+            return rate, last_decrease
+
+        # Adjusted under the bucket state lock (and file lock for shared buckets)
+        rate = self.bucket.adjust_rate(_adjust)
+
+        if decreased:
+            self.logger.warning('AdaptiveRate: %s throttled or slow (%.2fs). '
+                                'Decreasing rate to %.2f/s.', self.name, seconds, rate)
+
+        rate_gauge.labels(bucket=self.name).set(rate)
+
+        return rate
+
+
+# Shared token buckets by key (host)
+buckets: dict[str, TokenBucket] = {}
+_buckets_lock: threading.Lock = threading.Lock()
+
+
+def get_bucket(key: str,
+               rate: float = 10,
+               capacity: float = 1,
+               path: Path | None = None) -> TokenBucket:
+    """
+    Get the shared token bucket of a key. Created on first use.
+
+    :param key: Bucket key (see get_bucket_key())
+    :param rate: Tokens per second if the bucket is created
+    :param capacity: Bucket capacity if the bucket is created
+    :param path: Directory of SharedTokenBucket state files to share the bucket
+                 with other processes. None to share it only within this process.
+    :return: TokenBucket
+    """
+
+    with _buckets_lock:
+        if key not in buckets:
+            if path is not None:
+                buckets[key] = SharedTokenBucket(Path(path).joinpath(f'{key}.bucket'),
+                                                 rate=rate, capacity=capacity)
+            else:
+                buckets[key] = TokenBucket(rate=rate, capacity=capacity)
+
+        return buckets[key]
+
+
+def get_bucket_key(url: str) -> str:
+    """
+    Get the bucket key of a URL: its registrable domain.
+    www.sec.gov and efts.sec.gov share the 'sec.gov' bucket.
+
+    :param url: URL
+    :return: Bucket key
+    """
+
+    host = urlparse(url).hostname or url
+
+    try:
+        ip_address(host)
+        return host
+    except ValueError:
+        return '.'.join(host.split('.')[-2:])
 
 
 class RateLimitException(Exception):
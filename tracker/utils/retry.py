@@ -0,0 +1,208 @@
+"""
+Retry decorator for HTTP request functions and methods
+"""
+
+import inspect
+import logging
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import requests
+
+from common import Logger
+from tracker.utils.clock import Clock, get_clock
+
+
+# pylint: disable=too-few-public-methods
+# Decorator does not need many public methods
+class Retry:
+    """
+    Decorator for Retrying HTTP requests on transient errors.
+    Implements capped exponential backoff with full jitter and honors Retry-After.
+
+    Notes
+    -----
+    The decorated function must return a requests.Response.
+    Place it above RateLimit so that every retry takes a slot from the rate limit:
+        @Retry()
+        @RateLimit(limit=9, period=1)
+        def _send(...) -> requests.Response
+    """
+
+    # pylint: disable=too-many-arguments
+    # Many arguments are required for modularity
+    def __init__(self,
+                 retries: int = 4,
+                 statuses: tuple[int, ...] = (429, 500, 502, 503, 504),
+                 backoff: float = 0.5,
+                 max_backoff: float = 30,
+                 logger: logging.Logger | None = None,
+                 clock: Clock | None = None):
+        """
+        Retry decorator for HTTP request functions and methods
+
+        :param retries: Maximum number of retries after the first attempt
+        :param statuses: Response status codes to retry
+        :param backoff: Base backoff time in seconds. Doubles with each retry.
+        :param max_backoff: Maximum time in seconds to wait between attempts
+        :param logger: Logger
+        :param clock: Clock to sleep on between attempts. Defaults to get_clock().
+        """
+
+        self.retries: int = retries
+        self.statuses: tuple[int, ...] = statuses
+        self.backoff: float = backoff
+        self.max_backoff: float = max_backoff
+        self.clock: Clock | None = clock
+
+        if logger is not None:
+            self.logger: logging.Logger = logger
+        else:
+            self.logger = Logger('retry', file_handler=True, stream_handler=True).get_logger()
+
+    def __call__(self, func: callable) -> callable:
+        """
+        Decorator for functions, methods and coroutine functions
+
+        :param func: Function to be decorated
+        :return: Decorated function
+        """
+
+        def wrapper(*args, **kwargs) -> requests.Response:
+            """
+            Wrapper function for Retry decorator.
+
+            :param args: Arguments for the function
+            :param kwargs: Keyword arguments for the function
+            :return: Response of the last attempt
+            """
+
+            attempt: int = 0
+
+            while True:
+                try:
+                    response = func(*args, **kwargs)
+                except (requests.ConnectionError, requests.Timeout) as error:
+                    delay = self._get_retry_delay(func, attempt, error=error)
+                else:
+                    if (delay := self._get_retry_delay(func, attempt, response)) is None:
+                        return response
+
+                get_clock(self.clock).sleep(delay)
+                attempt += 1
+
+        async def async_wrapper(*args, **kwargs) -> requests.Response:
+            """
+            Wrapper coroutine for Retry decorator. Waits without blocking the event loop.
+
+            :param args: Arguments for the coroutine function
+            :param kwargs: Keyword arguments for the coroutine function
+            :return: Response of the last attempt
+            """
+
+            attempt: int = 0
+
+            while True:
+                try:
+                    response = await func(*args, **kwargs)
+                except (requests.ConnectionError, requests.Timeout) as error:
+                    delay = self._get_retry_delay(func, attempt, error=error)
+                else:
+                    if (delay := self._get_retry_delay(func, attempt, response)) is None:
+                        return response
+
+                await get_clock(self.clock).asleep(delay)
+                attempt += 1
+
+        return async_wrapper if inspect.iscoroutinefunction(func) else wrapper
+
+    def _get_retry_delay(self,
+                         func: callable,
+                         attempt: int,
+                         response: requests.Response | None = None,
+                         error: Exception | None = None) -> float | None:
+        """
+        Decide whether to retry a failed attempt
+
+        :param func: Decorated function
+        :param attempt: Number of the attempt (starting at 0)
+        :param response: Response of the attempt
+        :param error: Connection error or timeout raised by the attempt
+        :return: Delay in seconds before retrying. None to return the response.
+        """
+
+        # Retry connection errors and timeouts
+        if error is not None:
+            if attempt >= self.retries:
+                raise error
+
+            delay = self.get_delay(attempt)
+            self.logger.warning('Retry: %s calling %s. Retrying in %.2fs (%s/%s).',
+                                error.__class__.__name__, func.__qualname__,
+                                delay, attempt + 1, self.retries)
+
+            return delay
+
+        if response.status_code not in self.statuses or attempt >= self.retries:
+            return None
+
+        delay = self.get_delay(attempt, response)
+        self.logger.warning('Retry: %s - %s from %s. Retrying in %.2fs (%s/%s).',
+                            response.status_code, response.reason, response.url,
+                            delay, attempt + 1, self.retries)
+
+        # Release the connection back to the pool
+        response.close()
+
+        return delay
+
+    def get_delay(self, attempt: int, response: requests.Response | None = None) -> float:
+        """
+        Get the time to wait before the next attempt
+
+        :param attempt: Number of the failed attempt (starting at 0)
+        :param response: Failed response
+        :return: Delay in seconds
+
+        Notes
+        -----
+        Uses the Retry-After header if present. Otherwise, a random delay between
+        0 and min(max_backoff, backoff * 2^attempt) (full jitter).
+        """
+
+        if response is not None and (retry_after := get_retry_after(response)) is not None:
+            return min(retry_after, self.max_backoff)
+
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+
+def get_retry_after(response: requests.Response) -> float | None:
+    """
+    Get the Retry-After header in seconds
+
+    :param response: Response
+    :return: Seconds to wait or None if missing or invalid
+
+    Notes
+    -----
+    Retry-After is either a number of seconds or an HTTP-date.
+    """
+
+    retry_after = response.headers.get('Retry-After')
+
+    if retry_after is None:
+        return None
+
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+
+    try:
+        retry_dt = parsedate_to_datetime(retry_after)
+        if retry_dt.tzinfo is None:
+            retry_dt = retry_dt.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_dt - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None